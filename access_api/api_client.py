@@ -12,28 +12,139 @@ Usage:
     revenues = client.get_entity_revenues("016/020/32")
 """
 
-import requests
-from typing import Optional, Dict, Any, List
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
+from typing import Optional, Dict, Any, List, Callable, Iterable
+from urllib.parse import quote
 import os
 
 
 class FiscalDataClient:
     """Client for the Illinois Fiscal Data REST API."""
     
-    def __init__(self, base_url: Optional[str] = None, timeout: int = 30):
+    # Transient gateway errors retried for GET requests, with backoff
+    _RETRY_STATUSES = frozenset({502, 503, 504})
+    _RETRY_BACKOFF = 0.2
+    
+    # Endpoint path templates, filled with URL-quoted path segments
+    _ENDPOINTS = {
+        "health": "/api/v1/health",
+        "entity_search": "/api/v1/entities/search",
+        "entity_index": "/api/v1/entities/index",
+        "entity_compare": "/api/v1/entities/compare",
+        "entity_rank": "/api/v1/entities/rank",
+        "entity": "/api/v1/entities/{}",
+        "entity_revenues": "/api/v1/entities/{}/revenues",
+        "entity_expenditures": "/api/v1/entities/{}/expenditures",
+        "entity_debt": "/api/v1/entities/{}/debt",
+        "entity_pensions": "/api/v1/entities/{}/pensions",
+        "entity_bundle": "/api/v1/entities/{}/bundle",
+        "county_entities": "/api/v1/counties/{}/entities",
+        "county_summary": "/api/v1/counties/{}/summary",
+        "cache_invalidate": "/api/v1/cache/invalidate",
+    }
+    
+    @classmethod
+    def _endpoint(cls, name: str, segment: Optional[str] = None) -> str:
+        """
+        Build an endpoint path from its template.
+        
+        Path segments are quoted with no safe characters, so entity codes
+        like '016/020/32' are sent as a single '016%2F020%2F32' segment.
+        """
+        template = cls._ENDPOINTS[name]
+        if segment is None:
+            return template
+        return template.format(quote(segment, safe=''))
+    
+    @staticmethod
+    def _columnar(result: Dict[str, Any], rows_key: str) -> Dict[str, Any]:
+        """
+        Reshape a list-of-rows response into one list per column.
+        
+        The cached response is left as-is; a new dict is returned with
+        rows_key replaced by 'columns' (field -> values, in row order) and
+        'n', the row count. Error responses are returned unchanged.
+        """
+        if result.get("status") != "success":
+            return result
+        
+        rows = result.get(rows_key) or []
+        columnar = {k: v for k, v in result.items() if k != rows_key}
+        columnar["columns"] = {
+            field: [row.get(field) for row in rows] for field in (rows[0] if rows else ())
+        }
+        columnar["n"] = len(rows)
+        return columnar
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        pool_size: int = 32,
+        retries: int = 3,
+        cache_ttl: int = 900,
+        cache_size: int = 1024,
+        max_workers: int = 16
+    ):
         """
         Initialize the API client.
         
         Args:
             base_url: API base URL (default: from env or localhost:5000)
             timeout: Request timeout in seconds
+            pool_size: Max keep-alive connections held per host
+            retries: Retries for connection failures and 502/503/504 on GET
+            cache_ttl: Seconds a successful GET response stays cached
+            cache_size: Max number of cached GET responses
+            max_workers: Threads used by map() for parallel requests
         """
         self.base_url = base_url or os.environ.get(
             'FISCAL_API_URL', 
             'http://localhost:5000'
         )
+        self._url_prefix = self.base_url.rstrip('/')
         self.timeout = timeout
-        self._session = requests.Session()
+        self.retries = retries
+        
+        # HTTP/2 multiplexes concurrent tool calls over one connection when
+        # the API sits behind an h2-capable proxy; otherwise HTTP/1.1 with a
+        # large keep-alive pool. The transport retries failed connects.
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=retries,
+            limits=httpx.Limits(
+                max_keepalive_connections=pool_size,
+                max_connections=pool_size * 2
+            )
+        )
+        self._http = httpx.Client(
+            base_url=self._url_prefix,
+            transport=transport,
+            timeout=timeout,
+            headers={'Connection': 'keep-alive', 'Accept-Encoding': 'gzip'}
+        )
+        
+        # Fiscal data is static within a session, so successful GETs are
+        # cached in-process. TTLCache is not thread-safe on its own.
+        self._cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+        
+        # (ETag, response) by cache key, outliving the TTL so an expired
+        # entry is revalidated with If-None-Match instead of refetched
+        self._validators = LRUCache(maxsize=cache_size)
+        
+        # In-flight GETs by cache key, so concurrent identical requests
+        # share one HTTP round-trip (single-flight)
+        self._inflight: Dict[tuple, Future] = {}
+        
+        # Worker threads for overlapping independent requests (see map())
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
     
     def _make_request(
         self, 
@@ -43,7 +154,7 @@ class FiscalDataClient:
         json_data: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """
-        Make an HTTP request to the API.
+        Make an HTTP request to the API, serving GETs from the cache when possible.
         
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -54,38 +165,249 @@ class FiscalDataClient:
         Returns:
             API response as dictionary
         """
-        url = f"{self.base_url}{endpoint}"
+        if method != "GET":
+            return self._send(method, endpoint, params, json_data)
+        
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+            
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future = self._inflight[key] = Future()
+        
+        # Another thread is already fetching this key - wait for its result
+        if inflight is not None:
+            return inflight.result()
         
         try:
-            response = self._session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data,
-                timeout=self.timeout
-            )
+            result = self._send(method, endpoint, params, json_data, cache_key=key)
+        except BaseException as e:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        
+        with self._cache_lock:
+            if result.get("status") == "error":
+                self._cache.pop(key, None)
+            else:
+                self._cache[key] = result
+            self._inflight.pop(key, None)
+        future.set_result(result)
+        
+        return result
+    
+    def clear_cache(self):
+        """Drop all cached GET responses."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._validators.clear()
+    
+    def flush_cache(self) -> Dict[str, Any]:
+        """
+        Drop cached responses on both the API server and this client.
+        
+        Use after the underlying fiscal data has been refreshed.
+        
+        Returns:
+            API response with the number of server responses cleared
+        """
+        result = self._make_request("POST", self._endpoint("cache_invalidate"))
+        self.clear_cache()
+        return result
+    
+    def _send(
+        self, 
+        method: str, 
+        endpoint: str, 
+        params: Optional[Dict] = None,
+        json_data: Optional[Dict] = None,
+        cache_key: Optional[tuple] = None
+    ) -> Dict[str, Any]:
+        """
+        Send an HTTP request to the API.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            params: Query parameters
+            json_data: JSON body for POST requests
+            cache_key: Cache key of a GET, used for conditional requests
+            
+        Returns:
+            API response as dictionary
+        """
+        validator = None
+        headers = None
+        if cache_key is not None:
+            with self._cache_lock:
+                validator = self._validators.get(cache_key)
+            if validator is not None:
+                headers = {'If-None-Match': validator[0]}
+        
+        try:
+            for attempt in range(self.retries + 1):
+                response = self._http.request(
+                    method,
+                    endpoint,
+                    params=params,
+                    json=json_data,
+                    headers=headers
+                )
+                if (method != "GET"
+                        or response.status_code not in self._RETRY_STATUSES
+                        or attempt == self.retries):
+                    break
+                time.sleep(self._RETRY_BACKOFF * (2 ** attempt))
+            
+            # Not modified since the response we already hold
+            if response.status_code == 304 and validator is not None:
+                return validator[1]
+            
+            if response.status_code < 400:
+                result = orjson.loads(response.content)
+                etag = response.headers.get('ETag')
+                if cache_key is not None and etag:
+                    with self._cache_lock:
+                        self._validators[cache_key] = (etag, result)
+                return result
+            
+            # Error responses from the API carry a JSON error body - parse it once
+            try:
+                return orjson.loads(response.content)
+            except ValueError:
+                return {
+                    "status": "error",
+                    "error_message": f"HTTP {response.status_code}: {response.text[:500]}"
+                }
+            
+        except httpx.TimeoutException:
+            return {"status": "error", "error_message": "Request timed out"}
+        except httpx.ConnectError:
+            return {"status": "error", "error_message": f"Could not connect to API at {self.base_url}"}
+        except Exception as e:
+            return {"status": "error", "error_message": str(e)}
+    
+    # -------------------------------------------------------------------------
+    # PARALLEL HELPERS
+    # -------------------------------------------------------------------------
+    
+    def map(self, fn: Callable, items: Iterable) -> List[Any]:
+        """
+        Apply fn to each item on the client's thread pool.
+        
+        Lets tools overlap independent API calls over the pooled client,
+        e.g. client.map(client.get_entity_details, codes).
+        
+        Args:
+            fn: Callable taking one item
+            items: Items to process
+            
+        Returns:
+            List of results in the same order as items
+        """
+        return list(self._executor.map(fn, items))
+    
+    # -------------------------------------------------------------------------
+    # ASYNC BATCH FETCHING
+    # -------------------------------------------------------------------------
+    
+    def _async_client(self) -> httpx.AsyncClient:
+        """
+        Create an HTTP/2 async client for one batch of concurrent requests.
+        
+        A new client is created per batch because httpx async clients are
+        bound to the event loop they were first used on.
+        """
+        return httpx.AsyncClient(
+            base_url=self._url_prefix,
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            timeout=self.timeout
+        )
+    
+    async def aget(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Make an async GET request to the API.
+        
+        Args:
+            client: Async client from _async_client()
+            endpoint: API endpoint path
+            params: Query parameters
+            
+        Returns:
+            API response as dictionary
+        """
+        try:
+            response = await client.get(endpoint, params=params)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             return {"status": "error", "error_message": "Request timed out"}
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             return {"status": "error", "error_message": f"Could not connect to API at {self.base_url}"}
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             try:
-                return response.json()
-            except:
+                return orjson.loads(e.response.content)
+            except ValueError:
                 return {"status": "error", "error_message": str(e)}
         except Exception as e:
             return {"status": "error", "error_message": str(e)}
     
+    async def fetch_entity_bundle(self, entity_code: str) -> Dict[str, Any]:
+        """
+        Fetch details, revenues, expenditures, debt and pensions for an entity concurrently.
+        
+        Args:
+            entity_code: Entity code
+            
+        Returns:
+            dict with one API response per data set
+        """
+        async with self._async_client() as client:
+            entity, revenues, expenditures, debt, pensions = await asyncio.gather(
+                self.aget(client, self._endpoint("entity", entity_code)),
+                self.aget(client, self._endpoint("entity_revenues", entity_code)),
+                self.aget(client, self._endpoint("entity_expenditures", entity_code)),
+                self.aget(client, self._endpoint("entity_debt", entity_code)),
+                self.aget(client, self._endpoint("entity_pensions", entity_code)),
+            )
+        
+        return {
+            "status": "success",
+            "code": entity_code,
+            "entity": entity,
+            "revenues": revenues,
+            "expenditures": expenditures,
+            "debt": debt,
+            "pensions": pensions
+        }
+    
+    def fetch_entity_bundle_sync(self, entity_code: str) -> Dict[str, Any]:
+        """
+        Synchronous wrapper around fetch_entity_bundle.
+        
+        Must not be called from inside a running event loop; await
+        fetch_entity_bundle directly there instead.
+        """
+        return asyncio.run(self.fetch_entity_bundle(entity_code))
+    
     # -------------------------------------------------------------------------
     # HEALTH CHECK
     # -------------------------------------------------------------------------
     
     def health_check(self) -> Dict[str, Any]:
         """Check if the API is healthy."""
-        return self._make_request("GET", "/api/v1/health")
+        return self._make_request("GET", self._endpoint("health"))
     
     # -------------------------------------------------------------------------
     # ENTITY METHODS
@@ -94,7 +416,8 @@ class FiscalDataClient:
     def search_entities(
         self, 
         search_term: str, 
-        limit: int = 10
+        limit: int = 10,
+        match: str = "contains"
     ) -> Dict[str, Any]:
         """
         Search for government entities by name.
@@ -102,16 +425,28 @@ class FiscalDataClient:
         Args:
             search_term: Name or partial name to search for
             limit: Maximum number of results
+            match: 'contains' (default) or 'prefix' (faster, index-backed)
             
         Returns:
             dict with status and list of matching entities
         """
+        # Search is case-insensitive on every backend, so normalise the term
+        # and let differently-cased repeats share one cache entry
         return self._make_request(
             "GET", 
-            "/api/v1/entities/search",
-            params={"q": search_term, "limit": limit}
+            self._endpoint("entity_search"),
+            params={"q": search_term.strip().lower(), "limit": limit, "match": match}
         )
     
+    def get_entity_index(self) -> Dict[str, Any]:
+        """
+        Get the code, name, type and county of every entity.
+        
+        Returns:
+            dict with status and list of all entities, ordered by name
+        """
+        return self._make_request("GET", self._endpoint("entity_index"))
+    
     def get_entity_details(self, entity_code: str) -> Dict[str, Any]:
         """
         Get details for a specific entity.
@@ -122,7 +457,19 @@ class FiscalDataClient:
         Returns:
             dict with status and entity details
         """
-        return self._make_request("GET", f"/api/v1/entities/{entity_code}")
+        return self._make_request("GET", self._endpoint("entity", entity_code))
+    
+    def get_many_entity_details(self, entity_codes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get details for several entities in parallel.
+        
+        Args:
+            entity_codes: Entity codes to look up
+            
+        Returns:
+            List of entity detail responses, in the order of entity_codes
+        """
+        return self.map(self.get_entity_details, entity_codes)
     
     # -------------------------------------------------------------------------
     # FINANCIAL DATA METHODS
@@ -138,7 +485,7 @@ class FiscalDataClient:
         Returns:
             dict with revenue details by category
         """
-        return self._make_request("GET", f"/api/v1/entities/{entity_code}/revenues")
+        return self._make_request("GET", self._endpoint("entity_revenues", entity_code))
     
     def get_entity_expenditures(self, entity_code: str) -> Dict[str, Any]:
         """
@@ -150,7 +497,7 @@ class FiscalDataClient:
         Returns:
             dict with expenditure details by category
         """
-        return self._make_request("GET", f"/api/v1/entities/{entity_code}/expenditures")
+        return self._make_request("GET", self._endpoint("entity_expenditures", entity_code))
     
     def get_entity_debt(self, entity_code: str) -> Dict[str, Any]:
         """
@@ -162,7 +509,7 @@ class FiscalDataClient:
         Returns:
             dict with debt details
         """
-        return self._make_request("GET", f"/api/v1/entities/{entity_code}/debt")
+        return self._make_request("GET", self._endpoint("entity_debt", entity_code))
     
     def get_entity_pensions(self, entity_code: str) -> Dict[str, Any]:
         """
@@ -174,7 +521,34 @@ class FiscalDataClient:
         Returns:
             dict with pension system details
         """
-        return self._make_request("GET", f"/api/v1/entities/{entity_code}/pensions")
+        return self._make_request("GET", self._endpoint("entity_pensions", entity_code))
+    
+    def get_entity_bundle(self, entity_code: str) -> Dict[str, Any]:
+        """
+        Get details, revenues, expenditures, debt and pensions for an entity in one request.
+        
+        Args:
+            entity_code: Entity code
+            
+        Returns:
+            dict with entity, revenues, expenditures, debt and pensions responses
+        """
+        return self._make_request("GET", self._endpoint("entity_bundle", entity_code))
+    
+    def prefetch_entity_bundle(self, entity_code: str) -> Future:
+        """
+        Start fetching an entity's bundle in the background.
+        
+        The response lands in the cache; a get_entity_bundle call made while
+        the fetch is still running joins it instead of sending another request.
+        
+        Args:
+            entity_code: Entity code
+            
+        Returns:
+            Future resolving to the bundle response
+        """
+        return self._executor.submit(self.get_entity_bundle, entity_code)
     
     # -------------------------------------------------------------------------
     # GEOGRAPHIC METHODS
@@ -201,7 +575,7 @@ class FiscalDataClient:
             
         return self._make_request(
             "GET", 
-            f"/api/v1/counties/{county}/entities",
+            self._endpoint("county_entities", county),
             params=params if params else None
         )
     
@@ -215,7 +589,7 @@ class FiscalDataClient:
         Returns:
             dict with county statistics
         """
-        return self._make_request("GET", f"/api/v1/counties/{county}/summary")
+        return self._make_request("GET", self._endpoint("county_summary", county))
     
     # -------------------------------------------------------------------------
     # COMPARISON METHODS
@@ -229,14 +603,15 @@ class FiscalDataClient:
             entity_codes: List of entity codes to compare
             
         Returns:
-            dict with comparison data
+            dict with comparison data as one list per field under 'columns'
         """
         codes_str = ",".join(entity_codes)
-        return self._make_request(
+        result = self._make_request(
             "GET", 
-            "/api/v1/entities/compare",
+            self._endpoint("entity_compare"),
             params={"codes": codes_str}
         )
+        return self._columnar(result, "comparison")
     
     def rank_entities(
         self,
@@ -257,7 +632,7 @@ class FiscalDataClient:
             limit: Maximum results
             
         Returns:
-            dict with ranked entities
+            dict with ranked entities as one list per field under 'columns'
         """
         params = {
             "metric": metric,
@@ -269,19 +644,21 @@ class FiscalDataClient:
         if county:
             params["county"] = county
             
-        return self._make_request(
+        result = self._make_request(
             "GET", 
-            "/api/v1/entities/rank",
+            self._endpoint("entity_rank"),
             params=params
         )
+        return self._columnar(result, "rankings")
     
     # -------------------------------------------------------------------------
     # CONTEXT MANAGER SUPPORT
     # -------------------------------------------------------------------------
     
     def close(self):
-        """Close the HTTP session."""
-        self._session.close()
+        """Close the HTTP client and worker threads."""
+        self._executor.shutdown(wait=False)
+        self._http.close()
     
     def __enter__(self):
         return self
@@ -296,19 +673,22 @@ class FiscalDataClient:
 
 # Global client instance
 _default_client: Optional[FiscalDataClient] = None
+_default_client_lock = threading.Lock()
 
 
 def get_client() -> FiscalDataClient:
-    """Get or create the default API client."""
+    """Get or create the default API client, shared by all threads."""
     global _default_client
     if _default_client is None:
-        _default_client = FiscalDataClient()
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = FiscalDataClient()
     return _default_client
 
 
-def search_entities(search_term: str, limit: int = 10) -> Dict[str, Any]:
+def search_entities(search_term: str, limit: int = 10, match: str = "contains") -> Dict[str, Any]:
     """Search for entities using the default client."""
-    return get_client().search_entities(search_term, limit)
+    return get_client().search_entities(search_term, limit, match)
 
 
 def get_entity_details(entity_code: str) -> Dict[str, Any]:
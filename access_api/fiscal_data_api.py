@@ -10,9 +10,12 @@ PRIMARY DATA SOURCE: MS Access via ODBC
 FALLBACK: BigQuery (for cloud deployments)
 
 Usage:
-    python fiscal_data_api.py
+    python fiscal_data_api.py           # waitress with a thread pool
     
-    # Or with Flask CLI:
+    # Linux production deployments (gthread workers):
+    gunicorn -k gthread -w 4 --threads 8 -b 0.0.0.0:5000 fiscal_data_api:app
+    
+    # Or with Flask CLI (development only):
     flask --app fiscal_data_api run --host=0.0.0.0 --port=5000
 
 Prerequisites for MS Access:
@@ -21,14 +24,50 @@ Prerequisites for MS Access:
     3. Set ACCESS_DB_PATH environment variable to your .accdb file path
 """
 
-from flask import Flask, jsonify, request
-from functools import wraps
+from flask import Flask, request, has_request_context, copy_current_request_context, stream_with_context
+from flask_compress import Compress
+from functools import wraps, lru_cache
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
+import hashlib
 import os
+import re
+import signal
+import sqlite3
 import sys
-from typing import Optional, Dict, Any, List
+import queue
+import threading
+import orjson
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Iterator
 from datetime import datetime, date
 from decimal import Decimal
 
+# Database drivers are optional - only the one matching DATA_SOURCE is needed
+try:
+    import pyodbc
+except ImportError:
+    pyodbc = None
+
+try:
+    from google.cloud import bigquery
+except ImportError:
+    bigquery = None
+
+# Arrow transport for BigQuery results (optional; falls back to REST row pages)
+try:
+    import pyarrow
+    from google.cloud import bigquery_storage
+except ImportError:
+    pyarrow = None
+    bigquery_storage = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -44,38 +83,238 @@ DATA_SOURCE = os.environ.get('DATA_SOURCE', 'access')
 ACCESS_DRIVER = os.environ.get('ACCESS_DRIVER', '{Microsoft Access Driver (*.mdb, *.accdb)}')
 ACCESS_DB_PATH = os.environ.get('ACCESS_DB_PATH', r'C:\FiscalData\data2024.accdb')
 
+# Number of idle ODBC connections kept open for reuse across requests
+ACCESS_POOL_SIZE = int(os.environ.get('ACCESS_POOL_SIZE', '4'))
+
+# Rows pulled from the ODBC cursor per fetch
+ACCESS_FETCH_SIZE = 1000
+
+# Copy the Access tables into in-memory SQLite at startup and serve SELECTs
+# from that replica (the data file is static). Set ACCESS_REPLICA=0 to query
+# Access directly. Send SIGHUP to reload the replica where supported.
+ACCESS_REPLICA = os.environ.get('ACCESS_REPLICA', '1') == '1'
+
+# Add the search/sort indexes to the Access file on startup (writes to the file)
+ACCESS_CREATE_INDEXES = os.environ.get('ACCESS_CREATE_INDEXES', '0') == '1'
+
+# Server configuration
+API_PORT = int(os.environ.get('API_PORT', '5000'))
+API_THREADS = int(os.environ.get('API_THREADS', '8'))
+
+# Query result cache: Redis when QUERY_CACHE_REDIS_URL is set, else in-process
+QUERY_CACHE_REDIS_URL = os.environ.get('QUERY_CACHE_REDIS_URL')
+QUERY_CACHE_TTL = int(os.environ.get('QUERY_CACHE_TTL', '3600'))
+
+# Rendered responses of read-only endpoints, kept in-process
+RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', '600'))
+
+# Cache-Control max-age for those responses (AFR data is static per fiscal year)
+HTTP_CACHE_MAX_AGE = int(os.environ.get('HTTP_CACHE_MAX_AGE', '86400'))
+
 # BigQuery Configuration (FALLBACK)
 GCP_PROJECT_ID = os.environ.get('GOOGLE_CLOUD_PROJECT', 'project-zion-454116')
 BQ_DATASET = os.environ.get('BQ_DATASET', 'comp_financial_insights_2024')
 
+# Read county/rank data from the unit_with_stats materialized view
+# (il_fiscal_agent/sql/bigquery_setup.sql) instead of joining per request
+BQ_UNIT_WITH_STATS = os.environ.get('BQ_UNIT_WITH_STATS', '0') == '1'
+
 
 # =============================================================================
 # DATA TYPE SERIALIZATION HELPER
 # =============================================================================
 
+# Date and text columns repeat heavily across rows (fiscal year ends, codes),
+# so their conversions are memoized. Decimal -> float is cheaper than a
+# cache lookup and is left as a direct call.
+@lru_cache(maxsize=8192)
+def _decode_bytes(value) -> str:
+    return value.decode('utf-8', errors='ignore')
+
+
+def _decode_bytearray(value) -> str:
+    # bytearray is mutable and unhashable, so it can't share the cache
+    return value.decode('utf-8', errors='ignore')
+
+
+@lru_cache(maxsize=8192)
+def _isoformat(value) -> str:
+    return value.isoformat()
+
+
+def _identity(value):
+    return value
+
+
+# Column type -> converter, resolved once per query from cursor.description
+# so the per-row loop needs no isinstance dispatch. Unlisted types pass through.
+_COLUMN_CONVERTERS = {
+    Decimal: float,
+    datetime: _isoformat,
+    date: _isoformat,
+    bytes: _decode_bytes,
+    bytearray: _decode_bytearray,
+}
+
+# Exact value type -> serializer used by serialize_value
+_SERIALIZERS = {
+    **_COLUMN_CONVERTERS,
+    type(None): _identity,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+}
+
+
+def _serializer_for(value_type):
+    """Resolve (and memoize) the serializer for a type not in _SERIALIZERS."""
+    for base, serializer in _COLUMN_CONVERTERS.items():
+        if issubclass(value_type, base):
+            break
+    else:
+        serializer = _identity
+    _SERIALIZERS[value_type] = serializer
+    return serializer
+
+
 def serialize_value(value):
     """Convert database values to JSON-serializable types."""
-    if value is None:
-        return None
-    elif isinstance(value, Decimal):
-        return float(value)
-    elif isinstance(value, (datetime, date)):
-        return value.isoformat()
-    elif isinstance(value, bytes):
-        return value.decode('utf-8', errors='ignore')
-    else:
-        return value
+    value_type = type(value)
+    serializer = _SERIALIZERS.get(value_type) or _serializer_for(value_type)
+    return serializer(value)
 
 
 def serialize_row(row_dict: Dict) -> Dict:
     """Serialize all values in a row dictionary."""
-    return {key: serialize_value(value) for key, value in row_dict.items()}
+    serializers = _SERIALIZERS
+    return {
+        key: (serializers.get(type(value)) or _serializer_for(type(value)))(value)
+        for key, value in row_dict.items()
+    }
 
 
 # =============================================================================
 # DATA ACCESS LAYER - MS ACCESS PRIMARY
 # =============================================================================
 
+# Named query parameters (@name), rewritten to ODBC positional markers (?)
+_NAMED_PARAM_RE = re.compile(r'@(\w+)')
+
+# Access "SELECT TOP n" -> SQLite "SELECT ... LIMIT n" for the replica
+_TOP_RE = re.compile(r'^(\s*SELECT)\s+TOP\s+(\d+)\b', re.IGNORECASE)
+
+# Columns the endpoints filter, join and sort on, indexed in the replica
+# (UnitName and Pop let ORDER BY ... LIMIT walk the index instead of sorting)
+_REPLICA_INDEX_COLUMNS = ('Code', 'County', 'Description', 'UnitName', 'Pop')
+
+# Indexes created in the Access file itself when ACCESS_CREATE_INDEXES=1
+_ACCESS_INDEXES = (
+    ('ix_UnitData_UnitName', 'UnitData', 'UnitName'),
+    ('ix_UnitData_County', 'UnitData', 'County'),
+    ('ix_UnitStats_Pop', 'UnitStats', 'Pop'),
+)
+
+# Python column type (from cursor.description) -> SQLite column affinity
+_SQLITE_TYPES = {
+    int: 'INTEGER',
+    bool: 'INTEGER',
+    float: 'REAL',
+    Decimal: 'REAL',
+    # Jet compares text case-insensitively; NOCASE keeps that and lets
+    # SQLite use the indexes for LIKE 'prefix%'
+    str: 'TEXT COLLATE NOCASE',
+    datetime: 'TEXT',
+    date: 'TEXT',
+    bytes: 'TEXT',
+    bytearray: 'TEXT',
+}
+
+
+# Trigram tables built in the replica for substring search: name -> source column
+_TRIGRAM_TABLES = {
+    'unit_name_trigrams': 'UnitName',
+    'county_trigrams': 'County',
+}
+
+
+def trigrams(text: str) -> set:
+    """Return the distinct lower-cased 3-character substrings of text."""
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _access_to_sqlite(query: str) -> str:
+    """
+    Rewrite the Access SQL dialect used by the endpoints for SQLite.
+    
+    Only TOP needs rewriting: SQLite accepts [bracketed] names, % wildcards
+    and IIF() natively (IIF is registered as a function on older builds).
+    """
+    match = _TOP_RE.match(query)
+    if match is None:
+        return query
+    return f"{match.group(1)}{query[match.end():].rstrip().rstrip(';')}\nLIMIT {match.group(2)}"
+
+class QueryCache:
+    """
+    Read-through cache for SELECT results, keyed by SQL text and parameters.
+    
+    Uses Redis when QUERY_CACHE_REDIS_URL is configured so the cache is shared
+    across API workers; otherwise falls back to an in-process TTL cache.
+    Rows are stored as orjson bytes so callers never mutate a cached copy.
+    """
+    
+    def __init__(self, redis_url: Optional[str] = None, ttl: int = 3600):
+        self.ttl = ttl
+        self._redis = None
+        self._local = None
+        self._lock = threading.Lock()
+        
+        if redis_url and redis is not None:
+            self._redis = redis.Redis.from_url(redis_url)
+            print(f"[QueryCache] Using Redis at {redis_url}")
+        else:
+            if redis_url:
+                print(f"[QueryCache] redis package not installed, using in-process cache")
+            self._local = TTLCache(maxsize=10000, ttl=ttl)
+    
+    @staticmethod
+    def make_key(query: str, params: Optional[Dict]) -> str:
+        return "fiscal:" + hashlib.md5((query + repr(params)).encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[List[Dict]]:
+        try:
+            if self._redis is not None:
+                value = self._redis.get(key)
+            else:
+                with self._lock:
+                    value = self._local.get(key)
+        except Exception as e:
+            print(f"[QueryCache] Read failed: {e}")
+            return None
+        return orjson.loads(value) if value is not None else None
+    
+    def set(self, key: str, rows: List[Dict]):
+        value = orjson.dumps(rows)
+        try:
+            if self._redis is not None:
+                self._redis.setex(key, self.ttl, value)
+            else:
+                with self._lock:
+                    self._local[key] = value
+        except Exception as e:
+            print(f"[QueryCache] Write failed: {e}")
+    
+    def clear(self):
+        if self._redis is not None:
+            for key in self._redis.scan_iter("fiscal:*"):
+                self._redis.delete(key)
+        else:
+            with self._lock:
+                self._local.clear()
+
+
 class DataAccessLayer:
     """
     Abstract data access layer.
@@ -87,6 +326,11 @@ class DataAccessLayer:
     def __init__(self, source: str = 'access'):
         self.source = source
         self._client = None
+        self._pool = None
+        self._stmt_cache: Dict[str, Tuple[str, List[str]]] = {}
+        self._replica = None
+        self._replica_lock = threading.Lock()
+        self._cache = QueryCache(QUERY_CACHE_REDIS_URL, ttl=QUERY_CACHE_TTL)
         self._connection_tested = False
         
         print(f"[DataAccessLayer] Initializing with source: {source}")
@@ -124,26 +368,101 @@ class DataAccessLayer:
             'reporting': 'Reporting',
         }
         
+        # Pool of idle connections, reused across requests
+        self._pool = queue.Queue(maxsize=ACCESS_POOL_SIZE)
+        
         print(f"[MS Access] Connection string configured")
         print(f"[MS Access] Database path: {ACCESS_DB_PATH}")
         
         # Test the connection
         self._test_access_connection()
+        
+        if ACCESS_CREATE_INDEXES and self._connection_tested:
+            self.create_access_indexes()
+        
+        if ACCESS_REPLICA and self._connection_tested:
+            self._replica = self._build_replica()
+            if hasattr(signal, 'SIGHUP') and threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGHUP, lambda signum, frame: self.reload_replica())
+        
+        # Reads go to Access directly, so open the pool up front rather than
+        # paying the connection handshake on the first requests
+        if self._replica is None and self._connection_tested:
+            self._warm_pool()
+    
+    def _warm_pool(self):
+        """Fill the connection pool up to ACCESS_POOL_SIZE open connections."""
+        try:
+            while not self._pool.full():
+                self._pool.put_nowait(self._connect_access())
+        except (pyodbc.Error, queue.Full) as e:
+            print(f"[MS Access] Pool warm-up stopped early: {e}")
+        print(f"[MS Access] ✓ {self._pool.qsize()} pooled connections ready")
+    
+    def _connect_access(self):
+        """
+        Open a new MS Access ODBC connection.
+        
+        Encodings are set explicitly once per connection so pyodbc does not
+        renegotiate text decoding per row. There are no bulk insert paths; if
+        one is added, set cursor.fast_executemany = True before executemany().
+        """
+        cnxn = pyodbc.connect(self.conn_string, autocommit=True, timeout=5)
+        cnxn.setdecoding(pyodbc.SQL_CHAR, encoding='utf-8')
+        cnxn.setdecoding(pyodbc.SQL_WCHAR, encoding='utf-16le')
+        cnxn.setencoding(encoding='utf-16le')
+        return cnxn
+    
+    @contextmanager
+    def _acquire(self):
+        """
+        Borrow a pooled MS Access connection for the duration of a query.
+        
+        Opening an Access/Jet connection is expensive (file open, lock,
+        schema load), so connections are returned to the pool instead of
+        being closed. A connection that raised an ODBC error is discarded
+        so a stale handle is never handed out again.
+        """
+        try:
+            cnxn = self._pool.get_nowait()
+        except queue.Empty:
+            cnxn = self._connect_access()
+        
+        discard = False
+        try:
+            yield cnxn
+        except pyodbc.Error:
+            discard = True
+            raise
+        finally:
+            if discard:
+                cnxn.close()
+            else:
+                try:
+                    self._pool.put_nowait(cnxn)
+                except queue.Full:
+                    cnxn.close()
     
     def _test_access_connection(self):
         """Test the MS Access connection on startup."""
+        if pyodbc is None:
+            print(f"[MS Access] ✗ pyodbc is not installed. Run: pip install pyodbc")
+            self._connection_tested = False
+            return
+        
         try:
-            import pyodbc
-            cnxn = pyodbc.connect(self.conn_string, timeout=5)
-            cursor = cnxn.cursor()
+            pyodbc.pooling = True
             
-            # Test query - get table count
-            cursor.execute("SELECT COUNT(*) FROM UnitData")
-            count = cursor.fetchone()[0]
+            with self._acquire() as cnxn:
+                # Schema-only probe; a COUNT(*) scans the whole table on Jet
+                if cnxn.cursor().tables(table='UnitData', tableType='TABLE').fetchone() is None:
+                    raise RuntimeError("UnitData table not found")
             
-            cnxn.close()
             self._connection_tested = True
-            print(f"[MS Access] ✓ Connection successful! UnitData has {count:,} rows")
+            print(f"[MS Access] ✓ Connection successful!")
+            
+            # Report the row count without holding up startup
+            threading.Thread(target=self._log_row_count, daemon=True).start()
             
         except Exception as e:
             print(f"[MS Access] ✗ Connection FAILED: {e}")
@@ -153,10 +472,138 @@ class DataAccessLayer:
             print(f"  3. Python architecture matches driver (32-bit vs 64-bit)")
             self._connection_tested = False
     
+    def create_access_indexes(self):
+        """
+        Create the UnitName, County and Pop indexes in the Access file.
+        
+        Lets Jet answer search ORDER BY UnitName and rank ORDER BY Pop with
+        TOP n from the index instead of sorting every match. Indexes that
+        already exist are skipped.
+        """
+        with self._acquire() as cnxn:
+            cursor = cnxn.cursor()
+            existing = {
+                row.index_name
+                for table in {table for _, table, _ in _ACCESS_INDEXES}
+                for row in cursor.statistics(table)
+                if row.index_name
+            }
+            for name, table, column in _ACCESS_INDEXES:
+                if name in existing:
+                    continue
+                try:
+                    cursor.execute(f"CREATE INDEX {name} ON {table} ({column})")
+                    print(f"[MS Access] ✓ Created index {name}")
+                except pyodbc.Error as e:
+                    print(f"[MS Access] Could not create index {name}: {e}")
+    
+    def _log_row_count(self):
+        """Print the UnitData row count (run in a background thread)."""
+        rows = self.execute_query("SELECT COUNT(*) AS n FROM UnitData")
+        if rows and "error" not in rows[0]:
+            print(f"[MS Access] UnitData has {rows[0]['n']:,} rows")
+    
+    def _build_replica(self) -> Optional[sqlite3.Connection]:
+        """
+        Copy every Access table into a new in-memory SQLite database.
+        
+        Column types are reflected from the ODBC cursor description and
+        values go through the same converters as query results. Tables
+        that fail to load are skipped; returns None if nothing loaded.
+        """
+        replica = sqlite3.connect(':memory:', check_same_thread=False)
+        if sqlite3.sqlite_version_info < (3, 32, 0):
+            replica.create_function('IIF', 3, lambda cond, a, b: a if cond else b, deterministic=True)
+        
+        loaded = 0
+        with self._acquire() as cnxn:
+            for table in self.tables.values():
+                try:
+                    cursor = cnxn.cursor()
+                    cursor.execute(f"SELECT * FROM [{table}]")
+                    columns = [column[0] for column in cursor.description]
+                    converters = [_COLUMN_CONVERTERS.get(column[1]) for column in cursor.description]
+                    column_defs = ", ".join(
+                        f'"{column[0]}" {_SQLITE_TYPES.get(column[1], "")}'.rstrip()
+                        for column in cursor.description
+                    )
+                    
+                    replica.execute(f'CREATE TABLE "{table}" ({column_defs})')
+                    insert = f'INSERT INTO "{table}" VALUES ({", ".join("?" * len(columns))})'
+                    for batch in iter(lambda: cursor.fetchmany(ACCESS_FETCH_SIZE), []):
+                        replica.executemany(insert, [
+                            [value if value is None or conv is None else conv(value)
+                             for conv, value in zip(converters, row)]
+                            for row in batch
+                        ])
+                    
+                    for column in _REPLICA_INDEX_COLUMNS:
+                        if column in columns:
+                            replica.execute(f'CREATE INDEX "ix_{table}_{column}" ON "{table}" ("{column}")')
+                    loaded += 1
+                except (pyodbc.Error, sqlite3.Error) as e:
+                    print(f"[Replica] Skipping {table}: {e}")
+                    replica.execute(f'DROP TABLE IF EXISTS "{table}"')
+        
+        if not loaded:
+            replica.close()
+            return None
+        
+        if self.tables['unit_data'] in {row[0] for row in replica.execute("SELECT name FROM sqlite_master")}:
+            self._build_trigram_index(replica)
+        replica.commit()
+        
+        print(f"[Replica] ✓ Loaded {loaded} of {len(self.tables)} Access tables into SQLite")
+        return replica
+    
+    def _build_trigram_index(self, replica: sqlite3.Connection):
+        """
+        Index the UnitName and County trigrams of every unit in the replica.
+        
+        search_entities looks up the search term's trigrams here to find
+        candidate codes, then rechecks them with LIKE, instead of scanning
+        UnitData with '%term%'.
+        """
+        unit_data = self.tables['unit_data']
+        for table, column in _TRIGRAM_TABLES.items():
+            replica.execute(
+                f'CREATE TABLE "{table}" (tg TEXT NOT NULL, code TEXT NOT NULL, '
+                f'PRIMARY KEY (tg, code)) WITHOUT ROWID'
+            )
+            replica.executemany(
+                f'INSERT INTO "{table}" VALUES (?, ?)',
+                (
+                    (tg, code)
+                    for code, value in replica.execute(f'SELECT Code, "{column}" FROM "{unit_data}"')
+                    if code is not None and value is not None
+                    for tg in trigrams(str(value))
+                )
+            )
+        print(f"[Replica] ✓ Built trigram search index")
+    
+    @property
+    def has_trigram_index(self) -> bool:
+        """True when search can use the replica's trigram tables."""
+        return self._replica is not None and self.source == 'access'
+    
+    def reload_replica(self):
+        """Rebuild the SQLite replica from Access and drop cached results."""
+        print(f"[Replica] Reloading from {ACCESS_DB_PATH}")
+        replica = self._build_replica()
+        with self._replica_lock:
+            old, self._replica = self._replica, replica
+        if old is not None:
+            old.close()
+        self._cache.clear()
+    
     def _init_bigquery(self):
         """Initialize BigQuery client."""
-        from google.cloud import bigquery
-        self._client = bigquery.Client(project=GCP_PROJECT_ID)
+        if bigquery is None:
+            raise ImportError("google-cloud-bigquery is required for the BigQuery data source")
+        self._client = bigquery.Client(project=GCP_PROJECT_ID, _http=self._bigquery_session())
+        
+        # Storage Read API client for streaming results as Arrow record batches
+        self._bqstorage = bigquery_storage.BigQueryReadClient() if bigquery_storage is not None else None
         
         # Table names for BigQuery (with full project.dataset.table format)
         self.tables = {
@@ -169,14 +616,73 @@ class DataAccessLayer:
             'pensions': f"{GCP_PROJECT_ID}.{BQ_DATASET}.Pensions",
         }
         
+        # Source of the unit + stats columns used by the county and rank
+        # endpoints, aliased as u: the materialized view, or the same join inline
+        if BQ_UNIT_WITH_STATS:
+            self.tables['unit_with_stats'] = f"{GCP_PROJECT_ID}.{BQ_DATASET}.unit_with_stats"
+            self.units_source = f"`{self.tables['unit_with_stats']}` u"
+        else:
+            self.units_source = f"""(
+            SELECT ud.Code, ud.UnitName, ud.Description, ud.County,
+                   us.Pop, us.EAV, us.FULL_EMP, us.PART_EMP
+            FROM `{self.tables['unit_data']}` ud
+            LEFT JOIN `{self.tables['unit_stats']}` us ON ud.Code = us.Code
+        ) u"""
+        
         print(f"[BigQuery] Client initialized for project: {GCP_PROJECT_ID}")
     
+    @staticmethod
+    def _bigquery_session():
+        """
+        Build one authorized HTTP session for the BigQuery client to share.
+        
+        The default adapter keeps only 10 connections per host, so
+        concurrent request threads would queue or reconnect. Size the pool
+        to the server thread count instead. Returns None (client default)
+        if google-auth cannot be set up.
+        """
+        try:
+            import google.auth
+            import requests
+            from google.auth.transport.requests import AuthorizedSession
+            
+            credentials, _ = google.auth.default(
+                scopes=["https://www.googleapis.com/auth/cloud-platform"]
+            )
+            session = AuthorizedSession(credentials)
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=API_THREADS * 2)
+            session.mount("https://", adapter)
+            return session
+        except Exception as e:
+            print(f"[BigQuery] Using default HTTP session: {e}")
+            return None
+    
     def execute_query(self, query: str, params: Optional[Dict] = None) -> List[Dict]:
-        """Execute query and return results as list of dictionaries."""
+        """
+        Execute query and return results as list of dictionaries.
+        
+        SELECT results are served from the query cache when present.
+        Pass ?nocache=1 on the API request to bypass the cache.
+        """
+        cacheable = query.lstrip().upper().startswith('SELECT') and not (
+            has_request_context() and request.args.get('nocache') == '1'
+        )
+        
+        if cacheable:
+            key = QueryCache.make_key(query, params)
+            rows = self._cache.get(key)
+            if rows is not None:
+                return rows
+        
         if self.source == 'access':
-            return self._execute_access(query, params)
+            rows = self._execute_access(query, params)
         else:
-            return self._execute_bigquery(query, params)
+            rows = self._execute_bigquery(query, params)
+        
+        if cacheable and not (rows and "error" in rows[0]):
+            self._cache.set(key, rows)
+        
+        return rows
     
     def _execute_access(self, query: str, params: Optional[Dict] = None) -> List[Dict]:
         """
@@ -189,44 +695,42 @@ class DataAccessLayer:
         - Use * for wildcard instead of %
         - Use ? for parameters instead of @name
         """
-        import pyodbc
+        if self._replica is not None and query.lstrip().upper().startswith('SELECT'):
+            return self._execute_replica(query, params)
+        
+        if pyodbc is None:
+            return [{"error": "pyodbc is not installed. Run: pip install pyodbc"}]
         
         try:
-            # Open connection
-            cnxn = pyodbc.connect(self.conn_string)
-            cursor = cnxn.cursor()
-            
-            # Handle parameterized queries
-            if params:
-                # Convert named params (@name) to positional (?)
-                param_values = []
-                for key, value in params.items():
-                    if f"@{key}" in query:
-                        query = query.replace(f"@{key}", "?")
-                        param_values.append(value)
+            with self._acquire() as cnxn:
+                cursor = cnxn.cursor()
                 
-                cursor.execute(query, param_values)
-            else:
-                cursor.execute(query)
-            
-            # Check if query returns results (SELECT) or not (INSERT/UPDATE/DELETE)
-            if cursor.description is None:
-                cnxn.commit()
-                cnxn.close()
-                return [{"affected_rows": cursor.rowcount}]
-            
-            # Get column names
-            columns = [column[0] for column in cursor.description]
-            
-            # Fetch all rows and convert to list of dicts
-            rows = []
-            for row in cursor.fetchall():
-                row_dict = dict(zip(columns, row))
-                # Serialize values for JSON compatibility
-                rows.append(serialize_row(row_dict))
-            
-            cnxn.close()
-            return rows
+                # Handle parameterized queries
+                if params:
+                    sql, param_names = self._prepare_access(query)
+                    cursor.execute(sql, [params[name] for name in param_names])
+                else:
+                    cursor.execute(query)
+                
+                # Check if query returns results (SELECT) or not (INSERT/UPDATE/DELETE)
+                # Connections are opened with autocommit, so no explicit commit
+                if cursor.description is None:
+                    return [{"affected_rows": cursor.rowcount}]
+                
+                # Get column names and JSON converters from the column types
+                columns = [column[0] for column in cursor.description]
+                converters = [_COLUMN_CONVERTERS.get(column[1]) for column in cursor.description]
+                
+                # Fetch rows in batches and serialize each value for JSON compatibility
+                rows = []
+                for batch in iter(lambda: cursor.fetchmany(ACCESS_FETCH_SIZE), []):
+                    for row in batch:
+                        rows.append({
+                            col: value if value is None or conv is None else conv(value)
+                            for col, conv, value in zip(columns, converters, row)
+                        })
+                
+                return rows
             
         except pyodbc.Error as e:
             error_msg = str(e)
@@ -237,20 +741,91 @@ class DataAccessLayer:
             print(f"[MS Access] Unexpected error: {e}")
             return [{"error": str(e)}]
     
-    def _execute_bigquery(self, query: str, params: Optional[Dict] = None) -> List[Dict]:
-        """Execute BigQuery query."""
-        from google.cloud import bigquery
+    def _execute_replica(self, query: str, params: Optional[Dict] = None) -> List[Dict]:
+        """
+        Execute a read-only Access query against the in-memory SQLite replica.
         
-        job_config = bigquery.QueryJobConfig()
+        Values were converted to JSON types when the replica was loaded, so
+        rows are returned as-is.
+        """
         if params:
-            job_config.query_parameters = [
-                bigquery.ScalarQueryParameter(name, "STRING", value)
-                for name, value in params.items()
-            ]
+            sql, param_names = self._prepare_access(query)
+            values = [params[name] for name in param_names]
+        else:
+            sql, values = query, []
         
         try:
-            results = self._client.query(query, job_config=job_config).result()
-            return [serialize_row(dict(row.items())) for row in results]
+            with self._replica_lock:
+                cursor = self._replica.execute(_access_to_sqlite(sql), values)
+                columns = [column[0] for column in cursor.description]
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"[Replica] Query error: {e}")
+            print(f"[Replica] Query was: {query[:200]}...")
+            return [{"error": f"Database error: {e}"}]
+    
+    def _prepare_access(self, query: str) -> Tuple[str, List[str]]:
+        """
+        Convert named params (@name) to positional (?) once per query template.
+        
+        Returns the rewritten SQL and the parameter names in positional order.
+        Endpoints reuse the same template with different values, so the
+        rewrite is cached and the identical SQL text lets the ODBC driver
+        reuse its prepared statement.
+        """
+        prepared = self._stmt_cache.get(query)
+        if prepared is None:
+            param_names = _NAMED_PARAM_RE.findall(query)
+            prepared = (_NAMED_PARAM_RE.sub("?", query), param_names)
+            self._stmt_cache[query] = prepared
+        return prepared
+    
+    def _run_bigquery(self, query: str, query_parameters: Optional[List] = None):
+        """Start a BigQuery job with the given query parameters and wait for it."""
+        job_config = bigquery.QueryJobConfig(query_parameters=query_parameters or [])
+        return self._client.query(query, job_config=job_config).result()
+    
+    def query_bigquery(self, query: str, query_parameters: Optional[List] = None) -> List[Dict]:
+        """
+        Run a BigQuery query and return serialized rows.
+        
+        Results are downloaded as Arrow (over the Storage Read API when
+        available) and converted to Python in C via to_pylist(), instead
+        of paging JSON rows through REST. Errors propagate to the caller.
+        
+        Args:
+            query: SQL with @name placeholders
+            query_parameters: bigquery.ScalarQueryParameter/ArrayQueryParameter list
+        """
+        rows = self._run_bigquery(query, query_parameters)
+        if pyarrow is None:
+            return [serialize_row(dict(row)) for row in rows]
+        table = rows.to_arrow(bqstorage_client=self._bqstorage)
+        return [serialize_row(row) for row in table.to_pylist()]
+    
+    def iter_bigquery(self, query: str, query_parameters: Optional[List] = None) -> Iterator[Dict]:
+        """
+        Run a BigQuery query and lazily yield serialized rows.
+        
+        The query runs (and raises) before this returns; rows are then
+        pulled one Arrow batch or REST page at a time, so a large result
+        never has to be held in memory in full.
+        """
+        rows = self._run_bigquery(query, query_parameters)
+        if pyarrow is None:
+            return (serialize_row(dict(row)) for row in rows)
+        batches = rows.to_arrow_iterable(bqstorage_client=self._bqstorage)
+        return (serialize_row(row) for batch in batches for row in batch.to_pylist())
+    
+    def _execute_bigquery(self, query: str, params: Optional[Dict] = None) -> List[Dict]:
+        """Execute BigQuery query."""
+        query_parameters = [
+            bigquery.ScalarQueryParameter(name, "STRING", value)
+            for name, value in (params or {}).items()
+        ]
+        
+        try:
+            return self.query_bigquery(query, query_parameters)
         except Exception as e:
             print(f"[BigQuery] Query error: {e}")
             return [{"error": str(e)}]
@@ -275,6 +850,73 @@ print("=" * 60)
 
 app = Flask(__name__)
 
+# Compress JSON responses (Brotli when the client accepts it, else gzip);
+# county listings and comparisons compress well.
+# Flask-Compress also sets Vary: Accept-Encoding.
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 512
+Compress(app)
+
+
+def _code_params(code: str) -> List:
+    """BigQuery parameters for the single @code shared by the entity endpoints."""
+    return [bigquery.ScalarQueryParameter("code", "STRING", code)]
+
+
+def _json_default(value):
+    """Serialize types orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', errors='ignore')
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+# Non-string keys (e.g. int ranks) are allowed just as with json.dumps
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def fast_jsonify(obj):
+    """Drop-in replacement for flask.jsonify backed by orjson."""
+    return app.response_class(
+        orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS),
+        mimetype='application/json'
+    )
+
+
+# Rows encoded per chunk of a streamed response
+STREAM_CHUNK_ROWS = 500
+
+
+def stream_jsonify(envelope: Dict[str, Any], key: str, rows: Iterable[Dict]):
+    """
+    Stream a JSON object: envelope's fields, rows as an array under key, then count.
+    
+    Rows are encoded in chunks as they arrive, so the full result set and
+    its JSON encoding never sit in memory together.
+    """
+    def generate():
+        head = orjson.dumps(envelope, default=_json_default, option=_ORJSON_OPTIONS)
+        yield head[:-1] + (b',"' if envelope else b'"') + key.encode() + b'":['
+        
+        count, chunk = 0, []
+        for row in rows:
+            chunk.append(orjson.dumps(row, default=_json_default, option=_ORJSON_OPTIONS))
+            if len(chunk) == STREAM_CHUNK_ROWS:
+                yield (b',' if count else b'') + b','.join(chunk)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            yield (b',' if count else b'') + b','.join(chunk)
+            count += len(chunk)
+        
+        yield b'],"count":' + str(count).encode() + b'}'
+    
+    return app.response_class(stream_with_context(generate()), mimetype='application/json')
+
 
 def handle_errors(f):
     """Decorator to handle errors consistently."""
@@ -284,7 +926,65 @@ def handle_errors(f):
             return f(*args, **kwargs)
         except Exception as e:
             print(f"[API Error] {e}")
-            return jsonify({"status": "error", "error_message": str(e)}), 500
+            return fast_jsonify({"status": "error", "error_message": str(e)}), 500
+    return decorated
+
+
+# Rendered JSON bodies and their ETags keyed by (path, query args)
+_response_cache = TTLCache(maxsize=4096, ttl=RESPONSE_CACHE_TTL)
+_response_cache_lock = threading.Lock()
+
+
+def _conditional_response(body: bytes, etag: str):
+    """
+    Build a cacheable JSON response, or a 304 if the client already has it.
+    
+    Flask-Compress may suffix the ETag with the encoding (e.g. "abc:br"),
+    so If-None-Match is checked for the digest rather than an exact tag.
+    """
+    if etag in request.headers.get('If-None-Match', ''):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = HTTP_CACHE_MAX_AGE
+    return response
+
+
+def cached_response(f):
+    """
+    Decorator to cache successful responses of a read-only endpoint.
+    
+    Keyed by request path and query args, so the same lookup from a
+    dashboard reload or a repeated agent call skips the DAL entirely.
+    Successful responses carry an ETag and Cache-Control so clients can
+    revalidate with If-None-Match and get a bodiless 304.
+    Pass ?nocache=1 to bypass; POST /api/v1/cache/invalidate to clear.
+    """
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        if request.args.get('nocache') == '1':
+            return f(*args, **kwargs)
+        
+        key = (request.path, tuple(sorted(request.args.items(multi=True))))
+        with _response_cache_lock:
+            cached = _response_cache.get(key)
+        if cached is not None:
+            return _conditional_response(*cached)
+        
+        response = app.make_response(f(*args, **kwargs))
+        if response.status_code != 200:
+            return response
+        
+        body = response.get_data()
+        # Never keep an error body, even one an endpoint sent with a 200
+        if orjson.loads(body).get("status") != "success":
+            return response
+        etag = hashlib.md5(body).hexdigest()
+        with _response_cache_lock:
+            _response_cache[key] = (body, etag)
+        return _conditional_response(body, etag)
     return decorated
 
 
@@ -295,20 +995,21 @@ def handle_errors(f):
 @app.route('/api/v1/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
+    return fast_jsonify({
         "status": "healthy",
         "data_source": DATA_SOURCE,
         "database_path": ACCESS_DB_PATH if DATA_SOURCE == 'access' else f"{GCP_PROJECT_ID}.{BQ_DATASET}",
         "connection_tested": dal._connection_tested if DATA_SOURCE == 'access' else True,
         "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now()
     })
 
 
 @app.route('/api/v1/tables', methods=['GET'])
+@cached_response
 def list_tables():
     """List available tables."""
-    return jsonify({
+    return fast_jsonify({
         "status": "success",
         "data_source": DATA_SOURCE,
         "tables": list(dal.tables.keys())
@@ -328,20 +1029,64 @@ def search_entities():
     Query params:
         q: Search term (required)
         limit: Max results (default: 10)
+        match: 'contains' (default) or 'prefix'. Prefix matches are
+               answered from the UnitName/County indexes; contains
+               matches need the trigram index or a scan and are slower.
     
     Example:
         GET /api/v1/entities/search?q=Skokie&limit=5
+        GET /api/v1/entities/search?q=Skok&match=prefix
     """
     search_term = request.args.get('q', '')
     limit = request.args.get('limit', 10, type=int)
+    match = request.args.get('match', 'contains').lower()
     
     if not search_term or len(search_term) < 2:
-        return jsonify({
+        return fast_jsonify({
             "status": "error",
             "error_message": "Please provide at least 2 characters to search."
         }), 400
     
-    if dal.source == 'access':
+    if match not in ('contains', 'prefix'):
+        return fast_jsonify({
+            "status": "error",
+            "error_message": f"Unknown match mode: {match}. Use 'contains' or 'prefix'."
+        }), 400
+    
+    # Prefix patterns are sargable, so they skip the trigram lookup
+    search_pattern = f"{search_term}%" if match == 'prefix' else f"%{search_term}%"
+    
+    # LIKE wildcards in the term can't be matched against literal trigrams
+    if match == 'prefix' or any(c in search_term for c in '%_['):
+        search_grams = []
+    else:
+        search_grams = sorted(trigrams(search_term))
+    
+    if dal.has_trigram_index and search_grams:
+        # Replica: trigram lookup narrows to candidate codes, LIKE rechecks them.
+        # Terms under 3 characters have no trigrams and use the LIKE scan below.
+        params = {f"tg{i}": tg for i, tg in enumerate(search_grams)}
+        params["search_pattern"] = search_pattern
+        tg_list = ", ".join(f"@tg{i}" for i in range(len(search_grams)))
+        candidates = " UNION ".join(
+            f"SELECT code FROM {table} WHERE tg IN ({tg_list}) "
+            f"GROUP BY code HAVING COUNT(*) = {len(search_grams)}"
+            for table in _TRIGRAM_TABLES
+        )
+        query = f"""
+        SELECT TOP {limit}
+            Code,
+            UnitName,
+            Description AS EntityType,
+            County
+        FROM {dal.tables['unit_data']}
+        WHERE 
+            Code IN ({candidates})
+            AND (UnitName LIKE @search_pattern OR County LIKE @search_pattern)
+        ORDER BY UnitName
+        """
+        entities = dal.execute_query(query, params)
+    elif dal.source == 'access':
         # MS Access SQL syntax
         # Use LIKE with * wildcard (Access-style) or % (ANSI-style depending on mode)
         query = f"""
@@ -352,15 +1097,13 @@ def search_entities():
             County
         FROM {dal.tables['unit_data']}
         WHERE 
-            UnitName LIKE '%{search_term}%'
-            OR County LIKE '%{search_term}%'
+            UnitName LIKE @search_pattern
+            OR County LIKE @search_pattern
         ORDER BY UnitName
         """
-        entities = dal.execute_query(query)
+        entities = dal.execute_query(query, {"search_pattern": search_pattern})
     else:
         # BigQuery SQL syntax
-        from google.cloud import bigquery
-        
         query = f"""
         SELECT 
             Code,
@@ -375,43 +1118,32 @@ def search_entities():
         LIMIT {limit}
         """
         
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("search_pattern", "STRING", f"%{search_term}%"),
-            ]
-        )
-        results = dal._client.query(query, job_config=job_config).result()
-        entities = [serialize_row(dict(row.items())) for row in results]
+        entities = dal.query_bigquery(query, [
+            bigquery.ScalarQueryParameter("search_pattern", "STRING", search_pattern),
+        ])
     
     # Check for errors
     if entities and "error" in entities[0]:
-        return jsonify({
+        return fast_jsonify({
             "status": "error",
             "error_message": entities[0]["error"]
         }), 500
     
     if not entities:
-        return jsonify({
+        return fast_jsonify({
             "status": "not_found",
             "message": f"No entities found matching '{search_term}'"
         })
     
-    return jsonify({
+    return fast_jsonify({
         "status": "success",
         "count": len(entities),
         "entities": entities
     })
 
 
-@app.route('/api/v1/entities/<path:code>', methods=['GET'])
-@handle_errors
-def get_entity(code: str):
-    """
-    Get details for a specific entity by code.
-    
-    Example:
-        GET /api/v1/entities/016/020/32
-    """
+def _entity_payload(code: str) -> Tuple[Dict[str, Any], int]:
+    """Build the entity details response payload and HTTP status for an entity."""
     if dal.source == 'access':
         # MS Access query
         query = f"""
@@ -435,13 +1167,11 @@ def get_entity(code: str):
             us.BondedDebt AS HasBondedDebt
         FROM {dal.tables['unit_data']} AS ud
         LEFT JOIN {dal.tables['unit_stats']} AS us ON ud.Code = us.Code
-        WHERE ud.Code = '{code}'
+        WHERE ud.Code = @code
         """
-        results = dal.execute_query(query)
+        results = dal.execute_query(query, {"code": code})
     else:
         # BigQuery query
-        from google.cloud import bigquery
-        
         query = f"""
         SELECT 
             ud.Code,
@@ -463,40 +1193,124 @@ def get_entity(code: str):
         LIMIT 1
         """
         
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("code", "STRING", code),
-            ]
-        )
-        results = list(dal._client.query(query, job_config=job_config).result())
-        results = [serialize_row(dict(row.items())) for row in results]
+        results = dal.query_bigquery(query, _code_params(code))
     
     if not results or (results and "error" in results[0]):
         error_msg = results[0].get("error") if results else "Not found"
-        return jsonify({
+        return {
             "status": "error",
             "error_message": f"Entity with code '{code}' not found. {error_msg}"
-        }), 404
+        }, 404
     
-    return jsonify({
+    return {
         "status": "success",
         "entity": results[0]
-    })
+    }, 200
 
 
-# -----------------------------------------------------------------------------
-# FINANCIAL DATA ENDPOINTS
-# -----------------------------------------------------------------------------
+@app.route('/api/v1/entities/index', methods=['GET'])
+@handle_errors
+@cached_response
+def get_entity_index():
+    """
+    List every entity's code, name, type and county for client-side search.
+    
+    Example:
+        GET /api/v1/entities/index
+    """
+    if dal.source == 'access':
+        query = f"""
+        SELECT Code, UnitName, Description AS EntityType, County
+        FROM {dal.tables['unit_data']}
+        ORDER BY UnitName
+        """
+        entities = dal.execute_query(query)
+    else:
+        query = f"""
+        SELECT Code, UnitName, Description as EntityType, County
+        FROM `{dal.tables['unit_data']}`
+        ORDER BY UnitName
+        """
+        entities = dal.query_bigquery(query)
+    
+    if entities and "error" in entities[0]:
+        return fast_jsonify({
+            "status": "error",
+            "error_message": entities[0]["error"]
+        }), 500
+    
+    return fast_jsonify({
+        "status": "success",
+        "count": len(entities),
+        "entities": entities
+    })
 
-@app.route('/api/v1/entities/<path:code>/revenues', methods=['GET'])
+
+@app.route('/api/v1/entities/<path:code>', methods=['GET'])
 @handle_errors
-def get_entity_revenues(code: str):
+@cached_response
+def get_entity(code: str):
     """
-    Get revenue breakdown for an entity.
+    Get details for a specific entity by code.
     
     Example:
-        GET /api/v1/entities/016/020/32/revenues
+        GET /api/v1/entities/016/020/32
     """
+    payload, status = _entity_payload(code)
+    return fast_jsonify(payload), status
+
+
+# -----------------------------------------------------------------------------
+# FINANCIAL DATA ENDPOINTS
+# -----------------------------------------------------------------------------
+
+REVENUE_CATEGORY_NAMES = MappingProxyType({
+    "201t": "Property Taxes",
+    "202t": "Personal Property Replacement Tax",
+    "203t": "Sales Tax",
+    "204t": "Other Taxes",
+    "205t": "Special Assessments",
+    "211t": "Licenses and Permits",
+    "212t": "Fines and Forfeitures",
+    "213t": "Interest Earnings",
+    "214t": "Rental Income",
+    "215t": "Intergovernmental Revenue",
+    "225t": "Charges for Services",
+    "226t": "Contributions and Donations",
+    "231t": "Bond/Loan Proceeds",
+    "233t": "Interfund Transfers In",
+    "234t": "Other Revenue",
+})
+
+EXPENDITURE_CATEGORY_NAMES = MappingProxyType({
+    "251t": "General Government",
+    "252t": "Public Safety",
+    "253t": "Highways and Streets",
+    "254t": "Sanitation",
+    "255t": "Health and Welfare",
+    "256t": "Culture and Recreation",
+    "257t": "Conservation and Development",
+    "258t": "Education",
+    "259t": "Other Expenditures",
+    "260t": "Capital Outlay",
+    "271t": "Debt Service - Principal",
+    "272t": "Debt Service - Interest",
+    "275t": "Interfund Transfers Out",
+})
+
+
+def _label_categories(rows: List[Dict], category_names) -> float:
+    """Add CategoryName to each row in place and return the sum of row Totals."""
+    total = 0
+    for row in rows:
+        total += row['Total']
+        cat = row.get('Category', '')
+        row['CategoryName'] = category_names.get(cat, cat)
+    return total
+
+
+def _revenues_payload(code: str) -> Tuple[Dict[str, Any], int]:
+    """Build the revenues response payload and HTTP status for an entity."""
     if dal.source == 'access':
         # MS Access - use IIF for null handling
         query = f"""
@@ -508,16 +1322,17 @@ def get_entity_revenues(code: str):
             IIF(DS IS NULL, 0, DS) AS DebtService,
             IIF(EP IS NULL, 0, EP) AS Enterprise,
             IIF(TS IS NULL, 0, TS) AS Trust,
-            IIF(FD IS NULL, 0, FD) AS Fiduciary
+            IIF(FD IS NULL, 0, FD) AS Fiduciary,
+            IIF(GN IS NULL, 0, GN) + IIF(SR IS NULL, 0, SR) + IIF(CP IS NULL, 0, CP) +
+            IIF(DS IS NULL, 0, DS) + IIF(EP IS NULL, 0, EP) + IIF(TS IS NULL, 0, TS) +
+            IIF(FD IS NULL, 0, FD) AS Total
         FROM {dal.tables['revenues']}
-        WHERE Code = '{code}'
+        WHERE Code = @code
         ORDER BY Category
         """
-        revenues = dal.execute_query(query)
+        revenues = dal.execute_query(query, {"code": code})
     else:
         # BigQuery - use COALESCE
-        from google.cloud import bigquery
-        
         query = f"""
         SELECT 
             Category,
@@ -527,82 +1342,50 @@ def get_entity_revenues(code: str):
             COALESCE(DS, 0) as DebtService,
             COALESCE(EP, 0) as Enterprise,
             COALESCE(TS, 0) as Trust,
-            COALESCE(FD, 0) as Fiduciary
+            COALESCE(FD, 0) as Fiduciary,
+            COALESCE(GN, 0) + COALESCE(SR, 0) + COALESCE(CP, 0) + COALESCE(DS, 0) +
+            COALESCE(EP, 0) + COALESCE(TS, 0) + COALESCE(FD, 0) as Total
         FROM `{dal.tables['revenues']}`
         WHERE Code = @code
         ORDER BY Category
         """
         
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("code", "STRING", code),
-            ]
-        )
-        results = dal._client.query(query, job_config=job_config).result()
-        revenues = [serialize_row(dict(row.items())) for row in results]
+        revenues = dal.query_bigquery(query, _code_params(code))
     
     # Check for errors
     if revenues and "error" in revenues[0]:
-        return jsonify({
+        return {
             "status": "error",
             "error_message": revenues[0]["error"]
-        }), 500
+        }, 500
     
-    # Calculate totals and add category names
-    category_names = {
-        "201t": "Property Taxes",
-        "202t": "Personal Property Replacement Tax",
-        "203t": "Sales Tax",
-        "204t": "Other Taxes",
-        "205t": "Special Assessments",
-        "211t": "Licenses and Permits",
-        "212t": "Fines and Forfeitures",
-        "213t": "Interest Earnings",
-        "214t": "Rental Income",
-        "215t": "Intergovernmental Revenue",
-        "225t": "Charges for Services",
-        "226t": "Contributions and Donations",
-        "231t": "Bond/Loan Proceeds",
-        "233t": "Interfund Transfers In",
-        "234t": "Other Revenue",
-    }
+    # Row totals come from SQL; add category names
+    total_revenue = _label_categories(revenues, REVENUE_CATEGORY_NAMES)
     
-    total_revenue = 0
-    for rev in revenues:
-        # Calculate row total
-        row_total = (
-            (rev.get('GeneralFund') or 0) +
-            (rev.get('SpecialRevenue') or 0) +
-            (rev.get('CapitalProjects') or 0) +
-            (rev.get('DebtService') or 0) +
-            (rev.get('Enterprise') or 0) +
-            (rev.get('Trust') or 0) +
-            (rev.get('Fiduciary') or 0)
-        )
-        rev['Total'] = row_total
-        total_revenue += row_total
-        
-        # Add category name
-        cat = rev.get('Category', '')
-        rev['CategoryName'] = category_names.get(cat, cat)
-    
-    return jsonify({
+    return {
         "status": "success",
         "code": code,
         "total_revenue": total_revenue,
         "by_category": revenues
-    })
+    }, 200
 
 
-@app.route('/api/v1/entities/<path:code>/expenditures', methods=['GET'])
+@app.route('/api/v1/entities/<path:code>/revenues', methods=['GET'])
 @handle_errors
-def get_entity_expenditures(code: str):
+@cached_response
+def get_entity_revenues(code: str):
     """
-    Get expenditure breakdown for an entity.
+    Get revenue breakdown for an entity.
     
     Example:
-        GET /api/v1/entities/016/020/32/expenditures
+        GET /api/v1/entities/016/020/32/revenues
     """
+    payload, status = _revenues_payload(code)
+    return fast_jsonify(payload), status
+
+
+def _expenditures_payload(code: str) -> Tuple[Dict[str, Any], int]:
+    """Build the expenditures response payload and HTTP status for an entity."""
     if dal.source == 'access':
         query = f"""
         SELECT 
@@ -613,15 +1396,16 @@ def get_entity_expenditures(code: str):
             IIF(DS IS NULL, 0, DS) AS DebtService,
             IIF(EP IS NULL, 0, EP) AS Enterprise,
             IIF(TS IS NULL, 0, TS) AS Trust,
-            IIF(FD IS NULL, 0, FD) AS Fiduciary
+            IIF(FD IS NULL, 0, FD) AS Fiduciary,
+            IIF(GN IS NULL, 0, GN) + IIF(SR IS NULL, 0, SR) + IIF(CP IS NULL, 0, CP) +
+            IIF(DS IS NULL, 0, DS) + IIF(EP IS NULL, 0, EP) + IIF(TS IS NULL, 0, TS) +
+            IIF(FD IS NULL, 0, FD) AS Total
         FROM {dal.tables['expenditures']}
-        WHERE Code = '{code}'
+        WHERE Code = @code
         ORDER BY Category
         """
-        expenditures = dal.execute_query(query)
+        expenditures = dal.execute_query(query, {"code": code})
     else:
-        from google.cloud import bigquery
-        
         query = f"""
         SELECT 
             Category,
@@ -631,72 +1415,49 @@ def get_entity_expenditures(code: str):
             COALESCE(DS, 0) as DebtService,
             COALESCE(EP, 0) as Enterprise,
             COALESCE(TS, 0) as Trust,
-            COALESCE(FD, 0) as Fiduciary
+            COALESCE(FD, 0) as Fiduciary,
+            COALESCE(GN, 0) + COALESCE(SR, 0) + COALESCE(CP, 0) + COALESCE(DS, 0) +
+            COALESCE(EP, 0) + COALESCE(TS, 0) + COALESCE(FD, 0) as Total
         FROM `{dal.tables['expenditures']}`
         WHERE Code = @code
         ORDER BY Category
         """
         
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("code", "STRING", code),
-            ]
-        )
-        results = dal._client.query(query, job_config=job_config).result()
-        expenditures = [serialize_row(dict(row.items())) for row in results]
+        expenditures = dal.query_bigquery(query, _code_params(code))
     
     if expenditures and "error" in expenditures[0]:
-        return jsonify({
+        return {
             "status": "error",
             "error_message": expenditures[0]["error"]
-        }), 500
+        }, 500
     
-    # Add category names
-    category_names = {
-        "251t": "General Government",
-        "252t": "Public Safety",
-        "253t": "Highways and Streets",
-        "254t": "Sanitation",
-        "255t": "Health and Welfare",
-        "256t": "Culture and Recreation",
-        "257t": "Conservation and Development",
-        "258t": "Education",
-        "259t": "Other Expenditures",
-        "260t": "Capital Outlay",
-        "271t": "Debt Service - Principal",
-        "272t": "Debt Service - Interest",
-        "275t": "Interfund Transfers Out",
-    }
-    
-    total_expenditure = 0
-    for exp in expenditures:
-        row_total = (
-            (exp.get('GeneralFund') or 0) +
-            (exp.get('SpecialRevenue') or 0) +
-            (exp.get('CapitalProjects') or 0) +
-            (exp.get('DebtService') or 0) +
-            (exp.get('Enterprise') or 0) +
-            (exp.get('Trust') or 0) +
-            (exp.get('Fiduciary') or 0)
-        )
-        exp['Total'] = row_total
-        total_expenditure += row_total
-        
-        cat = exp.get('Category', '')
-        exp['CategoryName'] = category_names.get(cat, cat)
+    # Row totals come from SQL; add category names
+    total_expenditure = _label_categories(expenditures, EXPENDITURE_CATEGORY_NAMES)
     
-    return jsonify({
+    return {
         "status": "success",
         "code": code,
         "total_expenditure": total_expenditure,
         "by_category": expenditures
-    })
+    }, 200
 
 
-@app.route('/api/v1/entities/<path:code>/debt', methods=['GET'])
+@app.route('/api/v1/entities/<path:code>/expenditures', methods=['GET'])
 @handle_errors
-def get_entity_debt(code: str):
-    """Get debt information for an entity."""
+@cached_response
+def get_entity_expenditures(code: str):
+    """
+    Get expenditure breakdown for an entity.
+    
+    Example:
+        GET /api/v1/entities/016/020/32/expenditures
+    """
+    payload, status = _expenditures_payload(code)
+    return fast_jsonify(payload), status
+
+
+def _debt_payload(code: str) -> Tuple[Dict[str, Any], int]:
+    """Build the debt response payload and HTTP status for an entity."""
     if dal.source == 'access':
         query = f"""
         SELECT 
@@ -706,43 +1467,47 @@ def get_entity_debt(code: str):
             IIF(b401 IS NULL, 0, b401) AS RevenueBonds_Beginning,
             IIF(c401 IS NULL, 0, c401) AS AltRevenueBonds_Beginning,
             IIF(d401 IS NULL, 0, d401) AS Contractual_Beginning,
-            IIF(e401 IS NULL, 0, e401) AS OtherDebt_Beginning
+            IIF(e401 IS NULL, 0, e401) AS OtherDebt_Beginning,
+            IIF(t404 IS NULL, 0, t404) + IIF(t410 IS NULL, 0, t410) AS TotalDebt
         FROM {dal.tables['indebtedness']}
-        WHERE Code = '{code}'
+        WHERE Code = @code
         """
-        results = dal.execute_query(query)
+        results = dal.execute_query(query, {"code": code})
     else:
-        from google.cloud import bigquery
         query = f"""
         SELECT 
             COALESCE(t404, 0) as TotalDebt_LongTerm,
-            COALESCE(t410, 0) as TotalDebt_ShortTerm
+            COALESCE(t410, 0) as TotalDebt_ShortTerm,
+            COALESCE(t404, 0) + COALESCE(t410, 0) as TotalDebt
         FROM `{dal.tables['indebtedness']}`
         WHERE Code = @code
         """
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[bigquery.ScalarQueryParameter("code", "STRING", code)]
-        )
-        results = list(dal._client.query(query, job_config=job_config).result())
-        results = [serialize_row(dict(row.items())) for row in results]
+        results = dal.query_bigquery(query, _code_params(code))
     
     if results and "error" in results[0]:
-        return jsonify({"status": "error", "error_message": results[0]["error"]}), 500
+        return {"status": "error", "error_message": results[0]["error"]}, 500
     
     if results:
         row = results[0]
-        total_debt = (row.get('TotalDebt_LongTerm') or 0) + (row.get('TotalDebt_ShortTerm') or 0)
+        total_debt = row.pop('TotalDebt')
     else:
         total_debt = 0
         row = {}
     
-    return jsonify({"status": "success", "code": code, "total_debt": total_debt, "details": row})
+    return {"status": "success", "code": code, "total_debt": total_debt, "details": row}, 200
 
 
-@app.route('/api/v1/entities/<path:code>/pensions', methods=['GET'])
+@app.route('/api/v1/entities/<path:code>/debt', methods=['GET'])
 @handle_errors
-def get_entity_pensions(code: str):
-    """Get pension information for an entity."""
+@cached_response
+def get_entity_debt(code: str):
+    """Get debt information for an entity."""
+    payload, status = _debt_payload(code)
+    return fast_jsonify(payload), status
+
+
+def _pensions_payload(code: str) -> Tuple[Dict[str, Any], int]:
+    """Build the pensions response payload and HTTP status for an entity."""
     if dal.source == 'access':
         query = f"""
         SELECT 
@@ -756,11 +1521,10 @@ def get_entity_pensions(code: str):
             Fire_t502_3 AS Fire_PlanAssets,
             Fire_t504_3 AS Fire_FundedRatio
         FROM {dal.tables['pensions']}
-        WHERE Code = '{code}'
+        WHERE Code = @code
         """
-        results = dal.execute_query(query)
+        results = dal.execute_query(query, {"code": code})
     else:
-        from google.cloud import bigquery
         query = f"""
         SELECT 
             IMRF_t501_3 as IMRF_TotalLiability,
@@ -775,14 +1539,10 @@ def get_entity_pensions(code: str):
         FROM `{dal.tables['pensions']}`
         WHERE Code = @code
         """
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[bigquery.ScalarQueryParameter("code", "STRING", code)]
-        )
-        results = list(dal._client.query(query, job_config=job_config).result())
-        results = [serialize_row(dict(row.items())) for row in results]
+        results = dal.query_bigquery(query, _code_params(code))
     
     if results and "error" in results[0]:
-        return jsonify({"status": "error", "error_message": results[0]["error"]}), 500
+        return {"status": "error", "error_message": results[0]["error"]}, 500
     
     pension_systems = {}
     if results:
@@ -796,7 +1556,54 @@ def get_entity_pensions(code: str):
                     "funded_ratio": row.get(f'{system}_FundedRatio') or 0
                 }
     
-    return jsonify({"status": "success", "code": code, "pension_systems": pension_systems})
+    return {"status": "success", "code": code, "pension_systems": pension_systems}, 200
+
+
+@app.route('/api/v1/entities/<path:code>/pensions', methods=['GET'])
+@handle_errors
+@cached_response
+def get_entity_pensions(code: str):
+    """Get pension information for an entity."""
+    payload, status = _pensions_payload(code)
+    return fast_jsonify(payload), status
+
+
+# Fans the bundle endpoint's five queries out so each runs on its own pooled connection
+_bundle_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix='bundle')
+
+
+@app.route('/api/v1/entities/<path:code>/bundle', methods=['GET'])
+@handle_errors
+@cached_response
+def get_entity_bundle(code: str):
+    """
+    Get details, revenues, expenditures, debt and pensions for an entity in one call.
+    
+    The five queries run concurrently, each on its own pooled connection.
+    
+    Example:
+        GET /api/v1/entities/016/020/32/bundle
+    """
+    builders = {
+        "entity": _entity_payload,
+        "revenues": _revenues_payload,
+        "expenditures": _expenditures_payload,
+        "debt": _debt_payload,
+        "pensions": _pensions_payload,
+    }
+    futures = {
+        name: _bundle_executor.submit(copy_current_request_context(builder), code)
+        for name, builder in builders.items()
+    }
+    
+    bundle = {"status": "success", "code": code}
+    for name, future in futures.items():
+        payload, status = future.result()
+        if status != 200:
+            return fast_jsonify(payload), status
+        bundle[name] = payload
+    
+    return fast_jsonify(bundle)
 
 
 # -----------------------------------------------------------------------------
@@ -810,39 +1617,43 @@ def get_county_entities(county: str):
     entity_type = request.args.get('entity_type')
     
     if dal.source == 'access':
-        type_filter = f"AND ud.Description = '{entity_type}'" if entity_type else ""
+        type_filter = "AND ud.Description = @entity_type" if entity_type else ""
+        params = {"county": county}
+        if entity_type:
+            params["entity_type"] = entity_type
         query = f"""
         SELECT 
             ud.Code, ud.UnitName, ud.Description AS EntityType,
             us.Pop AS Population, us.EAV AS EquitalizedAssessedValue
         FROM {dal.tables['unit_data']} AS ud
         LEFT JOIN {dal.tables['unit_stats']} AS us ON ud.Code = us.Code
-        WHERE ud.County = '{county}' {type_filter}
+        WHERE ud.County = @county {type_filter}
         ORDER BY us.Pop DESC
         """
-        entities = dal.execute_query(query)
+        entities = dal.execute_query(query, params)
     else:
-        from google.cloud import bigquery
-        type_filter = "AND LOWER(ud.Description) = LOWER(@entity_type)" if entity_type else ""
+        type_filter = "AND LOWER(u.Description) = LOWER(@entity_type)" if entity_type else ""
         params = [bigquery.ScalarQueryParameter("county", "STRING", county)]
         if entity_type:
             params.append(bigquery.ScalarQueryParameter("entity_type", "STRING", entity_type))
         query = f"""
-        SELECT ud.Code, ud.UnitName, ud.Description as EntityType,
-               us.Pop as Population, us.EAV as EquitalizedAssessedValue
-        FROM `{dal.tables['unit_data']}` ud
-        LEFT JOIN `{dal.tables['unit_stats']}` us ON ud.Code = us.Code
-        WHERE LOWER(ud.County) = LOWER(@county) {type_filter}
-        ORDER BY us.Pop DESC NULLS LAST
+        SELECT u.Code, u.UnitName, u.Description as EntityType,
+               u.Pop as Population, u.EAV as EquitalizedAssessedValue
+        FROM {dal.units_source}
+        WHERE LOWER(u.County) = LOWER(@county) {type_filter}
+        ORDER BY u.Pop DESC NULLS LAST
         """
-        job_config = bigquery.QueryJobConfig(query_parameters=params)
-        results = dal._client.query(query, job_config=job_config).result()
-        entities = [serialize_row(dict(row.items())) for row in results]
+        # Large counties can return thousands of rows; stream them
+        return stream_jsonify(
+            {"status": "success", "county": county, "entity_type_filter": entity_type},
+            "entities",
+            dal.iter_bigquery(query, params)
+        )
     
     if entities and "error" in entities[0]:
-        return jsonify({"status": "error", "error_message": entities[0]["error"]}), 500
+        return fast_jsonify({"status": "error", "error_message": entities[0]["error"]}), 500
     
-    return jsonify({
+    return fast_jsonify({
         "status": "success", "county": county,
         "entity_type_filter": entity_type, "count": len(entities), "entities": entities
     })
@@ -850,6 +1661,7 @@ def get_county_entities(county: str):
 
 @app.route('/api/v1/counties/<county>/summary', methods=['GET'])
 @handle_errors
+@cached_response
 def get_county_summary(county: str):
     """Get aggregated summary for a county."""
     if dal.source == 'access':
@@ -859,31 +1671,28 @@ def get_county_summary(county: str):
                SUM(us.FULL_EMP) AS TotalFullTimeEmployees
         FROM {dal.tables['unit_data']} AS ud
         LEFT JOIN {dal.tables['unit_stats']} AS us ON ud.Code = us.Code
-        WHERE ud.County = '{county}'
+        WHERE ud.County = @county
         GROUP BY ud.County
         """
-        results = dal.execute_query(query)
+        results = dal.execute_query(query, {"county": county})
     else:
-        from google.cloud import bigquery
         query = f"""
-        SELECT ud.County, COUNT(DISTINCT ud.Code) as EntityCount,
-               SUM(us.Pop) as TotalPopulation, SUM(us.EAV) as TotalEAV,
-               SUM(us.FULL_EMP) as TotalFullTimeEmployees
-        FROM `{dal.tables['unit_data']}` ud
-        LEFT JOIN `{dal.tables['unit_stats']}` us ON ud.Code = us.Code
-        WHERE LOWER(ud.County) = LOWER(@county)
-        GROUP BY ud.County
+        SELECT u.County, COUNT(DISTINCT u.Code) as EntityCount,
+               SUM(u.Pop) as TotalPopulation, SUM(u.EAV) as TotalEAV,
+               SUM(u.FULL_EMP) as TotalFullTimeEmployees
+        FROM {dal.units_source}
+        WHERE LOWER(u.County) = LOWER(@county)
+        GROUP BY u.County
         """
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[bigquery.ScalarQueryParameter("county", "STRING", county)]
-        )
-        results = list(dal._client.query(query, job_config=job_config).result())
-        results = [serialize_row(dict(row.items())) for row in results]
+        results = dal.query_bigquery(query, [bigquery.ScalarQueryParameter("county", "STRING", county)])
+    
+    if results and "error" in results[0]:
+        return fast_jsonify({"status": "error", "error_message": results[0]["error"]}), 500
     
     if not results:
-        return jsonify({"status": "error", "error_message": f"County '{county}' not found"}), 404
+        return fast_jsonify({"status": "error", "error_message": f"County '{county}' not found"}), 404
     
-    return jsonify({"status": "success", "summary": results[0]})
+    return fast_jsonify({"status": "success", "summary": results[0]})
 
 
 # -----------------------------------------------------------------------------
@@ -898,42 +1707,58 @@ def compare_entities():
     codes = [c.strip() for c in codes_str.split(',') if c.strip()]
     
     if len(codes) < 2:
-        return jsonify({"status": "error", "error_message": "Provide at least 2 entity codes"}), 400
-    
-    comparisons = []
-    for code in codes:
-        if dal.source == 'access':
-            query = f"""
-            SELECT TOP 1 ud.Code, ud.UnitName, ud.Description AS EntityType, ud.County,
-                   us.Pop AS Population, us.EAV AS EquitalizedAssessedValue
-            FROM {dal.tables['unit_data']} AS ud
-            LEFT JOIN {dal.tables['unit_stats']} AS us ON ud.Code = us.Code
-            WHERE ud.Code = '{code}'
-            """
-            results = dal.execute_query(query)
-        else:
-            from google.cloud import bigquery
-            query = f"""
-            SELECT ud.Code, ud.UnitName, ud.Description as EntityType, ud.County,
-                   us.Pop as Population, us.EAV as EquitalizedAssessedValue
-            FROM `{dal.tables['unit_data']}` ud
-            LEFT JOIN `{dal.tables['unit_stats']}` us ON ud.Code = us.Code
-            WHERE ud.Code = @code
-            """
-            job_config = bigquery.QueryJobConfig(
-                query_parameters=[bigquery.ScalarQueryParameter("code", "STRING", code)]
-            )
-            results = list(dal._client.query(query, job_config=job_config).result())
-            results = [serialize_row(dict(row.items())) for row in results]
-        
-        if results and "error" not in results[0]:
-            comparisons.append(results[0])
+        return fast_jsonify({"status": "error", "error_message": "Provide at least 2 entity codes"}), 400
+    
+    if dal.source == 'access':
+        placeholders = ", ".join(f"@code{i}" for i in range(len(codes)))
+        query = f"""
+        SELECT ud.Code, ud.UnitName, ud.Description AS EntityType, ud.County,
+               us.Pop AS Population, us.EAV AS EquitalizedAssessedValue
+        FROM {dal.tables['unit_data']} AS ud
+        LEFT JOIN {dal.tables['unit_stats']} AS us ON ud.Code = us.Code
+        WHERE ud.Code IN ({placeholders})
+        """
+        results = dal.execute_query(query, {f"code{i}": code for i, code in enumerate(codes)})
+    else:
+        query = f"""
+        SELECT ud.Code, ud.UnitName, ud.Description as EntityType, ud.County,
+               us.Pop as Population, us.EAV as EquitalizedAssessedValue
+        FROM `{dal.tables['unit_data']}` ud
+        LEFT JOIN `{dal.tables['unit_stats']}` us ON ud.Code = us.Code
+        WHERE ud.Code IN UNNEST(@codes)
+        """
+        results = dal.query_bigquery(query, [bigquery.ArrayQueryParameter("codes", "STRING", codes)])
+    
+    if results and "error" in results[0]:
+        return fast_jsonify({"status": "error", "error_message": results[0]["error"]}), 500
+    
+    # First row per code, in the order the codes were requested
+    by_code = {}
+    for row in results:
+        by_code.setdefault(row.get('Code'), row)
+    comparisons = [by_code[code] for code in dict.fromkeys(codes) if code in by_code]
     
-    return jsonify({"status": "success", "entity_count": len(comparisons), "comparison": comparisons})
+    return fast_jsonify({"status": "success", "entity_count": len(comparisons), "comparison": comparisons})
+
+
+# Rank metric -> SQL expression, per data source dialect
+RANK_METRIC_COLUMNS = MappingProxyType({
+    'access': MappingProxyType({
+        "population": "us.Pop",
+        "eav": "us.EAV",
+        "employees": "(IIF(us.FULL_EMP IS NULL, 0, us.FULL_EMP) + IIF(us.PART_EMP IS NULL, 0, us.PART_EMP))",
+    }),
+    'bigquery': MappingProxyType({
+        "population": "u.Pop",
+        "eav": "u.EAV",
+        "employees": "COALESCE(u.FULL_EMP, 0) + COALESCE(u.PART_EMP, 0)",
+    }),
+})
 
 
 @app.route('/api/v1/entities/rank', methods=['GET'])
 @handle_errors
+@cached_response
 def rank_entities():
     """Rank entities by a metric."""
     metric = request.args.get('metric', 'population')
@@ -942,22 +1767,22 @@ def rank_entities():
     order = request.args.get('order', 'top')
     limit = request.args.get('limit', 10, type=int)
     
-    metric_columns = {
-        "population": "us.Pop",
-        "eav": "us.EAV",
-        "employees": "(IIF(us.FULL_EMP IS NULL, 0, us.FULL_EMP) + IIF(us.PART_EMP IS NULL, 0, us.PART_EMP))" if dal.source == 'access' else "COALESCE(us.FULL_EMP, 0) + COALESCE(us.PART_EMP, 0)",
-    }
+    metric_columns = RANK_METRIC_COLUMNS[dal.source]
     
     if metric.lower() not in metric_columns:
-        return jsonify({"status": "error", "error_message": f"Unknown metric: {metric}"}), 400
+        return fast_jsonify({"status": "error", "error_message": f"Unknown metric: {metric}"}), 400
     
     metric_col = metric_columns[metric.lower()]
     order_dir = "DESC" if order.lower() == "top" else "ASC"
     
     if dal.source == 'access':
-        filters = []
-        if entity_type: filters.append(f"ud.Description = '{entity_type}'")
-        if county: filters.append(f"ud.County = '{county}'")
+        filters, params = [], {}
+        if entity_type:
+            filters.append("ud.Description = @entity_type")
+            params["entity_type"] = entity_type
+        if county:
+            filters.append("ud.County = @county")
+            params["county"] = county
         where_clause = " AND ".join(filters) if filters else "1=1"
         
         query = f"""
@@ -968,43 +1793,83 @@ def rank_entities():
         WHERE {where_clause} AND {metric_col} IS NOT NULL
         ORDER BY {metric_col} {order_dir}
         """
-        rankings = dal.execute_query(query)
-        for i, r in enumerate(rankings): r['Rank'] = i + 1
+        rankings = dal.execute_query(query, params)
     else:
-        from google.cloud import bigquery
         filters, params = ["1=1"], []
         if entity_type:
-            filters.append("LOWER(ud.Description) = LOWER(@entity_type)")
+            filters.append("LOWER(u.Description) = LOWER(@entity_type)")
             params.append(bigquery.ScalarQueryParameter("entity_type", "STRING", entity_type))
         if county:
-            filters.append("LOWER(ud.County) = LOWER(@county)")
+            filters.append("LOWER(u.County) = LOWER(@county)")
             params.append(bigquery.ScalarQueryParameter("county", "STRING", county))
         
         query = f"""
-        SELECT ud.Code, ud.UnitName, ud.Description as EntityType, ud.County,
-               {metric_col} as MetricValue,
-               RANK() OVER (ORDER BY {metric_col} {order_dir}) as Rank
-        FROM `{dal.tables['unit_data']}` ud
-        LEFT JOIN `{dal.tables['unit_stats']}` us ON ud.Code = us.Code
+        SELECT u.Code, u.UnitName, u.Description as EntityType, u.County,
+               {metric_col} as MetricValue
+        FROM {dal.units_source}
         WHERE {" AND ".join(filters)} AND {metric_col} IS NOT NULL
         ORDER BY {metric_col} {order_dir}
         LIMIT {limit}
         """
-        job_config = bigquery.QueryJobConfig(query_parameters=params)
-        results = dal._client.query(query, job_config=job_config).result()
-        rankings = [serialize_row(dict(row.items())) for row in results]
+        rankings = dal.query_bigquery(query, params)
+    
+    if rankings and "error" in rankings[0]:
+        return fast_jsonify({"status": "error", "error_message": rankings[0]["error"]}), 500
+    
+    # Number the sorted rows here rather than with a RANK() window, so
+    # ORDER BY ... LIMIT stays a top-N sort. Like RANK(), ties share a rank
+    # and the next rank skips past them.
+    rank = 0
+    previous = object()
+    for position, r in enumerate(rankings, start=1):
+        if r['MetricValue'] != previous:
+            rank = position
+            previous = r['MetricValue']
+        r['Rank'] = rank
     
-    return jsonify({
+    return fast_jsonify({
         "status": "success", "metric": metric, "order": order,
         "filters": {"entity_type": entity_type, "county": county},
         "count": len(rankings), "rankings": rankings
     })
 
 
+# -----------------------------------------------------------------------------
+# CACHE ENDPOINTS
+# -----------------------------------------------------------------------------
+
+@app.route('/api/v1/cache/invalidate', methods=['POST'])
+@handle_errors
+def invalidate_cache():
+    """Drop cached responses and query results, e.g. after the data is reloaded."""
+    with _response_cache_lock:
+        cleared = len(_response_cache)
+        _response_cache.clear()
+    dal._cache.clear()
+    return fast_jsonify({"status": "success", "responses_cleared": cleared})
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
 
+def warm_up():
+    """
+    Exercise the request pipeline once before the server starts listening.
+    
+    The first request otherwise pays one-off costs: building the URL
+    matcher, importing lazy codec paths in orjson and Flask-Compress, and
+    planning the first replica query. Health and tables touch no user data.
+    """
+    with app.test_client() as client:
+        for path in ('/api/v1/health', '/api/v1/tables'):
+            client.get(path, headers={'Accept-Encoding': 'gzip'})
+    if dal.source == 'access' and dal._connection_tested:
+        dal.execute_query(f"SELECT TOP 1 Code FROM {dal.tables['unit_data']}")
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
 if __name__ == '__main__':
     print("\n" + "=" * 60)
     print("Illinois Fiscal Data API - Starting Server")
@@ -1018,8 +1883,19 @@ if __name__ == '__main__':
         print(f"Project: {GCP_PROJECT_ID}")
         print(f"Dataset: {BQ_DATASET}")
     
+    warm_up()
+    
     print("=" * 60)
-    print("Server starting on http://0.0.0.0:5000")
+    print(f"Server starting on http://0.0.0.0:{API_PORT}")
     print("=" * 60 + "\n")
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Serve with waitress (works on Windows, where the Access ODBC driver
+    # lives) so concurrent tool calls are handled by a thread pool. Each
+    # request borrows its own connection from the DAL pool.
+    try:
+        from waitress import serve
+    except ImportError:
+        print("[Server] waitress not installed - falling back to the Flask dev server")
+        app.run(host='0.0.0.0', port=API_PORT, debug=True, threaded=True)
+    else:
+        serve(app, host='0.0.0.0', port=API_PORT, threads=API_THREADS)
@@ -24,53 +24,186 @@ Usage:
     )
 """
 
+from bisect import bisect_left, bisect_right
 from typing import Optional, Dict, Any, List
 from google.adk.tools.tool_context import ToolContext
+import logging
 import os
 import sys
+import threading
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.api_client import FiscalDataClient
 
+# Per-call tool traces are logged at DEBUG, so the message is only
+# formatted when that level is enabled for this logger
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # API CLIENT SINGLETON
 # =============================================================================
 
 _api_client: Optional[FiscalDataClient] = None
+_api_client_lock = threading.Lock()
 
 
 def get_api_client() -> FiscalDataClient:
-    """Get or create the API client singleton."""
+    """
+    Get or create the API client singleton.
+    
+    Tools run concurrently, so creation is locked: a second client would
+    open its own connection pool and start with an empty cache.
+    """
     global _api_client
     if _api_client is None:
-        api_url = os.environ.get('FISCAL_API_URL', 'http://localhost:5000')
-        _api_client = FiscalDataClient(base_url=api_url)
+        with _api_client_lock:
+            if _api_client is None:
+                api_url = os.environ.get('FISCAL_API_URL', 'http://localhost:5000')
+                # AFR data only changes on reload, so keep responses for an hour;
+                # call flush_cache() on the client after a data refresh
+                _api_client = FiscalDataClient(
+                    base_url=api_url,
+                    cache_ttl=int(os.environ.get('FISCAL_API_CACHE_TTL', '3600')),
+                    cache_size=4096
+                )
     return _api_client
 
 
 # =============================================================================
-# CATEGORY MAPPINGS (for enhancing API responses)
+# LOCAL ENTITY SEARCH INDEX
 # =============================================================================
 
-REVENUE_CATEGORIES = {
-    "201t": "Property Taxes",
-    "202t": "Personal Property Replacement Tax",
-    "203t": "Sales Tax",
-    "204t": "Other Taxes",
-    "215t": "Intergovernmental Revenue",
-    "225t": "Charges for Services",
-}
+class EntityIndex:
+    """
+    In-memory substring search over entity names and counties.
+    
+    Matches the API's 'contains' search (case-insensitive, on UnitName or
+    County, ordered by UnitName) without a round-trip. Every word of a
+    search term is a substring of some word in a matching name, so the
+    rarest-looking (longest) word is looked up in a sorted array of word
+    suffixes - a flattened suffix trie - by binary search, and only those
+    candidates are checked against the full term.
+    """
+    
+    def __init__(self, entities: List[Dict[str, Any]]):
+        self.entities = sorted(entities, key=lambda e: (e.get("UnitName") or "").lower())
+        
+        # Name and county joined by a newline so a term can't span the two
+        self._haystacks = [
+            f"{(e.get('UnitName') or '').lower()}\n{(e.get('County') or '').lower()}"
+            for e in self.entities
+        ]
+        
+        self._postings: Dict[str, List[int]] = {}
+        for i, haystack in enumerate(self._haystacks):
+            for word in set(haystack.split()):
+                self._postings.setdefault(word, []).append(i)
+        
+        suffixes = sorted(
+            (word[j:], word) for word in self._postings for j in range(len(word))
+        )
+        self._suffixes = [suffix for suffix, _ in suffixes]
+        self._suffix_words = [word for _, word in suffixes]
+    
+    def _candidates(self, fragment: str) -> set:
+        """Rows with a word containing fragment."""
+        rows = set()
+        lo = bisect_left(self._suffixes, fragment)
+        hi = bisect_left(self._suffixes, fragment + "\uffff", lo)
+        for word in set(self._suffix_words[lo:hi]):
+            rows.update(self._postings[word])
+        return rows
+    
+    def search(self, search_term: str, limit: int = 10) -> Dict[str, Any]:
+        """
+        Search entities whose name or county contains search_term.
+        
+        Args:
+            search_term: Name or partial name to search for
+            limit: Maximum number of results
+            
+        Returns:
+            dict in the same shape as the API's search response
+        """
+        term = search_term.strip().lower()
+        fragments = term.split()
+        rows = self._candidates(max(fragments, key=len)) if fragments else set()
+        
+        entities = [
+            self.entities[i] for i in sorted(rows) if term in self._haystacks[i]
+        ][:limit]
+        
+        if not entities:
+            return {
+                "status": "not_found",
+                "message": f"No entities found matching '{search_term}'"
+            }
+        return {"status": "success", "count": len(entities), "entities": entities}
 
-EXPENDITURE_CATEGORIES = {
-    "251t": "General Government",
-    "252t": "Public Safety",
-    "253t": "Highways and Streets",
-    "256t": "Culture and Recreation",
-    "271t": "Debt Service - Principal",
-}
+
+_entity_index: Optional[EntityIndex] = None
+_entity_index_lock = threading.Lock()
+
+
+def get_entity_index() -> Optional[EntityIndex]:
+    """
+    Get the local search index, loading it from the API on first use.
+    
+    Returns None if the index could not be loaded; the next call retries.
+    """
+    global _entity_index
+    if _entity_index is None:
+        with _entity_index_lock:
+            if _entity_index is None:
+                result = get_api_client().get_entity_index()
+                if result.get("status") == "success":
+                    _entity_index = EntityIndex(result.get("entities", []))
+                    logger.info("[EntityIndex] Loaded %d entities", len(_entity_index.entities))
+    return _entity_index
+
+
+# =============================================================================
+# ENTITY BUNDLE MEMO
+# =============================================================================
+
+def _bundle_section(
+    entity_code: str,
+    section: str,
+    tool_context: ToolContext
+) -> Dict[str, Any]:
+    """
+    Get one section of an entity's data bundle, fetching the bundle once per turn.
+    
+    The LLM usually asks for details, revenues, expenditures, debt and
+    pensions of the same entity in sequence, so the first call fetches all
+    five in one request and the rest are served from a temp: state key,
+    which ADK discards at the end of the invocation.
+    
+    Args:
+        entity_code: The unique entity code
+        section: Bundle key ('entity', 'revenues', 'expenditures', 'debt', 'pensions')
+        tool_context: ADK tool context for state access
+        
+    Returns:
+        The section's API response, or the bundle error response
+    """
+    bundles = tool_context.state.get("temp:entity_bundles") or {}
+    bundle = bundles.get(entity_code)
+    if bundle is None:
+        bundle = get_api_client().get_entity_bundle(entity_code)
+        if bundle.get("status") != "success":
+            return bundle
+        bundles[entity_code] = bundle
+        tool_context.state["temp:entity_bundles"] = bundles
+    return bundle[section]
+
+
+# =============================================================================
+# FISCAL HEALTH THRESHOLDS
+# =============================================================================
 
 FISCAL_HEALTH_THRESHOLDS = {
     "fund_balance_ratio": {"excellent": 0.25, "good": 0.15, "fair": 0.08},
@@ -105,7 +238,7 @@ def search_government_entity(
               - 'entities': List of matching entities with Code, UnitName, EntityType, County
               - 'error_message': Description of the error
     """
-    print(f"--- Tool: search_government_entity (API) called with: {search_term} ---")
+    logger.debug("--- Tool: search_government_entity (API) called with: %s ---", search_term)
     
     if not search_term or len(search_term) < 2:
         return {
@@ -113,13 +246,23 @@ def search_government_entity(
             "error_message": "Please provide at least 2 characters to search."
         }
     
-    client = get_api_client()
-    result = client.search_entities(search_term, limit=10)
+    # Answer from the local index; the API handles LIKE wildcards in the
+    # term, and any search while the index is unavailable
+    index = None if any(c in search_term for c in "%_[") else get_entity_index()
+    if index is not None:
+        result = index.search(search_term, limit=10)
+    else:
+        result = get_api_client().search_entities(search_term, limit=10)
     
     if result.get("status") == "success":
-        # Store results in state for reference
+        # Store the codes in state for reference
         tool_context.state["last_search_term"] = search_term
-        tool_context.state["last_search_results"] = result.get("entities", [])
+        tool_context.state["last_search_codes"] = [e["Code"] for e in result.get("entities", [])]
+        
+        # A unique hit is almost always drilled into next, so warm the
+        # client cache with its bundle while the LLM composes a reply
+        if result.get("count") == 1:
+            get_api_client().prefetch_entity_bundle(result["entities"][0]["Code"])
     
     return result
 
@@ -144,17 +287,14 @@ def get_entity_details(
         dict: Contains entity details including name, type, county, population,
               EAV, employees, home rule status, and CEO/CFO information
     """
-    print(f"--- Tool: get_entity_details (API) called for code: {entity_code} ---")
+    logger.debug("--- Tool: get_entity_details (API) called for code: %s ---", entity_code)
     
-    client = get_api_client()
-    result = client.get_entity_details(entity_code)
+    result = _bundle_section(entity_code, "entity", tool_context)
     
     if result.get("status") == "success":
-        entity = result.get("entity", {})
         # Store current entity in state for follow-up questions
         tool_context.state["current_entity_code"] = entity_code
-        tool_context.state["current_entity_name"] = entity.get("UnitName")
-        tool_context.state["current_entity"] = entity
+        tool_context.state["current_entity_name"] = result["entity"].get("UnitName")
     
     return result
 
@@ -180,19 +320,10 @@ def get_revenue_data(
     Returns:
         dict: Contains total revenue and breakdown by category.
     """
-    print(f"--- Tool: get_revenue_data (API) called for: {entity_code} ---")
-    
-    client = get_api_client()
-    result = client.get_entity_revenues(entity_code)
-    
-    if result.get("status") == "success":
-        # Enhance categories with full names if not already present
-        for cat in result.get("by_category", []):
-            if "CategoryName" not in cat:
-                cat_code = cat.get("Category", "")
-                cat["CategoryName"] = REVENUE_CATEGORIES.get(cat_code, cat_code)
+    logger.debug("--- Tool: get_revenue_data (API) called for: %s ---", entity_code)
     
-    return result
+    # The API labels each category with its CategoryName
+    return _bundle_section(entity_code, "revenues", tool_context)
 
 
 def get_expenditure_data(
@@ -212,19 +343,10 @@ def get_expenditure_data(
     Returns:
         dict: Contains total expenditure and breakdown by category.
     """
-    print(f"--- Tool: get_expenditure_data (API) called for: {entity_code} ---")
-    
-    client = get_api_client()
-    result = client.get_entity_expenditures(entity_code)
-    
-    if result.get("status") == "success":
-        # Enhance categories with full names
-        for cat in result.get("by_category", []):
-            if "CategoryName" not in cat:
-                cat_code = cat.get("Category", "")
-                cat["CategoryName"] = EXPENDITURE_CATEGORIES.get(cat_code, cat_code)
+    logger.debug("--- Tool: get_expenditure_data (API) called for: %s ---", entity_code)
     
-    return result
+    # The API labels each category with its CategoryName
+    return _bundle_section(entity_code, "expenditures", tool_context)
 
 
 def get_debt_data(
@@ -243,10 +365,9 @@ def get_debt_data(
     Returns:
         dict: Total debt and breakdown by debt type.
     """
-    print(f"--- Tool: get_debt_data (API) called for: {entity_code} ---")
+    logger.debug("--- Tool: get_debt_data (API) called for: %s ---", entity_code)
     
-    client = get_api_client()
-    return client.get_entity_debt(entity_code)
+    return _bundle_section(entity_code, "debt", tool_context)
 
 
 def get_pension_data(
@@ -268,10 +389,9 @@ def get_pension_data(
     Returns:
         dict: Pension data by system including liability, assets, and funded ratio
     """
-    print(f"--- Tool: get_pension_data (API) called for: {entity_code} ---")
+    logger.debug("--- Tool: get_pension_data (API) called for: %s ---", entity_code)
     
-    client = get_api_client()
-    result = client.get_entity_pensions(entity_code)
+    result = _bundle_section(entity_code, "pensions", tool_context)
     
     if result.get("status") == "success":
         result["funded_ratio_thresholds"] = FISCAL_HEALTH_THRESHOLDS["pension_funded_ratio"]
@@ -302,25 +422,20 @@ def calculate_fiscal_health_score(
     Returns:
         dict: Calculated metrics with values and ratings
     """
-    print(f"--- Tool: calculate_fiscal_health_score (API) called for: {entity_code} ---")
+    logger.debug("--- Tool: calculate_fiscal_health_score (API) called for: %s ---", entity_code)
     
-    client = get_api_client()
+    # Fetch all required data in one bundle request
+    bundle = get_api_client().get_entity_bundle(entity_code)
+    if bundle.get("status") != "success":
+        return bundle
     
-    # Fetch all required data via API
-    entity_result = client.get_entity_details(entity_code)
-    revenues_result = client.get_entity_revenues(entity_code)
-    expenditures_result = client.get_entity_expenditures(entity_code)
-    debt_result = client.get_entity_debt(entity_code)
-    pensions_result = client.get_entity_pensions(entity_code)
-    
-    if entity_result.get("status") != "success":
-        return entity_result
-    
-    entity = entity_result.get("entity", {})
-    total_revenue = revenues_result.get("total_revenue", 0) or 0
-    total_expenditure = expenditures_result.get("total_expenditure", 0) or 0
-    total_debt = debt_result.get("total_debt", 0) or 0
-    population = entity.get("Population", 0) or 0
+    # Pull every input into a local once; the math below is straight-line
+    entity = bundle["entity"].get("entity") or {}
+    total_revenue = bundle["revenues"].get("total_revenue") or 0
+    total_expenditure = bundle["expenditures"].get("total_expenditure") or 0
+    total_debt = bundle["debt"].get("total_debt") or 0
+    pension_systems = bundle["pensions"].get("pension_systems") or {}
+    population = entity.get("Population") or 0
     
     metrics = {}
     
@@ -330,7 +445,7 @@ def calculate_fiscal_health_score(
         metrics["operating_margin"] = {
             "value": round(operating_margin * 100, 2),
             "unit": "percent",
-            "rating": _rate_metric(operating_margin, FISCAL_HEALTH_THRESHOLDS["operating_margin"])
+            "rating": _rate_metric(operating_margin, "operating_margin")
         }
     
     # Debt Per Capita
@@ -343,19 +458,17 @@ def calculate_fiscal_health_score(
         }
     
     # Pension Funded Ratio
-    pension_systems = pensions_result.get("pension_systems", {})
     if pension_systems:
-        lowest_funded = 100
-        for system, data in pension_systems.items():
-            funded_ratio = data.get("funded_ratio", 0) or 0
-            if 0 < funded_ratio < lowest_funded:
-                lowest_funded = funded_ratio
+        lowest_funded = min(
+            (r for r in (d.get("funded_ratio") or 0 for d in pension_systems.values()) if r > 0),
+            default=None
+        )
         
-        if lowest_funded < 100:
+        if lowest_funded is not None and lowest_funded < 100:
             metrics["pension_funded_ratio"] = {
                 "value": round(lowest_funded, 2),
                 "unit": "percent",
-                "rating": _rate_metric(lowest_funded / 100, FISCAL_HEALTH_THRESHOLDS["pension_funded_ratio"])
+                "rating": _rate_metric(lowest_funded / 100, "pension_funded_ratio")
             }
     
     # Store in state
@@ -375,29 +488,30 @@ def calculate_fiscal_health_score(
     }
 
 
-def _rate_metric(value: float, thresholds: Dict[str, float]) -> str:
-    """Rate a metric based on thresholds."""
-    if value >= thresholds.get("excellent", float('inf')):
-        return "Excellent"
-    elif value >= thresholds.get("good", float('inf')):
-        return "Good"
-    elif value >= thresholds.get("fair", float('inf')):
-        return "Fair"
-    else:
-        return "Poor"
+# Ascending rating bounds, precomputed once for bisect
+_METRIC_RATING_LABELS = ("Poor", "Fair", "Good", "Excellent")
+_METRIC_RATING_BOUNDS = {
+    metric: (thresholds["fair"], thresholds["good"], thresholds["excellent"])
+    for metric, thresholds in FISCAL_HEALTH_THRESHOLDS.items()
+    if metric != "debt_per_capita"
+}
+
+_DEBT_RATING_LABELS = ("Low", "Moderate", "High", "Very High")
+_DEBT_RATING_BOUNDS = tuple(
+    FISCAL_HEALTH_THRESHOLDS["debt_per_capita"][level] for level in ("low", "moderate", "high")
+)
+
+
+def _rate_metric(value: float, metric: str) -> str:
+    """Rate a higher-is-better metric against its FISCAL_HEALTH_THRESHOLDS entry."""
+    # bisect_right: a value equal to a bound earns that bound's rating
+    return _METRIC_RATING_LABELS[bisect_right(_METRIC_RATING_BOUNDS[metric], value)]
 
 
 def _rate_debt_per_capita(value: float) -> str:
     """Rate debt per capita."""
-    thresholds = FISCAL_HEALTH_THRESHOLDS["debt_per_capita"]
-    if value <= thresholds["low"]:
-        return "Low"
-    elif value <= thresholds["moderate"]:
-        return "Moderate"
-    elif value <= thresholds["high"]:
-        return "High"
-    else:
-        return "Very High"
+    # bisect_left: a value equal to a bound stays in the lower-debt rating
+    return _DEBT_RATING_LABELS[bisect_left(_DEBT_RATING_BOUNDS, value)]
 
 
 # =============================================================================
@@ -416,9 +530,10 @@ def compare_entities(
         tool_context: ADK tool context for state access
         
     Returns:
-        dict: Comparison table with metrics for each entity
+        dict: Comparison table under 'columns', one list per field with
+              one value per entity in the requested order, and 'n' entities
     """
-    print(f"--- Tool: compare_entities (API) called for: {entity_codes} ---")
+    logger.debug("--- Tool: compare_entities (API) called for: %s ---", entity_codes)
     
     codes = [code.strip() for code in entity_codes.split(",")]
     
@@ -452,9 +567,11 @@ def rank_entities(
         limit: Number of results (default 10)
         
     Returns:
-        dict: Ranked list of entities
+        dict: Ranked entities under 'columns', one list per field
+              (Code, UnitName, EntityType, County, MetricValue, Rank) in
+              rank order, and 'n' entities
     """
-    print(f"--- Tool: rank_entities (API) called - metric: {metric} ---")
+    logger.debug("--- Tool: rank_entities (API) called - metric: %s ---", metric)
     
     client = get_api_client()
     return client.rank_entities(
@@ -486,7 +603,7 @@ def get_county_entities(
     Returns:
         dict: List of entities in the county
     """
-    print(f"--- Tool: get_county_entities (API) called for: {county} ---")
+    logger.debug("--- Tool: get_county_entities (API) called for: %s ---", county)
     
     client = get_api_client()
     return client.get_county_entities(county, entity_type)
@@ -506,7 +623,7 @@ def get_county_financial_summary(
     Returns:
         dict: Aggregated statistics for the county
     """
-    print(f"--- Tool: get_county_financial_summary (API) called for: {county} ---")
+    logger.debug("--- Tool: get_county_financial_summary (API) called for: %s ---", county)
     
     client = get_api_client()
     return client.get_county_summary(county)
@@ -24,8 +24,10 @@ from google.adk.models.llm_response import LlmResponse
 from google.adk.tools.base_tool import BaseTool
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
-from typing import Optional, Dict, Any
+from typing import Literal, Optional, Dict, Any
 
+import logging
+import re
 import sys
 import os
 
@@ -34,6 +36,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tools.fiscal_tools_api import ALL_TOOLS
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # CONFIGURATION
@@ -41,6 +45,37 @@ from tools.fiscal_tools_api import ALL_TOOLS
 
 PRIMARY_MODEL = os.environ.get("PRIMARY_MODEL", "gemini-2.0-flash")
 
+# Entity codes are three numeric segments, e.g. '016/020/32'
+_ENTITY_CODE_RE = re.compile(r"^\s*[0-9]{1,4}/[0-9]{1,4}/[0-9]{1,4}\s*$")
+
+# Out-of-scope topics, matched as whole words in one pass over the message
+OUT_OF_SCOPE_KEYWORDS = (
+    "california", "new york city", "texas", "florida",
+    "federal government", "congress", "white house"
+)
+_OUT_OF_SCOPE_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(k) for k in OUT_OF_SCOPE_KEYWORDS) + r")\b"
+)
+
+# Built once; ADK copies a callback's response into the event without
+# modifying it, so the same object can be returned on every block
+_OUT_OF_SCOPE_RESPONSE = LlmResponse(
+    content=types.Content(
+        role="model",
+        parts=[types.Part(text="""I specialize in Illinois local government financial data only. 
+                    
+I can help you with:
+- Illinois cities, villages, and towns
+- Illinois townships  
+- Fire protection districts
+- Library districts, park districts
+- School districts, community colleges
+- And other Illinois local governments
+
+Would you like to explore Illinois local government data instead?""")]
+    )
+)
+
 
 # =============================================================================
 # SAFETY CALLBACKS
@@ -54,7 +89,7 @@ def input_safety_guardrail(
     Before-model callback to filter inappropriate or off-topic requests.
     """
     agent_name = callback_context.agent_name
-    print(f"--- Callback: input_safety_guardrail for {agent_name} ---")
+    logger.debug("--- Callback: input_safety_guardrail for %s ---", agent_name)
     
     # Get the last user message
     last_user_message = ""
@@ -62,33 +97,12 @@ def input_safety_guardrail(
         for content in reversed(llm_request.contents):
             if content.role == 'user' and content.parts:
                 if content.parts[0].text:
-                    last_user_message = content.parts[0].text.lower()
+                    last_user_message = content.parts[0].text.casefold()
                     break
     
     # Check for out-of-scope requests
-    out_of_scope_keywords = [
-        "california", "new york city", "texas", "florida",
-        "federal government", "congress", "white house"
-    ]
-    
-    for keyword in out_of_scope_keywords:
-        if keyword in last_user_message:
-            return LlmResponse(
-                content=types.Content(
-                    role="model",
-                    parts=[types.Part(text="""I specialize in Illinois local government financial data only. 
-                    
-I can help you with:
-- Illinois cities, villages, and towns
-- Illinois townships  
-- Fire protection districts
-- Library districts, park districts
-- School districts, community colleges
-- And other Illinois local governments
-
-Would you like to explore Illinois local government data instead?""")]
-                )
-            )
+    if _OUT_OF_SCOPE_RE.search(last_user_message):
+        return _OUT_OF_SCOPE_RESPONSE
     
     return None
 
@@ -102,8 +116,8 @@ def tool_usage_guardrail(
     Before-tool callback to validate tool arguments.
     """
     tool_name = tool.name
-    print(f"--- Callback: tool_usage_guardrail for {tool_name} ---")
-    print(f"--- Args: {args} ---")
+    logger.debug("--- Callback: tool_usage_guardrail for %s ---", tool_name)
+    logger.debug("--- Args: %s ---", args)
     
     # Validate entity code format
     if "entity_code" in args:
@@ -125,34 +139,19 @@ def tool_usage_guardrail(
 
 def _is_valid_entity_code(code: str) -> bool:
     """Validate entity code format (XXX/YYY/ZZ)."""
-    if not code:
-        return False
-    parts = code.split("/")
-    if len(parts) != 3:
-        return False
-    return all(part.strip() for part in parts)
+    return bool(code) and _ENTITY_CODE_RE.match(code) is not None
 
 
 # =============================================================================
 # SUB-AGENTS (Simplified for API-based approach)
 # =============================================================================
 
-# Greeting agent tools
-def greet_user(name: Optional[str] = None) -> str:
-    """Provides a friendly greeting to the user."""
-    if name:
-        return f"Hello, {name}! I'm ready to help you explore Illinois local government financial data. What would you like to know?"
-    return "Hello! I'm the Illinois Fiscal Data Assistant. I can help you explore financial data for over 4,000 local governments including cities, villages, townships, fire districts, and more. What would you like to know?"
-
-
-def say_goodbye() -> str:
-    """Provides a polite farewell message."""
-    return "Thank you for exploring Illinois local government data with me. Feel free to return anytime you have more questions. Goodbye!"
+# Greeting agent replies
+GREETING_TEXT = "Hello! I'm the Illinois Fiscal Data Assistant. I can help you explore financial data for over 4,000 local governments including cities, villages, townships, fire districts, and more. What would you like to know?"
 
+GOODBYE_TEXT = "Thank you for exploring Illinois local government data with me. Feel free to return anytime you have more questions. Goodbye!"
 
-def provide_help() -> str:
-    """Explains what the agent can do."""
-    return """I can help you with:
+HELP_TEXT = """I can help you with:
 
 🔍 **Find Entities**: Search for any Illinois city, village, township, fire district, or other local government
 
@@ -174,12 +173,26 @@ def provide_help() -> str:
 What would you like to explore?"""
 
 
+def handle_conversation(
+    kind: Literal["greet", "bye", "help"],
+    name: Optional[str] = None
+) -> str:
+    """Replies to a greeting ('greet'), a farewell ('bye') or a help request ('help')."""
+    if kind == "bye":
+        return GOODBYE_TEXT
+    if kind == "help":
+        return HELP_TEXT
+    if name:
+        return f"Hello, {name}! I'm ready to help you explore Illinois local government financial data. What would you like to know?"
+    return GREETING_TEXT
+
+
 greeting_agent = Agent(
     name="greeting_agent",
     model=PRIMARY_MODEL,
     description="Handles greetings, farewells, and help requests.",
     instruction="Handle greetings, farewells, and help requests warmly.",
-    tools=[greet_user, say_goodbye, provide_help],
+    tools=[handle_conversation],
 )
 
 
@@ -226,7 +239,7 @@ User: "Compare that to Aurora"
 User: "Is Springfield financially healthy?"
 → Clarify which Springfield, then run fiscal health analysis""",
 
-    tools=ALL_TOOLS + [greet_user, say_goodbye, provide_help],
+    tools=ALL_TOOLS + [handle_conversation],
     sub_agents=[greeting_agent],
     before_model_callback=input_safety_guardrail,
     before_tool_callback=tool_usage_guardrail,
@@ -19,6 +19,41 @@ import os
 import time
 import argparse
 
+import httpx
+
+
+API_PATH = os.path.join(os.path.dirname(__file__), "api", "fiscal_data_api.py")
+
+# How long run_both waits for the API to answer /health before giving up
+API_READY_TIMEOUT = 10.0
+API_READY_POLL = 0.05
+
+
+def _api_env(port: int) -> dict:
+    """Set the API's variables on this process's environment and return it."""
+    os.environ["FLASK_APP"] = "fiscal_data_api.py"
+    os.environ["API_PORT"] = str(port)
+    return os.environ
+
+
+def wait_for_api(port: int = 5000, timeout: float = API_READY_TIMEOUT) -> bool:
+    """
+    Poll the API's health endpoint until it answers 200 or timeout elapses.
+    
+    Returns:
+        True once the API is ready, False on timeout
+    """
+    url = f"http://localhost:{port}/api/v1/health"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=0.2).status_code == 200:
+                return True
+        except httpx.HTTPError:
+            pass
+        time.sleep(API_READY_POLL)
+    return False
+
 
 def run_api(port: int = 5000):
     """Start the Flask API server."""
@@ -27,11 +62,7 @@ def run_api(port: int = 5000):
     print(f"Server will be available at: http://localhost:{port}")
     print("=" * 60)
     
-    api_path = os.path.join(os.path.dirname(__file__), "api", "fiscal_data_api.py")
-    subprocess.run([sys.executable, api_path], env={
-        **os.environ,
-        "FLASK_APP": "fiscal_data_api.py",
-    })
+    subprocess.run([sys.executable, API_PATH], env=_api_env(port))
 
 
 def run_agent():
@@ -45,30 +76,33 @@ def run_agent():
     subprocess.run(["adk", "web"], cwd=project_dir)
 
 
-def run_both():
+def run_both(port: int = 5000):
     """Start both API and agent."""
-    import threading
-    
     print("=" * 60)
     print("Starting Illinois Fiscal Data System")
     print("=" * 60)
     
-    # Start API in a thread
-    def start_api():
-        api_path = os.path.join(os.path.dirname(__file__), "api", "fiscal_data_api.py")
-        subprocess.run([sys.executable, api_path], 
-                      stdout=subprocess.DEVNULL, 
-                      stderr=subprocess.DEVNULL)
-    
-    api_thread = threading.Thread(target=start_api, daemon=True)
-    api_thread.start()
-    
-    print("✓ API starting on http://localhost:5000")
-    time.sleep(2)  # Give API time to start
+    # Start API in the background
+    api_process = subprocess.Popen(
+        [sys.executable, API_PATH],
+        env=_api_env(port),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
     
-    # Start ADK agent
-    print("✓ Starting ADK agent on http://localhost:8000")
-    run_agent()
+    print(f"✓ API starting on http://localhost:{port}")
+    try:
+        # Start the agent as soon as the API answers, not after a fixed delay
+        if wait_for_api(port):
+            print("✓ API ready")
+        else:
+            print(f"✗ API did not answer within {API_READY_TIMEOUT:.0f}s - starting agent anyway")
+        
+        # Start ADK agent
+        print("✓ Starting ADK agent on http://localhost:8000")
+        run_agent()
+    finally:
+        api_process.terminate()
 
 
 def run_tests():
@@ -159,7 +193,7 @@ Examples:
     elif args.command == "agent":
         run_agent()
     elif args.command == "both":
-        run_both()
+        run_both(args.port)
     elif args.command == "test":
         run_tests()
 
@@ -15,8 +15,36 @@ import os
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.apps import App
+
+from config.settings import (
+    BQ_PREWARM,
+    CONTEXT_CACHE_INTERVALS,
+    CONTEXT_CACHE_MIN_TOKENS,
+    CONTEXT_CACHE_TTL_SECONDS,
+)
+from utils.bigquery_utils import prewarm_bq_client
+
 # Import the root agent
 from agents.root_agent import root_agent
 
-# ADK looks for 'root_agent' by default
-__all__ = ['root_agent']
+# Connect to BigQuery while the first user message is being typed
+if BQ_PREWARM:
+    prewarm_bq_client()
+
+# Every agent's instruction and tool declarations are static, so the
+# prompt prefix is identical across calls and is served from Gemini's
+# context cache instead of being prefilled each time
+app = App(
+    name="il_fiscal_agent",
+    root_agent=root_agent,
+    context_cache_config=ContextCacheConfig(
+        cache_intervals=CONTEXT_CACHE_INTERVALS,
+        ttl_seconds=CONTEXT_CACHE_TTL_SECONDS,
+        min_tokens=CONTEXT_CACHE_MIN_TOKENS,
+    ),
+)
+
+# ADK looks for 'app', then 'root_agent'
+__all__ = ['app', 'root_agent']
@@ -11,6 +11,7 @@ from tools.fiscal_tools import (
     find_peer_entities,
     rank_entities,
 )
+from utils.model_telemetry import record_model_request, log_model_response
 
 
 comparison_agent = Agent(
@@ -55,4 +56,7 @@ When presenting comparisons:
         find_peer_entities,
         rank_entities,
     ],
+    # Per-call token usage and latency telemetry
+    before_model_callback=record_model_request,
+    after_model_callback=log_model_response,
 )
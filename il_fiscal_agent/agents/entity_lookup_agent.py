@@ -5,16 +5,17 @@ Finds and identifies Illinois local government entities by name or code.
 """
 from google.adk.agents import Agent
 
-from config.settings import PRIMARY_MODEL
+from config.settings import LIGHT_MODEL
 from tools.fiscal_tools import (
     search_government_entity,
     get_entity_details,
 )
+from utils.model_telemetry import record_model_request, log_model_response
 
 
 entity_lookup_agent = Agent(
     name="entity_lookup_agent",
-    model=PRIMARY_MODEL,
+    model=LIGHT_MODEL,
     description="""Handles finding and identifying Illinois local government entities.
     Use this agent when the user mentions a city, village, township, district, 
     or other local government by name and needs to find or identify it.""",
@@ -45,4 +46,7 @@ Be concise but helpful. When presenting search results, format them clearly.""",
         search_government_entity,
         get_entity_details,
     ],
+    # Per-call token usage and latency telemetry
+    before_model_callback=record_model_request,
+    after_model_callback=log_model_response,
 )
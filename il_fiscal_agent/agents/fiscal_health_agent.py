@@ -10,6 +10,7 @@ from tools.fiscal_tools import (
     calculate_fiscal_health_score,
     get_entity_details,
 )
+from utils.model_telemetry import record_model_request, log_model_response
 
 
 fiscal_health_agent = Agent(
@@ -70,4 +71,7 @@ IMPORTANT CAVEATS:
         calculate_fiscal_health_score,
         get_entity_details,
     ],
+    # Per-call token usage and latency telemetry
+    before_model_callback=record_model_request,
+    after_model_callback=log_model_response,
 )
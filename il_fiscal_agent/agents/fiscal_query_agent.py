@@ -12,7 +12,10 @@ from tools.fiscal_tools import (
     get_fund_balance_data,
     get_debt_data,
     get_pension_data,
+    get_entity_financial_bundle,
 )
+from tools.tool_cache import cached_tool_result, store_tool_result
+from utils.model_telemetry import record_model_request, log_model_response
 
 
 fiscal_query_agent = Agent(
@@ -36,6 +39,8 @@ HOW TO RESPOND:
 1. You need an entity code - check state for current_entity_code first
 2. If no code in state, ask the user to specify or use entity_lookup_agent
 3. Use the appropriate tool (get_revenue_data, get_expenditure_data, etc.)
+   - For an overall financial picture, call get_entity_financial_bundle once
+     instead of the five data tools separately
 4. Present the data clearly with proper formatting
 5. Explain what the numbers mean in plain language
 
@@ -69,5 +74,12 @@ When presenting data:
         get_fund_balance_data,
         get_debt_data,
         get_pension_data,
+        get_entity_financial_bundle,
     ],
+    # Repeated data lookups are served from the tool result cache
+    before_tool_callback=cached_tool_result,
+    after_tool_callback=store_tool_result,
+    # Per-call token usage and latency telemetry
+    before_model_callback=record_model_request,
+    after_model_callback=log_model_response,
 )
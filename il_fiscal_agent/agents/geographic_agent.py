@@ -5,48 +5,43 @@ Handles county-level queries and geographic analysis.
 """
 from google.adk.agents import Agent
 
-from config.settings import PRIMARY_MODEL
+from config.settings import LIGHT_MODEL
 from tools.fiscal_tools import (
     get_county_entities,
     get_county_financial_summary,
+    get_county_overview,
 )
+from tools.tool_cache import cached_tool_result, store_tool_result
+from utils.model_telemetry import record_model_request, log_model_response
 
 
 geographic_agent = Agent(
     name="geographic_agent",
-    model=PRIMARY_MODEL,
+    model=LIGHT_MODEL,
     description="""Handles geographic and county-level queries about Illinois
     local governments. Use this for questions about what entities are in a 
     county or region.""",
-    instruction="""You are the Geographic Analysis Specialist.
-
-Your job is to answer questions about entities within geographic areas.
-
-WHEN TO ACT:
-- "What governments are in Cook County?"
-- "List all fire districts in Lake County"
-- "Show me cities in DuPage County"
-- "Give me a summary of Kane County"
-- "How many entities are in Sangamon County?"
-
-HOW TO RESPOND:
-1. For entity lists: use get_county_entities, optionally filter by type
-2. For county summaries: use get_county_financial_summary
-3. Present results organized by entity type when appropriate
-
-ILLINOIS CONTEXT:
-- 102 counties in Illinois
-- Largest: Cook County (Chicago area)
-- Entity types vary by county (not all have all types)
-- Township organization is common but not universal
-
-When presenting county data:
-- Group by entity type for readability
-- Sort by population or other relevant metric
-- Highlight notable entities
-- Note if specific entity types are missing""",
+    instruction="""You are the Geographic Analysis Specialist. You answer questions about the
+government entities in an Illinois county, e.g. fire districts in Lake County or
+a summary of Kane County.
+
+TOOLS:
+- Entity lists: get_county_entities, optionally filtered by entity type
+- County totals: get_county_financial_summary
+- Both (e.g. "overview of Kane County"): get_county_overview, one call
+
+Entity types vary by county, and township organization is not universal.
+Group results by entity type, sort by population or another relevant
+metric, highlight notable entities, and note missing entity types.""",
     tools=[
         get_county_entities,
         get_county_financial_summary,
+        get_county_overview,
     ],
+    # Repeated data lookups are served from the tool result cache
+    before_tool_callback=cached_tool_result,
+    after_tool_callback=store_tool_result,
+    # Per-call token usage and latency telemetry
+    before_model_callback=record_model_request,
+    after_model_callback=log_model_response,
 )
@@ -3,57 +3,29 @@ Greeting Agent
 
 Manages greetings, farewells, and help requests.
 """
-from typing import Optional
+from typing import Literal, Optional
 
 from google.adk.agents import Agent
 
 from config.settings import LIGHT_MODEL
+from utils.model_telemetry import record_model_request, log_model_response
 
 
 # =============================================================================
 # GREETING TOOLS
 # =============================================================================
 
-def greet_user(name: Optional[str] = None) -> str:
-    """Provides a friendly greeting to the user.
-    
-    Args:
-        name: Optional name of the user to personalize greeting
-        
-    Returns:
-        A friendly greeting message
-    """
-    if name:
-        return f"Hello, {name}! I'm ready to help you explore Illinois local government financial data. What would you like to know?"
-    return "Hello! I'm the Illinois Fiscal Data Assistant. I can help you explore financial data for over 4,000 local governments including cities, villages, townships, fire districts, and more. What would you like to know?"
+HELP_TEXT = """I can help you with:
 
+**Find Entities**: Search for any Illinois city, village, township, fire district, or other local government
 
-def say_goodbye() -> str:
-    """Provides a polite farewell message.
-    
-    Returns:
-        A friendly goodbye message
-    """
-    return "Thank you for exploring Illinois local government data with me. Feel free to return anytime you have more questions. Goodbye!"
-
-
-def provide_help() -> str:
-    """Explains what the agent can do.
-    
-    Returns:
-        Help text describing available capabilities
-    """
-    return """I can help you with:
+**Financial Data**: Get revenue, expenditure, debt, and pension information for specific entities
 
-🔍 **Find Entities**: Search for any Illinois city, village, township, fire district, or other local government
+**Comparisons**: Compare multiple entities or benchmark against peers
 
-💰 **Financial Data**: Get revenue, expenditure, debt, and pension information for specific entities
+**Fiscal Health**: Assess the financial condition of an entity
 
-📊 **Comparisons**: Compare multiple entities or benchmark against peers
-
-🏥 **Fiscal Health**: Assess the financial condition of an entity
-
-🗺️ **Geographic Analysis**: Explore entities within a county
+**Geographic Analysis**: Explore entities within a county
 
 **Example questions:**
 - "What is the property tax revenue for Springfield?"
@@ -65,6 +37,34 @@ def provide_help() -> str:
 What would you like to explore?"""
 
 
+GREETING_TEXT = "Hello! I'm the Illinois Fiscal Data Assistant. I can help you explore financial data for over 4,000 local governments including cities, villages, townships, fire districts, and more. What would you like to know?"
+
+GOODBYE_TEXT = "Thank you for exploring Illinois local government data with me. Feel free to return anytime you have more questions. Goodbye!"
+
+
+def handle_conversation(
+    kind: Literal["greet", "bye", "help"],
+    name: Optional[str] = None
+) -> str:
+    """Replies to a greeting, a farewell or a help request.
+    
+    Args:
+        kind: 'greet' for hellos, 'bye' for farewells and thanks, 'help' for
+              questions about what the assistant can do
+        name: Optional name of the user to personalize a greeting
+        
+    Returns:
+        The reply message
+    """
+    if kind == "bye":
+        return GOODBYE_TEXT
+    if kind == "help":
+        return HELP_TEXT
+    if name:
+        return f"Hello, {name}! I'm ready to help you explore Illinois local government financial data. What would you like to know?"
+    return GREETING_TEXT
+
+
 # =============================================================================
 # AGENT DEFINITION
 # =============================================================================
@@ -74,20 +74,12 @@ greeting_agent = Agent(
     model=LIGHT_MODEL,
     description="""Handles greetings, farewells, help requests, and general
     conversation. Use this for non-data queries like 'hello', 'help', 'bye'.""",
-    instruction="""You are the Greeting and Help assistant.
-
-Your job is to handle conversational elements like:
-- Greetings: "Hi", "Hello", "Good morning"
-- Farewells: "Bye", "Thanks, goodbye", "See you"
-- Help requests: "Help", "What can you do?", "How does this work?"
-
-Use the appropriate tool for each situation.
-
-Be warm and friendly but brief. For help requests, provide clear examples
-of what users can ask about.""",
-    tools=[
-        greet_user,
-        say_goodbye,
-        provide_help,
-    ],
+    instruction="""You are the Greeting and Help assistant. Reply to greetings, farewells and
+help requests ("what can you do?") by calling handle_conversation with kind
+"greet", "bye" or "help". Be warm but brief.""",
+    # One tool with an enum argument keeps the declared tool schema small
+    tools=[handle_conversation],
+    # Per-call token usage and latency telemetry
+    before_model_callback=record_model_request,
+    after_model_callback=log_model_response,
 )
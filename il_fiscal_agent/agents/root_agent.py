@@ -13,12 +13,109 @@ from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 from typing import Optional, Dict, Any
 
-import sys
-sys.path.append('/home/claude/il_fiscal_agent')
+import logging
+import re
 
-from config.settings import PRIMARY_MODEL
+from config.settings import PRIMARY_MODEL, LIGHT_MODEL, ENTITY_CODE_RE
 from agents.sub_agents import SUB_AGENTS
-from tools.fiscal_tools import ALL_TOOLS
+from tools.fiscal_tools import ALL_TOOLS, prefetch_entity_search
+from tools.tool_cache import cached_tool_result, store_tool_result
+from utils.model_telemetry import record_model_request, log_model_response
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# GUARDRAIL CONFIGURATION
+# =============================================================================
+
+# Out-of-scope topics and personal-information requests, each matched as
+# whole words in one case-insensitive pass over the message
+OUT_OF_SCOPE_KEYWORDS = (
+    "california", "new york city", "texas", "florida",
+    "federal government", "congress", "white house"
+)
+PERSONAL_INFO_KEYWORDS = (
+    "home address", "personal phone", "salary of",
+    "how much does", "private information"
+)
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one whole-word, case-insensitive alternation."""
+    return re.compile(
+        r"\b(?:" + "|".join(re.escape(k) for k in keywords) + r")\b",
+        re.IGNORECASE
+    )
+
+
+_OUT_OF_SCOPE_RE = _keyword_pattern(OUT_OF_SCOPE_KEYWORDS)
+_PERSONAL_INFO_RE = _keyword_pattern(PERSONAL_INFO_KEYWORDS)
+
+_OUT_OF_SCOPE_TEXT = """I specialize in Illinois local government financial data only. 
+                    
+I can help you with:
+- Illinois cities, villages, and towns
+- Illinois townships  
+- Fire protection districts
+- Library districts, park districts
+- School districts, community colleges
+- And other Illinois local governments
+
+Would you like to explore Illinois local government data instead?"""
+
+_PERSONAL_INFO_TEXT = """I can provide publicly available information from Annual Financial Reports, including:
+- Official contact information for government offices
+- Aggregate salary expenditures
+- Financial data and statistics
+
+I cannot provide personal information about individual employees or officials. What financial data can I help you find?"""
+
+
+# Turns the root agent can route with LIGHT_MODEL: greetings, farewells and
+# help, single-entity lookups and county listings. Anything that asks for
+# figures, comparisons or analysis stays on PRIMARY_MODEL, and that check
+# wins over a light match ("find the debt of Skokie" is not a lookup).
+_LIGHT_ROUTE_RE = re.compile(
+    r"^\s*(?:hi|hello|hey|good (?:morning|afternoon|evening)|thanks|thank you"
+    r"|bye|goodbye|help)\b"
+    r"|\b(?:what can you do|code for|look up|lookup|search for|find)\b"
+    r"|\b(?:which|what|list|show)\b.*\bin\s+[\w .'-]+\s+county\b",
+    re.IGNORECASE
+)
+_PRIMARY_ROUTE_RE = re.compile(
+    r"\b(?:compare|comparison|vs|versus|rank|top|bottom|largest|smallest"
+    r"|health|healthy|revenues?|expenditures?|spend\w*|debt|pensions?"
+    r"|tax\w*|budget|fund|per capita|why|trend)\b",
+    re.IGNORECASE
+)
+
+# Data questions naming one entity ("property tax revenue for Naperville")
+# almost always start with search_government_entity for that name. Match
+# against the message with trailing whitespace and ?.! stripped; words in
+# the name are separated by single spaces, so no two quantifiers can match
+# the same characters and the search stays linear.
+_SPECULATIVE_SEARCH_RE = re.compile(
+    r"\b(?:revenues?|expenditures?|spending|debt|pensions?|fund balances?|budget)\b"
+    r".*\b(?:for|of)\s+(?:the\s+)?([a-z][\w.'-]*(?: [\w.'-]+)*)$",
+    re.IGNORECASE
+)
+_SPECULATIVE_SEARCH_TRAILER = " \t\r\n?.!"
+# Questions naming one entity are short; longer messages aren't scanned
+_SPECULATIVE_SEARCH_MAX_LEN = 300
+
+
+def _blocked_response(text: str) -> LlmResponse:
+    """Build the model reply returned in place of a blocked request."""
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)])
+    )
+
+
+# Built once; ADK copies a callback's response into the event without
+# modifying it, so the same objects can be returned on every block
+_OUT_OF_SCOPE_RESPONSE = _blocked_response(_OUT_OF_SCOPE_TEXT)
+_PERSONAL_INFO_RESPONSE = _blocked_response(_PERSONAL_INFO_TEXT)
 
 
 # =============================================================================
@@ -40,7 +137,7 @@ def input_safety_guardrail(
     Returns an LlmResponse to block, or None to allow.
     """
     agent_name = callback_context.agent_name
-    print(f"--- Callback: input_safety_guardrail for {agent_name} ---")
+    logger.debug("--- Callback: input_safety_guardrail for %s ---", agent_name)
     
     # Get the last user message
     last_user_message = ""
@@ -48,59 +145,94 @@ def input_safety_guardrail(
         for content in reversed(llm_request.contents):
             if content.role == 'user' and content.parts:
                 if content.parts[0].text:
-                    last_user_message = content.parts[0].text.lower()
+                    last_user_message = content.parts[0].text
                     break
     
     # Check for out-of-scope requests
-    out_of_scope_keywords = [
-        "california", "new york city", "texas", "florida",
-        "federal government", "congress", "white house"
-    ]
-    
-    for keyword in out_of_scope_keywords:
-        if keyword in last_user_message:
-            return LlmResponse(
-                content=types.Content(
-                    role="model",
-                    parts=[types.Part(text=f"""I specialize in Illinois local government financial data only. 
-                    
-I can help you with:
-- Illinois cities, villages, and towns
-- Illinois townships  
-- Fire protection districts
-- Library districts, park districts
-- School districts, community colleges
-- And other Illinois local governments
-
-Would you like to explore Illinois local government data instead?""")]
-                )
-            )
+    if _OUT_OF_SCOPE_RE.search(last_user_message):
+        return _OUT_OF_SCOPE_RESPONSE
     
     # Check for inappropriate personal information requests
-    personal_info_keywords = [
-        "home address", "personal phone", "salary of", 
-        "how much does", "private information"
-    ]
-    
-    for keyword in personal_info_keywords:
-        if keyword in last_user_message:
-            return LlmResponse(
-                content=types.Content(
-                    role="model",
-                    parts=[types.Part(text="""I can provide publicly available information from Annual Financial Reports, including:
-- Official contact information for government offices
-- Aggregate salary expenditures
-- Financial data and statistics
-
-I cannot provide personal information about individual employees or officials. What financial data can I help you find?""")]
-                )
-            )
+    if _PERSONAL_INFO_RE.search(last_user_message):
+        return _PERSONAL_INFO_RESPONSE
     
     # Allow the request to proceed
-    print(f"--- Callback: Allowing request for {agent_name} ---")
+    logger.debug("--- Callback: Allowing request for %s ---", agent_name)
     return None
 
 
+def route_model(
+    callback_context: CallbackContext,
+    llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """
+    Before-model callback that sends simple turns to LIGHT_MODEL.
+    
+    The root agent's call only decides which sub-agent to delegate to, so
+    greetings, help, entity lookups and county listings don't need the
+    primary model for it. Any turn that isn't clearly simple escalates to
+    PRIMARY_MODEL, the agent's configured model.
+    
+    Returns None so the (possibly re-routed) request proceeds.
+    """
+    last_user_message = ""
+    if llm_request.contents:
+        for content in reversed(llm_request.contents):
+            if content.role == 'user' and content.parts:
+                if content.parts[0].text:
+                    last_user_message = content.parts[0].text
+                    break
+    
+    if (_LIGHT_ROUTE_RE.search(last_user_message)
+            and not _PRIMARY_ROUTE_RE.search(last_user_message)):
+        llm_request.model = LIGHT_MODEL
+    
+    callback_context.state["temp:routed_model"] = llm_request.model or PRIMARY_MODEL
+    return None
+
+
+def speculate_entity_search(
+    callback_context: CallbackContext,
+    llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """
+    Before-model callback that starts the likely entity search early.
+    
+    On the first model call of a turn, a question like "debt of Skokie"
+    starts searching for "Skokie" in the background, so the search runs
+    while the model is still choosing its first tool call.
+    
+    Returns None so the request proceeds.
+    """
+    if not llm_request.contents:
+        return None
+    
+    # Only the first call of a turn ends with the user's message; later
+    # calls end with tool responses
+    last = llm_request.contents[-1]
+    if last.role != 'user' or not last.parts or not last.parts[0].text:
+        return None
+    
+    text = last.parts[0].text.rstrip(_SPECULATIVE_SEARCH_TRAILER)
+    if len(text) > _SPECULATIVE_SEARCH_MAX_LEN:
+        return None
+    match = _SPECULATIVE_SEARCH_RE.search(text)
+    if match:
+        prefetch_entity_search(match.group(1))
+    return None
+
+
+def root_before_model(
+    callback_context: CallbackContext,
+    llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """Run the input guardrail, then speculate, route and record requests it allows."""
+    return (input_safety_guardrail(callback_context, llm_request)
+            or speculate_entity_search(callback_context, llm_request)
+            or route_model(callback_context, llm_request)
+            or record_model_request(callback_context, llm_request))
+
+
 def tool_usage_guardrail(
     tool: BaseTool,
     args: Dict[str, Any],
@@ -114,11 +246,14 @@ def tool_usage_guardrail(
     - County names are valid Illinois counties
     - Limits on result sizes
     
+    Repeated calls to read-only data tools are then answered from the
+    tool result cache.
+    
     Returns a dict to override tool result, or None to allow.
     """
     tool_name = tool.name
-    print(f"--- Callback: tool_usage_guardrail for {tool_name} ---")
-    print(f"--- Args: {args} ---")
+    logger.debug("--- Callback: tool_usage_guardrail for %s ---", tool_name)
+    logger.debug("--- Args: %s ---", args)
     
     # Validate entity code format
     if "entity_code" in args:
@@ -133,28 +268,16 @@ def tool_usage_guardrail(
     if "limit" in args:
         limit = args.get("limit", 10)
         if isinstance(limit, int) and limit > 100:
-            print(f"--- Callback: Capping limit from {limit} to 100 ---")
+            logger.debug("--- Callback: Capping limit from %s to 100 ---", limit)
             args["limit"] = 100  # Modify in place
     
-    # Allow tool execution
-    return None
+    # Serve a repeated call from the cache, or allow tool execution
+    return cached_tool_result(tool, args, tool_context)
 
 
 def _is_valid_entity_code(code: str) -> bool:
     """Validate entity code format (XXX/YYY/ZZ)."""
-    if not code:
-        return False
-    parts = code.split("/")
-    if len(parts) != 3:
-        return False
-    # Basic validation - all parts should be numeric-ish
-    try:
-        for part in parts:
-            if not part.strip():
-                return False
-    except:
-        return False
-    return True
+    return bool(code) and ENTITY_CODE_RE.fullmatch(code) is not None
 
 
 # =============================================================================
@@ -230,9 +353,11 @@ Be helpful, accurate, and accessible.""",
     # Sub-agents for delegation
     sub_agents=SUB_AGENTS,
     
-    # Safety callbacks
-    before_model_callback=input_safety_guardrail,
+    # Safety, model routing and telemetry callbacks
+    before_model_callback=root_before_model,
+    after_model_callback=log_model_response,
     before_tool_callback=tool_usage_guardrail,
+    after_tool_callback=store_tool_result,
     
     # Auto-save last response
     output_key="last_agent_response"
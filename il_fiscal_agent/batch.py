@@ -0,0 +1,232 @@
+"""
+Batch Runner for the Illinois Local Government Financial Data Agent
+
+Runs many independent prompts through the root agent, e.g. for evaluation
+sets or bulk questions like "health score for each of these entities".
+One runner and session service serve the whole batch, and prompts run
+concurrently up to a limit, so a batch takes about as long as its slowest
+prompts instead of the sum of all of them.
+
+Prompts that need no tools, e.g. summarising data already pasted into the
+prompt, can instead go through the Gemini Batch API with
+run_gemini_batch: one asynchronous job at half the per-token price, for
+work that can wait minutes rather than seconds.
+
+Fiscal health scores for a list of entity codes need no model at all:
+--health-scores computes them directly from one bundled data fetch.
+
+Usage:
+    python batch.py prompts.txt              # one prompt per line, JSON lines out
+    python batch.py prompts.txt --concurrency 4
+    python batch.py prompts.txt --gemini-batch
+    python batch.py codes.txt --health-scores
+
+    from batch import run_batch
+    results = run_batch(["Is Skokie financially healthy?", "Top 10 villages by EAV"])
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, project_root)
+
+from google import genai
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from agent import app
+from config.settings import (
+    BATCH_MAX_CONCURRENCY,
+    BATCH_POLL_SECONDS,
+    LIGHT_MODEL,
+)
+from tools.fiscal_tools import calculate_fiscal_health_scores
+
+
+BATCH_USER_ID = "batch_user"
+
+# Batch job states after which the job won't change again
+_BATCH_DONE_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+})
+
+
+async def _run_prompt(
+    runner: Runner,
+    session_service: InMemorySessionService,
+    prompt: str,
+    semaphore: asyncio.Semaphore
+) -> Dict[str, Any]:
+    """Run one prompt in its own session and collect the final response."""
+    async with semaphore:
+        session = await session_service.create_session(
+            app_name=runner.app_name,
+            user_id=BATCH_USER_ID,
+            session_id=f"batch_{uuid.uuid4().hex}"
+        )
+        content = types.Content(role='user', parts=[types.Part(text=prompt)])
+
+        response = None
+        agents = []
+        try:
+            async for event in runner.run_async(
+                user_id=BATCH_USER_ID,
+                session_id=session.id,
+                new_message=content
+            ):
+                if event.author not in agents:
+                    agents.append(event.author)
+                if event.is_final_response() and event.content and event.content.parts:
+                    response = event.content.parts[0].text
+        except Exception as e:
+            return {"prompt": prompt, "status": "error", "error_message": str(e), "agents": agents}
+
+    return {"prompt": prompt, "status": "success", "response": response, "agents": agents}
+
+
+async def run_batch_async(
+    prompts: List[str],
+    max_concurrency: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run prompts through the root agent concurrently.
+
+    Each prompt gets a fresh session, so prompts don't see each other's
+    context. Read-only tool results are shared through the tool cache.
+
+    Args:
+        prompts: User messages to run
+        max_concurrency: Prompts in flight at once (default: BATCH_MAX_CONCURRENCY)
+
+    Returns:
+        One dict per prompt, in input order, with 'status', the final
+        'response' (or 'error_message') and the agents that handled it
+    """
+    session_service = InMemorySessionService()
+    runner = Runner(app=app, session_service=session_service)
+    semaphore = asyncio.Semaphore(max_concurrency or BATCH_MAX_CONCURRENCY)
+
+    return await asyncio.gather(*(
+        _run_prompt(runner, session_service, prompt, semaphore) for prompt in prompts
+    ))
+
+
+def run_batch(
+    prompts: List[str],
+    max_concurrency: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Synchronous wrapper around run_batch_async.
+
+    Must not be called from inside a running event loop; await
+    run_batch_async directly there instead.
+    """
+    return asyncio.run(run_batch_async(prompts, max_concurrency))
+
+
+# =============================================================================
+# GEMINI BATCH API
+# =============================================================================
+
+def run_gemini_batch(
+    prompts: List[str],
+    model: str = LIGHT_MODEL,
+    instruction: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Answer tool-free prompts with one Gemini Batch API job.
+
+    Batch requests are single model calls: the model can't call the
+    fiscal data tools, so each prompt must carry the data it needs. Use
+    run_batch for questions the agent has to look up.
+
+    Args:
+        prompts: Self-contained prompts
+        model: Gemini model to run them on
+        instruction: Optional system instruction shared by every prompt
+
+    Returns:
+        One dict per prompt, in input order, with 'status' and the
+        'response' text (or 'error_message')
+    """
+    requests = []
+    for prompt in prompts:
+        request = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+        if instruction:
+            request["config"] = {"system_instruction": instruction}
+        requests.append(request)
+
+    client = genai.Client()
+    job = client.batches.create(
+        model=model,
+        src=requests,
+        config={"display_name": f"il-fiscal-batch-{uuid.uuid4().hex[:8]}"},
+    )
+
+    while job.state.name not in _BATCH_DONE_STATES:
+        time.sleep(BATCH_POLL_SECONDS)
+        job = client.batches.get(name=job.name)
+
+    if job.state.name != "JOB_STATE_SUCCEEDED":
+        error = f"Batch job {job.name} ended in {job.state.name}"
+        return [{"prompt": p, "status": "error", "error_message": error} for p in prompts]
+
+    results = []
+    for prompt, inlined in zip(prompts, job.dest.inlined_responses):
+        if inlined.response is not None:
+            results.append({"prompt": prompt, "status": "success", "response": inlined.response.text})
+        else:
+            results.append({"prompt": prompt, "status": "error", "error_message": str(inlined.error)})
+    return results
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a file of prompts through the agent")
+    parser.add_argument("prompts_file", help="Text file with one prompt per line")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BATCH_MAX_CONCURRENCY,
+        help=f"Prompts in flight at once (default: {BATCH_MAX_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--gemini-batch",
+        action="store_true",
+        help="Submit tool-free prompts as one Gemini Batch API job instead"
+    )
+    parser.add_argument(
+        "--health-scores",
+        action="store_true",
+        help="Treat each line as an entity code and print its fiscal health score"
+    )
+    args = parser.parse_args()
+
+    with open(args.prompts_file, encoding="utf-8") as f:
+        prompts = [line.strip() for line in f if line.strip()]
+
+    if args.health_scores:
+        scores = calculate_fiscal_health_scores(prompts)
+        results = [{"entity_code": code, **score} for code, score in scores.items()]
+    elif args.gemini_batch:
+        results = run_gemini_batch(prompts)
+    else:
+        results = run_batch(prompts, args.concurrency)
+
+    for result in results:
+        print(json.dumps(result, default=str))
@@ -2,6 +2,10 @@
 Configuration settings for Illinois Local Government Financial Data Agent
 """
 import os
+import re
+import sys
+from types import MappingProxyType
+from typing import Optional
 
 # =============================================================================
 # GOOGLE CLOUD CONFIGURATION
@@ -10,14 +14,45 @@ GCP_PROJECT_ID = os.environ.get("GOOGLE_CLOUD_PROJECT", "your-project-id")
 GCP_LOCATION = os.environ.get("GOOGLE_CLOUD_LOCATION", "us-central1")
 BQ_DATASET = os.environ.get("BQ_DATASET", "il_local_gov_finance")
 
+# HTTP connections the BigQuery client keeps open; concurrent tool calls
+# beyond this queue for a connection
+BQ_HTTP_POOL_SIZE = int(os.environ.get("BQ_HTTP_POOL_SIZE", "16"))
+
+# Open the BigQuery connection and load the entity index in the background
+# when the agent is imported, instead of on the first tool call
+BQ_PREWARM = os.environ.get("BQ_PREWARM", "1") == "1"
+
+# Local SQLite snapshot of UnitData + UnitStats (built by
+# scripts/build_local_snapshot.py); entity lookups use it when present
+ENTITY_SNAPSHOT_PATH = os.environ.get(
+    "ENTITY_SNAPSHOT_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "entities.sqlite")
+)
+
 # =============================================================================
 # MODEL CONFIGURATION
 # =============================================================================
 # Primary model for complex reasoning tasks
 PRIMARY_MODEL = "gemini-2.0-flash"
 
-# Lighter model for simple tasks (greetings, clarifications)
-LIGHT_MODEL = "gemini-2.0-flash"
+# Lighter model for simple tasks (greetings, clarifications, lookups).
+# Flash-Lite supports function calling at lower latency and cost; set
+# LIGHT_MODEL=gemini-2.0-flash if a light-model agent needs more capability.
+LIGHT_MODEL = os.environ.get("LIGHT_MODEL", "gemini-2.0-flash-lite")
+
+# Gemini context caching for each agent's static instruction and tool
+# declarations: cache lifetime, invocations before a cache is refreshed,
+# and the smallest prompt worth caching. Instructions only change on
+# deploy, so caches live for an hour; ADK recreates them on expiry.
+CONTEXT_CACHE_TTL_SECONDS = int(os.environ.get("CONTEXT_CACHE_TTL_SECONDS", "3600"))
+CONTEXT_CACHE_INTERVALS = int(os.environ.get("CONTEXT_CACHE_INTERVALS", "10"))
+CONTEXT_CACHE_MIN_TOKENS = int(os.environ.get("CONTEXT_CACHE_MIN_TOKENS", "1024"))
+
+# Prompts run at once by batch.py; keep within the model's rate limit
+BATCH_MAX_CONCURRENCY = int(os.environ.get("BATCH_MAX_CONCURRENCY", "8"))
+
+# Seconds between status checks of a Gemini Batch API job
+BATCH_POLL_SECONDS = int(os.environ.get("BATCH_POLL_SECONDS", "30"))
 
 # =============================================================================
 # BIGQUERY TABLE NAMES
@@ -38,8 +73,11 @@ TABLES = {
     "component": f"{GCP_PROJECT_ID}.{BQ_DATASET}.Component",
     "governmental_entities": f"{GCP_PROJECT_ID}.{BQ_DATASET}.GovernmentalEntities",
     "reporting": f"{GCP_PROJECT_ID}.{BQ_DATASET}.Reporting",
-    # Pre-computed views (you'll create these)
+    # Pre-computed views (created by sql/bigquery_setup.sql)
     "entity_summary": f"{GCP_PROJECT_ID}.{BQ_DATASET}.vw_EntitySummary",
+    "county_summary": f"{GCP_PROJECT_ID}.{BQ_DATASET}.vw_CountySummary",
+    "entity_totals": f"{GCP_PROJECT_ID}.{BQ_DATASET}.vw_EntityTotals",
+    "unit_metrics": f"{GCP_PROJECT_ID}.{BQ_DATASET}.vw_UnitMetrics",
     "fiscal_health": f"{GCP_PROJECT_ID}.{BQ_DATASET}.vw_FiscalHealth",
 }
 
@@ -101,6 +139,18 @@ EXPENDITURE_CATEGORIES = {
     "280t": "Contingency"
 }
 
+# =============================================================================
+# FUND BALANCE CATEGORY MAPPINGS
+# =============================================================================
+FUND_BALANCE_CATEGORIES = {
+    "302t": "Nonspendable",
+    "303t": "Restricted",
+    "304t": "Committed",
+    "305t": "Assigned",
+    "307t": "Unassigned",
+    "308t": "Total Fund Balance"
+}
+
 # =============================================================================
 # ENTITY TYPE MAPPINGS
 # =============================================================================
@@ -200,3 +250,71 @@ ILLINOIS_COUNTIES = [
     "Vermilion", "Wabash", "Warren", "Washington", "Wayne", "White", "Whiteside",
     "Will", "Williamson", "Winnebago", "Woodford"
 ]
+
+
+def _county_key(name: str) -> str:
+    """Normalise a county name: 'DuPage County', 'Dupage' -> 'dupage'."""
+    key = name.lower().replace(".", "").replace("'", "").replace(" ", "")
+    return key[:-len("county")] if key.endswith("county") and key != "county" else key
+
+
+# Normalised name -> name as listed above (and as stored in UnitData).
+# Normalising already folds DuPage/Dupage, De Kalb/Dekalb, La Salle/Lasalle,
+# McHenry/Mchenry and St Clair/St. Clair together; only true alternates
+# need an alias.
+COUNTY_CANONICAL = {_county_key(county): county for county in ILLINOIS_COUNTIES}
+COUNTY_CANONICAL.update({
+    "saintclair": "St. Clair",
+    "jodavies": "Jo Daviess",
+})
+
+
+def normalize_county(county: str) -> Optional[str]:
+    """
+    Map a user-typed county name to its name in the data.
+    
+    Accepts any casing, spacing or punctuation and an optional 'County'
+    suffix, e.g. 'DuPage County' -> 'Dupage', 'St Clair' -> 'St. Clair'.
+    
+    Returns:
+        The canonical county name, or None if it isn't an Illinois county
+    """
+    return COUNTY_CANONICAL.get(_county_key(county or ""))
+
+
+# =============================================================================
+# READ-ONLY LOOKUP TABLES
+# =============================================================================
+# The mappings above are shared by every tool call; freeze them so a tool
+# can't mutate them for everyone else. Tool results that embed one must
+# copy it with dict(), since proxies aren't JSON-serializable.
+FUND_TYPES = MappingProxyType(FUND_TYPES)
+REVENUE_CATEGORIES = MappingProxyType(REVENUE_CATEGORIES)
+EXPENDITURE_CATEGORIES = MappingProxyType(EXPENDITURE_CATEGORIES)
+FUND_BALANCE_CATEGORIES = MappingProxyType(FUND_BALANCE_CATEGORIES)
+ENTITY_TYPES = MappingProxyType(ENTITY_TYPES)
+COUNTY_CANONICAL = MappingProxyType(COUNTY_CANONICAL)
+FISCAL_HEALTH_THRESHOLDS = MappingProxyType({
+    metric: MappingProxyType(thresholds)
+    for metric, thresholds in FISCAL_HEALTH_THRESHOLDS.items()
+})
+
+# Entity codes are three numeric segments, e.g. '016/020/32'. Shared by
+# the root agent's tool guardrail and the tools, so both accept the same codes.
+ENTITY_CODE_RE = re.compile(r"[0-9]{1,4}/[0-9]{1,4}/[0-9]{1,4}")
+
+# Entity type names indexed by type code (the last part of an entity code,
+# e.g. 32 in "016/020/32" = Village), with None for unused codes
+ENTITY_TYPE_TABLE = tuple(
+    sys.intern(ENTITY_TYPES[code]) if code in ENTITY_TYPES else None
+    for code in range(max(ENTITY_TYPES) + 1)
+)
+
+
+def entity_type_for_code(entity_code: str) -> Optional[str]:
+    """Entity type named by an entity code's last part, or None if unknown."""
+    type_code = entity_code.rpartition("/")[2].strip()
+    if not type_code.isdigit():
+        return None
+    type_code = int(type_code)
+    return ENTITY_TYPE_TABLE[type_code] if type_code < len(ENTITY_TYPE_TABLE) else None
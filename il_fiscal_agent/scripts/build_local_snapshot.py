@@ -0,0 +1,88 @@
+"""
+Build the local entity snapshot
+
+Copies the UnitData + UnitStats join from BigQuery into a SQLite file,
+which bigquery_utils then uses for entity details and entity search
+instead of querying BigQuery. Rebuild it after loading a new fiscal year.
+
+Usage:
+    python scripts/build_local_snapshot.py
+    python scripts/build_local_snapshot.py --output /path/to/entities.sqlite
+"""
+import argparse
+import os
+import sqlite3
+import sys
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from config.settings import ENTITY_SNAPSHOT_PATH, TABLES
+from utils.bigquery_utils import ENTITY_DETAIL_COLUMNS, get_bq_client
+
+
+def build_snapshot(output_path: str) -> int:
+    """
+    Write the entity snapshot to output_path, replacing any existing file.
+    
+    Returns:
+        Number of entities written
+    """
+    query = f"""
+    SELECT {ENTITY_DETAIL_COLUMNS}
+    FROM `{TABLES['unit_data']}` ud
+    LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
+    """
+    result = get_bq_client().query_and_wait(query)
+    columns = [field.name for field in result.schema]
+    # Take values by position; Row.values() deep-copies them
+    positions = range(len(columns))
+    rows = [tuple(row[i] for i in positions) for row in result]
+    
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    tmp_path = output_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    
+    conn = sqlite3.connect(tmp_path)
+    column_defs = ", ".join(
+        f"{name} TEXT PRIMARY KEY" if name == "Code" else name for name in columns
+    )
+    conn.execute(f"CREATE TABLE entities ({column_defs})")
+    conn.executemany(
+        f"INSERT INTO entities VALUES ({', '.join('?' for _ in columns)})",
+        rows
+    )
+    conn.execute("CREATE INDEX idx_entities_name ON entities (UnitName COLLATE NOCASE)")
+    conn.execute("CREATE INDEX idx_entities_county ON entities (County)")
+    # Peers of the same type in a population band (get_peer_entities)
+    conn.execute("CREATE INDEX idx_entities_peers ON entities (EntityType, Population)")
+    # Filtered top-N rankings by population and EAV (rank_entities_by_metric)
+    conn.execute(
+        "CREATE INDEX idx_entities_rank_pop ON entities "
+        "(EntityType COLLATE NOCASE, County COLLATE NOCASE, Population)"
+    )
+    conn.execute(
+        "CREATE INDEX idx_entities_rank_eav ON entities "
+        "(EntityType COLLATE NOCASE, County COLLATE NOCASE, EquitalizedAssessedValue)"
+    )
+    conn.commit()
+    conn.close()
+    
+    # Swap in the finished file so a running agent never reads a partial one
+    os.replace(tmp_path, output_path)
+    return len(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the local entity snapshot from BigQuery")
+    parser.add_argument(
+        "--output",
+        default=ENTITY_SNAPSHOT_PATH,
+        help=f"SQLite file to write (default: {ENTITY_SNAPSHOT_PATH})"
+    )
+    args = parser.parse_args()
+    
+    count = build_snapshot(args.output)
+    print(f"✅ Wrote {count} entities to {args.output}")
@@ -34,18 +34,115 @@
 -- 6. Enable "Auto detect" for schema
 
 -- =============================================================================
--- STEP 3: Create Views for Common Queries
+-- STEP 3: Cluster Tables for Performance (optional)
+-- =============================================================================
+-- BigQuery doesn't use traditional indexes, but you can:
+-- 1. Partition tables by date if you have multi-year data
+-- 2. Cluster tables by frequently filtered columns
+--
+-- Run this before STEP 4: the materialized views read these tables, and
+-- replacing a table invalidates the materialized views built on it. To
+-- recluster later, drop and recreate the materialized views afterwards.
+
+-- Cluster UnitData by the search/sort columns (entity search orders by
+-- UnitName, county endpoints filter by County) so scans prune blocks
+CREATE OR REPLACE TABLE `your-project-id.il_local_gov_finance.UnitData`
+CLUSTER BY UnitName, County
+AS SELECT * FROM `your-project-id.il_local_gov_finance.UnitData`;
+
+-- Cluster UnitStats by Code (the join key) and Pop (the default rank metric)
+CREATE OR REPLACE TABLE `your-project-id.il_local_gov_finance.UnitStats`
+CLUSTER BY Code, Pop
+AS SELECT * FROM `your-project-id.il_local_gov_finance.UnitStats`;
+
+-- Cluster the fact tables by Code: every per-entity tool is a
+-- WHERE Code = @code lookup, so clustering lets BigQuery read only the
+-- blocks for that entity instead of scanning the whole table. Category is
+-- the ORDER BY of the revenue, expenditure and fund balance queries.
+-- The AFR extract holds a single fiscal year with no date column, so
+-- there is nothing to partition on; add PARTITION BY once multi-year
+-- data is loaded.
+CREATE OR REPLACE TABLE `your-project-id.il_local_gov_finance.Revenues`
+CLUSTER BY Code, Category
+AS SELECT * FROM `your-project-id.il_local_gov_finance.Revenues`;
+
+CREATE OR REPLACE TABLE `your-project-id.il_local_gov_finance.Expenditures`
+CLUSTER BY Code, Category
+AS SELECT * FROM `your-project-id.il_local_gov_finance.Expenditures`;
+
+CREATE OR REPLACE TABLE `your-project-id.il_local_gov_finance.FundBalances`
+CLUSTER BY Code, Category
+AS SELECT * FROM `your-project-id.il_local_gov_finance.FundBalances`;
+
+CREATE OR REPLACE TABLE `your-project-id.il_local_gov_finance.Indebtedness`
+CLUSTER BY Code
+AS SELECT * FROM `your-project-id.il_local_gov_finance.Indebtedness`;
+
+CREATE OR REPLACE TABLE `your-project-id.il_local_gov_finance.Pensions`
+CLUSTER BY Code
+AS SELECT * FROM `your-project-id.il_local_gov_finance.Pensions`;
+
+CREATE OR REPLACE TABLE `your-project-id.il_local_gov_finance.Assets`
+CLUSTER BY Code
+AS SELECT * FROM `your-project-id.il_local_gov_finance.Assets`;
+
+CREATE OR REPLACE TABLE `your-project-id.il_local_gov_finance.CapitalOutlay`
+CLUSTER BY Code
+AS SELECT * FROM `your-project-id.il_local_gov_finance.CapitalOutlay`;
+
+-- Check the effect with a dry run, e.g.:
+-- bq query --dry_run --use_legacy_sql=false \
+--   'SELECT Code FROM `your-project-id.il_local_gov_finance.UnitData` ORDER BY UnitName LIMIT 10'
+-- bq query --dry_run --use_legacy_sql=false \
+--   'SELECT * FROM `your-project-id.il_local_gov_finance.Revenues` WHERE Code = "016/030/32"'
+
+
+-- =============================================================================
+-- STEP 4: Create Views for Common Queries
 -- =============================================================================
 
 -- -----------------------------------------------------------------------------
--- View: Entity Summary (Joins UnitData with UnitStats)
+-- Materialized View: Entity Summary (Joins UnitData with UnitStats)
 -- -----------------------------------------------------------------------------
-CREATE OR REPLACE VIEW `your-project-id.il_local_gov_finance.vw_EntitySummary` AS
+-- Materialized so county listings read precomputed rows instead of
+-- re-joining on every call. A LEFT JOIN can't be refreshed incrementally,
+-- so BigQuery serves it within max_staleness and refreshes it hourly;
+-- the data only changes when a fiscal year is loaded. County is also
+-- stored lowercased as the cluster key, as in vw_UnitMetrics, so the
+-- case-insensitive county filter can prune blocks. Earlier versions of
+-- this script created it as a plain view, or as a materialized view
+-- without CountyKey; drop those once, and leave the current materialized
+-- view alone on later runs.
+IF EXISTS (
+    SELECT 1 FROM `your-project-id.il_local_gov_finance`.INFORMATION_SCHEMA.TABLES
+    WHERE table_name = 'vw_EntitySummary' AND table_type = 'VIEW'
+) THEN
+    DROP VIEW `your-project-id.il_local_gov_finance.vw_EntitySummary`;
+ELSEIF EXISTS (
+    SELECT 1 FROM `your-project-id.il_local_gov_finance`.INFORMATION_SCHEMA.TABLES
+    WHERE table_name = 'vw_EntitySummary' AND table_type = 'MATERIALIZED VIEW'
+) AND NOT EXISTS (
+    SELECT 1 FROM `your-project-id.il_local_gov_finance`.INFORMATION_SCHEMA.COLUMNS
+    WHERE table_name = 'vw_EntitySummary' AND column_name = 'CountyKey'
+) THEN
+    DROP MATERIALIZED VIEW `your-project-id.il_local_gov_finance.vw_EntitySummary`;
+END IF;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS `your-project-id.il_local_gov_finance.vw_EntitySummary`
+CLUSTER BY CountyKey, EntityType
+OPTIONS (
+    enable_refresh = true,
+    refresh_interval_minutes = 60,
+    max_staleness = INTERVAL '4' HOUR,
+    allow_non_incremental_definition = true
+)
+AS
 SELECT 
     ud.Code,
     ud.UnitName,
     ud.Description AS EntityType,
     ud.County,
+    LOWER(ud.County) AS CountyKey,
     ud.C4 AS EntityTypeCode,
     
     -- Contact Information
@@ -235,24 +332,137 @@ LEFT JOIN pension_funded pf ON es.Code = pf.Code;
 
 
 -- -----------------------------------------------------------------------------
--- View: County Summary
+-- Materialized View: County Summary
 -- -----------------------------------------------------------------------------
-CREATE OR REPLACE VIEW `your-project-id.il_local_gov_finance.vw_CountySummary` AS
+-- One precomputed row per county for get_county_summary. Materialized
+-- views can't read other views, so this aggregates the base tables
+-- directly, and can't be ordered; sort when querying. Clustered on the
+-- lowercased county, and replaces earlier versions, as for vw_EntitySummary.
+IF EXISTS (
+    SELECT 1 FROM `your-project-id.il_local_gov_finance`.INFORMATION_SCHEMA.TABLES
+    WHERE table_name = 'vw_CountySummary' AND table_type = 'VIEW'
+) THEN
+    DROP VIEW `your-project-id.il_local_gov_finance.vw_CountySummary`;
+ELSEIF EXISTS (
+    SELECT 1 FROM `your-project-id.il_local_gov_finance`.INFORMATION_SCHEMA.TABLES
+    WHERE table_name = 'vw_CountySummary' AND table_type = 'MATERIALIZED VIEW'
+) AND NOT EXISTS (
+    SELECT 1 FROM `your-project-id.il_local_gov_finance`.INFORMATION_SCHEMA.COLUMNS
+    WHERE table_name = 'vw_CountySummary' AND column_name = 'CountyKey'
+) THEN
+    DROP MATERIALIZED VIEW `your-project-id.il_local_gov_finance.vw_CountySummary`;
+END IF;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS `your-project-id.il_local_gov_finance.vw_CountySummary`
+CLUSTER BY CountyKey
+OPTIONS (
+    enable_refresh = true,
+    refresh_interval_minutes = 60,
+    max_staleness = INTERVAL '4' HOUR,
+    allow_non_incremental_definition = true
+)
+AS
 SELECT 
-    County,
-    COUNT(DISTINCT Code) AS EntityCount,
-    COUNT(DISTINCT EntityType) AS EntityTypeCount,
-    SUM(Population) AS TotalPopulation,
-    SUM(EquitalizedAssessedValue) AS TotalEAV,
-    SUM(FullTimeEmployees) AS TotalFullTimeEmployees,
-    SUM(PartTimeEmployees) AS TotalPartTimeEmployees,
-    COUNTIF(HomeRule = 'Y') AS HomeRuleCount,
-    COUNTIF(HasDebt = 'Y') AS EntitiesWithDebt
-FROM `your-project-id.il_local_gov_finance.vw_EntitySummary`
-GROUP BY County
-ORDER BY TotalPopulation DESC;
+    ud.County,
+    LOWER(ud.County) AS CountyKey,
+    COUNT(DISTINCT ud.Code) AS EntityCount,
+    COUNT(DISTINCT ud.Description) AS EntityTypeCount,
+    SUM(us.Pop) AS TotalPopulation,
+    SUM(us.EAV) AS TotalEAV,
+    SUM(us.FULL_EMP) AS TotalFullTimeEmployees,
+    SUM(us.PART_EMP) AS TotalPartTimeEmployees,
+    COUNTIF(us.HomeRule = 'Y') AS HomeRuleCount,
+    COUNTIF(us.Debt = 'Y') AS EntitiesWithDebt
+FROM `your-project-id.il_local_gov_finance.UnitData` ud
+LEFT JOIN `your-project-id.il_local_gov_finance.UnitStats` us 
+    ON ud.Code = us.Code
+GROUP BY ud.County;
+
+
+-- -----------------------------------------------------------------------------
+-- Materialized View: Entity Totals
+-- -----------------------------------------------------------------------------
+-- One precomputed row of financial totals per entity, so comparisons read
+-- a row per entity instead of summing its revenue and expenditure rows.
+-- Reads the base tables for the same reason as vw_CountySummary.
+CREATE MATERIALIZED VIEW IF NOT EXISTS `your-project-id.il_local_gov_finance.vw_EntityTotals`
+CLUSTER BY Code
+OPTIONS (
+    enable_refresh = true,
+    refresh_interval_minutes = 60,
+    max_staleness = INTERVAL '4' HOUR,
+    allow_non_incremental_definition = true
+)
+AS
+WITH revenue_totals AS (
+    SELECT Code, SUM(COALESCE(GN, 0) + COALESCE(SR, 0) + COALESCE(CP, 0) + COALESCE(DS, 0) +
+                     COALESCE(EP, 0) + COALESCE(TS, 0) + COALESCE(FD, 0) + COALESCE(DP, 0)) AS TotalRevenue
+    FROM `your-project-id.il_local_gov_finance.Revenues`
+    GROUP BY Code
+),
+expenditure_totals AS (
+    SELECT Code, SUM(COALESCE(GN, 0) + COALESCE(SR, 0) + COALESCE(CP, 0) + COALESCE(DS, 0) +
+                     COALESCE(EP, 0) + COALESCE(TS, 0) + COALESCE(FD, 0) + COALESCE(DP, 0)) AS TotalExpenditure
+    FROM `your-project-id.il_local_gov_finance.Expenditures`
+    GROUP BY Code
+),
+unassigned_balance AS (
+    SELECT Code, COALESCE(GN, 0) AS UnassignedBalance
+    FROM `your-project-id.il_local_gov_finance.FundBalances`
+    WHERE Category = '307t'
+),
+debt_totals AS (
+    SELECT Code, COALESCE(t404, 0) + COALESCE(t410, 0) AS TotalDebt
+    FROM `your-project-id.il_local_gov_finance.Indebtedness`
+)
+SELECT 
+    ud.Code,
+    COALESCE(r.TotalRevenue, 0) AS TotalRevenue,
+    COALESCE(e.TotalExpenditure, 0) AS TotalExpenditure,
+    COALESCE(ub.UnassignedBalance, 0) AS UnassignedBalance,
+    COALESCE(d.TotalDebt, 0) AS TotalDebt
+FROM `your-project-id.il_local_gov_finance.UnitData` ud
+LEFT JOIN revenue_totals r ON ud.Code = r.Code
+LEFT JOIN expenditure_totals e ON ud.Code = e.Code
+LEFT JOIN unassigned_balance ub ON ud.Code = ub.Code
+LEFT JOIN debt_totals d ON ud.Code = d.Code;
 
 
+-- -----------------------------------------------------------------------------
+-- Materialized View: Unit Metrics
+-- -----------------------------------------------------------------------------
+-- One row per (entity, rankable metric) for rank_entities_by_metric, so
+-- every ranking is the same query over one clustered table. Entity type
+-- and county are also stored lowercased as cluster keys, since filtering
+-- on LOWER(column) can't prune blocks.
+CREATE MATERIALIZED VIEW IF NOT EXISTS `your-project-id.il_local_gov_finance.vw_UnitMetrics`
+CLUSTER BY Metric, EntityTypeKey, CountyKey
+OPTIONS (
+    enable_refresh = true,
+    refresh_interval_minutes = 60,
+    max_staleness = INTERVAL '4' HOUR,
+    allow_non_incremental_definition = true
+)
+AS
+SELECT 
+    ud.Code,
+    ud.UnitName,
+    ud.Description AS EntityType,
+    ud.County,
+    LOWER(ud.Description) AS EntityTypeKey,
+    LOWER(ud.County) AS CountyKey,
+    m.Metric,
+    m.Value
+FROM `your-project-id.il_local_gov_finance.UnitData` ud
+JOIN `your-project-id.il_local_gov_finance.UnitStats` us 
+    ON ud.Code = us.Code
+CROSS JOIN UNNEST([
+    STRUCT('population' AS Metric, CAST(us.Pop AS FLOAT64) AS Value),
+    ('eav', CAST(us.EAV AS FLOAT64)),
+    ('employees', CAST(COALESCE(us.FULL_EMP, 0) + COALESCE(us.PART_EMP, 0) AS FLOAT64))
+]) m
+WHERE m.Value IS NOT NULL;
+
 -- -----------------------------------------------------------------------------
 -- View: Entity Type Summary
 -- -----------------------------------------------------------------------------
@@ -270,17 +480,34 @@ GROUP BY EntityType, EntityTypeCode
 ORDER BY EntityCount DESC;
 
 
--- =============================================================================
--- STEP 4: Create Indexes for Performance (optional)
--- =============================================================================
--- BigQuery doesn't use traditional indexes, but you can:
--- 1. Partition tables by date if you have multi-year data
--- 2. Cluster tables by frequently filtered columns
-
--- Example: Cluster UnitData by County for faster county-based queries
--- CREATE OR REPLACE TABLE `your-project-id.il_local_gov_finance.UnitData_Clustered`
--- CLUSTER BY County
--- AS SELECT * FROM `your-project-id.il_local_gov_finance.UnitData`;
+-- -----------------------------------------------------------------------------
+-- Materialized View: Unit With Stats (access API)
+-- -----------------------------------------------------------------------------
+-- Materialized join of UnitData and UnitStats for the API's county and
+-- rank endpoints (enable with BQ_UNIT_WITH_STATS=1). A LEFT JOIN view is
+-- non-incremental, so BigQuery serves it within max_staleness and
+-- refreshes it on the interval below.
+CREATE MATERIALIZED VIEW IF NOT EXISTS `your-project-id.il_local_gov_finance.unit_with_stats`
+CLUSTER BY County, Description
+OPTIONS (
+    enable_refresh = true,
+    refresh_interval_minutes = 60,
+    max_staleness = INTERVAL '4' HOUR,
+    allow_non_incremental_definition = true
+)
+AS
+SELECT 
+    ud.Code,
+    ud.UnitName,
+    ud.Description,
+    ud.County,
+    us.Pop,
+    us.EAV,
+    us.FULL_EMP,
+    us.PART_EMP
+FROM `your-project-id.il_local_gov_finance.UnitData` ud
+LEFT JOIN `your-project-id.il_local_gov_finance.UnitStats` us 
+    ON ud.Code = us.Code;
 
 
 -- =============================================================================
@@ -68,17 +68,27 @@ MOCK_REVENUES = {
 # TEST TOOLS (Mock implementations)
 # =============================================================================
 
+# Lowercased names and search result rows, built once so a search is a
+# scan over plain strings
+_MOCK_SEARCH_NAMES = tuple(entity["UnitName"].lower() for entity in MOCK_ENTITIES.values())
+_MOCK_SEARCH_ROWS = tuple(
+    {
+        "Code": code,
+        "UnitName": entity["UnitName"],
+        "EntityType": entity["EntityType"],
+        "County": entity["County"]
+    }
+    for code, entity in MOCK_ENTITIES.items()
+)
+
+
 def mock_search_entity(search_term: str) -> dict:
     """Mock entity search for testing."""
-    results = []
-    for code, entity in MOCK_ENTITIES.items():
-        if search_term.lower() in entity["UnitName"].lower():
-            results.append({
-                "Code": code,
-                "UnitName": entity["UnitName"],
-                "EntityType": entity["EntityType"],
-                "County": entity["County"]
-            })
+    term = search_term.lower()
+    results = [
+        dict(row) for name, row in zip(_MOCK_SEARCH_NAMES, _MOCK_SEARCH_ROWS)
+        if term in name
+    ]
     
     if results:
         return {"status": "success", "entities": results}
@@ -118,6 +128,31 @@ test_agent = Agent(
 # TEST RUNNER
 # =============================================================================
 
+async def _ask(runner: Runner, session_service: InMemorySessionService, user_id: str, query: str) -> str:
+    """Send one query in its own session and return the final response text."""
+    session = await session_service.create_session(
+        app_name=runner.app_name,
+        user_id=user_id
+    )
+    
+    content = types.Content(
+        role='user',
+        parts=[types.Part(text=query)]
+    )
+    
+    response = ""
+    async for event in runner.run_async(
+        user_id=user_id,
+        session_id=session.id,
+        new_message=content
+    ):
+        if event.is_final_response():
+            if event.content and event.content.parts:
+                response = event.content.parts[0].text
+            break
+    return response
+
+
 async def run_test():
     """Run test conversation with the agent."""
     print("=" * 60)
@@ -128,14 +163,6 @@ async def run_test():
     session_service = InMemorySessionService()
     APP_NAME = "test_fiscal_app"
     USER_ID = "test_user"
-    SESSION_ID = "test_session_001"
-    
-    session = await session_service.create_session(
-        app_name=APP_NAME,
-        user_id=USER_ID,
-        session_id=SESSION_ID
-    )
-    print(f"✅ Session created: {SESSION_ID}")
     
     runner = Runner(
         agent=test_agent,
@@ -152,25 +179,16 @@ async def run_test():
         "What is the revenue for 016/020/32?"
     ]
     
-    for query in test_queries:
+    # Each query names its entity, so they don't need a shared history:
+    # run them concurrently, one session each, and print in order
+    responses = await asyncio.gather(*(
+        _ask(runner, session_service, USER_ID, query) for query in test_queries
+    ))
+    
+    for query, response in zip(test_queries, responses):
         print(f">>> User: {query}")
-        
-        content = types.Content(
-            role='user',
-            parts=[types.Part(text=query)]
-        )
-        
-        async for event in runner.run_async(
-            user_id=USER_ID,
-            session_id=SESSION_ID,
-            new_message=content
-        ):
-            if event.is_final_response():
-                if event.content and event.content.parts:
-                    response = event.content.parts[0].text
-                    print(f"<<< Agent: {response[:500]}...")  # Truncate for readability
-                break
-        
+        if response:
+            print(f"<<< Agent: {response[:500]}...")  # Truncate for readability
         print()
     
     print("=" * 60)
@@ -4,21 +4,27 @@ Tools for the Illinois Local Government Financial Data Agent
 These tools provide the agent with specific capabilities to query and analyze
 financial data from Illinois local governments.
 """
-from typing import Optional, Dict, Any, List
+from bisect import bisect_left, bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable
+from cachetools import TTLCache
 from google.adk.tools.tool_context import ToolContext
+import asyncio
+import logging
+import threading
 
 # Import utility functions
-import sys
-sys.path.append('/home/claude/il_fiscal_agent')
-
 from utils.bigquery_utils import (
     search_entities,
+    is_known_entity_code,
     get_entity_by_code,
     get_entity_revenues,
     get_entity_expenditures,
     get_entity_fund_balances,
     get_entity_debt,
     get_entity_pensions,
+    get_entity_bundle,
+    get_comparison_data,
     get_entities_by_county,
     get_peer_entities,
     rank_entities_by_metric,
@@ -28,15 +34,170 @@ from config.settings import (
     FUND_TYPES,
     REVENUE_CATEGORIES,
     EXPENDITURE_CATEGORIES,
-    ENTITY_TYPES,
-    FISCAL_HEALTH_THRESHOLDS
+    FUND_BALANCE_CATEGORIES,
+    FISCAL_HEALTH_THRESHOLDS,
+    ENTITY_CODE_RE,
+    entity_type_for_code,
+    normalize_county,
 )
 
+logger = logging.getLogger(__name__)
+
+# JSON-serializable copies of the frozen settings embedded in tool results
+_FUND_TYPE_LEGEND = dict(FUND_TYPES)
+_FUND_BALANCE_LEGEND = dict(FUND_BALANCE_CATEGORIES)
+
+_DEBT_TYPE_DESCRIPTIONS = {
+    "GOBonds": "General Obligation Bonds - backed by full faith and credit",
+    "RevenueBonds": "Revenue Bonds - backed by specific revenue streams",
+    "AltRevenueBonds": "Alternate Revenue Bonds - hybrid backing",
+    "Contractual": "Contractual Commitments - leases, installment purchases",
+    "OtherDebt": "Other Long-term Debt - notes, compensated absences"
+}
+
+# Reference keys the financial data tools add to their results
+_SECTION_LEGEND_KEYS = frozenset({
+    "fund_type_legend",
+    "category_descriptions",
+    "debt_type_descriptions",
+    "funded_ratio_thresholds",
+})
+_PENSION_FUNDED_THRESHOLDS = dict(FISCAL_HEALTH_THRESHOLDS["pension_funded_ratio"])
+
+
+# =============================================================================
+# SPECULATIVE ENTITY SEARCH
+# =============================================================================
+
+# Entity names, codes and details only change when a new fiscal year is
+# loaded, so query results are kept for a day (see _coalesced below)
+ENTITY_CACHE_TTL = 24 * 60 * 60
+
+_speculation_executor = ThreadPoolExecutor(max_workers=4)
+
+
+def _search_key(search_term: str) -> str:
+    """Normalise a search term; entity search ignores case and extra spaces."""
+    return " ".join(search_term.lower().split())
+
+
+def prefetch_entity_search(search_term: str) -> None:
+    """
+    Start searching for an entity the model is likely to look up next.
+    
+    The search runs through _coalesced, so a search_government_entity call
+    for the same term waits for it or reads its cached result instead of
+    querying again; a wrong guess only costs one background query.
+    
+    Args:
+        search_term: Entity name taken from the user's message
+    """
+    key = _search_key(search_term)
+    if len(key) < 2 or _cached_result(search_entities, key, 10) is not None:
+        return
+    _speculation_executor.submit(_coalesced, search_entities, key, 10)
+
+
+# =============================================================================
+# QUERY COALESCING AND RESULT CACHE
+# =============================================================================
+
+# Queries currently running, by (function name, args). When parallel
+# agents look up the same entity at once, the later callers wait for the
+# first query instead of issuing their own.
+_inflight_queries: Dict[tuple, Future] = {}
+_inflight_queries_lock = threading.Lock()
+
+# Recent successful query results, by the same key. A conversation keeps
+# coming back to the same entity (revenue, then debt, then a health score)
+# or county, and AFR data is static, so repeat lookups, rankings and peer
+# searches skip BigQuery. Kept in the
+# process rather than in session state, which ADK serializes every turn.
+_query_results = TTLCache(maxsize=4096, ttl=ENTITY_CACHE_TTL)
+_query_results_lock = threading.Lock()
+
+
+def _has_error(result: Any, depth: int = 3) -> bool:
+    """Whether a query result, or a section of a bundled one, is an error."""
+    if depth == 0:
+        return False
+    if isinstance(result, dict):
+        return "error" in result or any(_has_error(v, depth - 1) for v in result.values())
+    if isinstance(result, list):
+        return bool(result) and _has_error(result[0], depth - 1)
+    return False
+
+
+def _cached_result(fetch, *args):
+    """A recent result of fetch(*args), or None, without calling it."""
+    with _query_results_lock:
+        return _query_results.get((fetch.__name__, args))
+
+
+def _coalesced(fetch, *args):
+    """
+    Call fetch(*args) once: serve a recent result, or wait for an identical
+    call already running. Error results are not kept.
+    """
+    key = (fetch.__name__, args)
+    with _query_results_lock:
+        if key in _query_results:
+            return _query_results[key]
+    
+    with _inflight_queries_lock:
+        future = _inflight_queries.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _inflight_queries[key] = Future()
+    
+    if not is_owner:
+        return future.result()
+    
+    try:
+        result = fetch(*args)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        if not _has_error(result):
+            with _query_results_lock:
+                _query_results[key] = result
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_queries_lock:
+            _inflight_queries.pop(key, None)
+
 
 # =============================================================================
 # ENTITY LOOKUP TOOLS
 # =============================================================================
 
+def _entity_not_found(entity_code: str) -> Dict[str, Any]:
+    """Error result for an entity code that doesn't exist."""
+    # Name the type the code points at so the model can re-search by name
+    entity_type = entity_type_for_code(entity_code)
+    type_hint = f" (a {entity_type} code)" if entity_type else ""
+    return {
+        "status": "error",
+        "error_message": f"Entity with code '{entity_code}'{type_hint} not found."
+    }
+
+
+def _entity_code_error(entity_code: str) -> Optional[Dict[str, Any]]:
+    """
+    Error result for a malformed or unknown entity code, or None to go
+    ahead. Checked against the entity index before any query runs.
+    """
+    if not ENTITY_CODE_RE.fullmatch(entity_code):
+        return {
+            "status": "error",
+            "error_message": f"Invalid entity code format: '{entity_code}'. Expected format: XXX/YYY/ZZ (e.g., '016/020/32')"
+        }
+    if is_known_entity_code(entity_code) is False:
+        return _entity_not_found(entity_code)
+    return None
+
 def search_government_entity(
     search_term: str,
     tool_context: ToolContext
@@ -58,7 +219,7 @@ def search_government_entity(
               - 'entities': List of matching entities with Code, UnitName, EntityType, County
               - 'error_message': Description of the error
     """
-    print(f"--- Tool: search_government_entity called with: {search_term} ---")
+    logger.debug("--- Tool: search_government_entity called with: %s ---", search_term)
     
     if not search_term or len(search_term) < 2:
         return {
@@ -66,7 +227,9 @@ def search_government_entity(
             "error_message": "Please provide at least 2 characters to search."
         }
     
-    results = search_entities(search_term, limit=10)
+    # Keyed on the normalised term, so a speculative search for it (or any
+    # spelling differing only in case and spacing) is reused
+    results = _coalesced(search_entities, _search_key(search_term), 10)
     
     if results and "error" in results[0]:
         return {
@@ -111,15 +274,16 @@ def get_entity_details(
         dict: Contains entity details including name, type, county, population,
               EAV, employees, home rule status, and CEO/CFO information
     """
-    print(f"--- Tool: get_entity_details called for code: {entity_code} ---")
+    logger.debug("--- Tool: get_entity_details called for code: %s ---", entity_code)
+    
+    error = _entity_code_error(entity_code)
+    if error:
+        return error
     
-    result = get_entity_by_code(entity_code)
+    result = _coalesced(get_entity_by_code, entity_code)
     
     if result is None:
-        return {
-            "status": "error",
-            "error_message": f"Entity with code '{entity_code}' not found."
-        }
+        return _entity_not_found(entity_code)
     
     if "error" in result:
         return {
@@ -142,6 +306,74 @@ def get_entity_details(
 # FINANCIAL DATA TOOLS
 # =============================================================================
 
+# Results from _coalesced are shared cache entries that other threads may
+# be reading, so responses are built as new dicts and never edit them.
+
+def _query_error(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Tool error response for a failed query result."""
+    return {
+        "status": "error",
+        "error_message": result["error"]
+    }
+
+
+def _named_rows(rows: List[Dict[str, Any]], names) -> List[Dict[str, Any]]:
+    """Copies of category rows with a CategoryName from names."""
+    name_for = names.get
+    return [{**row, "CategoryName": name_for(row["Category"], row["Category"])} for row in rows]
+
+
+def _revenue_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """get_revenue_data response for a get_entity_revenues result."""
+    if "error" in result:
+        return _query_error(result)
+    return {
+        **result,
+        "by_category": _named_rows(result["by_category"], REVENUE_CATEGORIES),
+        "status": "success",
+        "fund_type_legend": _FUND_TYPE_LEGEND,
+    }
+
+
+def _expenditure_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """get_expenditure_data response for a get_entity_expenditures result."""
+    if "error" in result:
+        return _query_error(result)
+    return {
+        **result,
+        "by_category": _named_rows(result["by_category"], EXPENDITURE_CATEGORIES),
+        "status": "success",
+        "fund_type_legend": _FUND_TYPE_LEGEND,
+    }
+
+
+def _fund_balance_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """get_fund_balance_data response for a get_entity_fund_balances result."""
+    if "error" in result:
+        return _query_error(result)
+    # Leave the by-category index out of the response; it repeats the list
+    return {
+        "code": result["code"],
+        "fund_balances": _named_rows(result["fund_balances"], FUND_BALANCE_CATEGORIES),
+        "status": "success",
+        "category_descriptions": _FUND_BALANCE_LEGEND,
+    }
+
+
+def _debt_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """get_debt_data response for a get_entity_debt result."""
+    if "error" in result:
+        return _query_error(result)
+    return {**result, "status": "success", "debt_type_descriptions": _DEBT_TYPE_DESCRIPTIONS}
+
+
+def _pension_response(result: Dict[str, Any]) -> Dict[str, Any]:
+    """get_pension_data response for a get_entity_pensions result."""
+    if "error" in result:
+        return _query_error(result)
+    return {**result, "status": "success", "funded_ratio_thresholds": _PENSION_FUNDED_THRESHOLDS}
+
+
 def get_revenue_data(
     entity_code: str,
     tool_context: ToolContext
@@ -161,28 +393,13 @@ def get_revenue_data(
         dict: Contains total revenue and breakdown by category showing amounts
               in each fund type. Category codes like '201t' = Property Taxes.
     """
-    print(f"--- Tool: get_revenue_data called for: {entity_code} ---")
-    
-    result = get_entity_revenues(entity_code)
-    
-    if "error" in result:
-        return {
-            "status": "error",
-            "error_message": result["error"]
-        }
+    logger.debug("--- Tool: get_revenue_data called for: %s ---", entity_code)
     
-    # Enhance with category names
-    enhanced_categories = []
-    for cat in result.get("by_category", []):
-        cat_code = cat.get("Category", "")
-        cat["CategoryName"] = REVENUE_CATEGORIES.get(cat_code, cat_code)
-        enhanced_categories.append(cat)
+    error = _entity_code_error(entity_code)
+    if error:
+        return error
     
-    result["by_category"] = enhanced_categories
-    result["status"] = "success"
-    result["fund_type_legend"] = FUND_TYPES
-    
-    return result
+    return _revenue_response(_coalesced(get_entity_revenues, entity_code))
 
 
 def get_expenditure_data(
@@ -204,28 +421,13 @@ def get_expenditure_data(
         dict: Contains total expenditure and breakdown by category.
               Category codes like '252t' = Public Safety.
     """
-    print(f"--- Tool: get_expenditure_data called for: {entity_code} ---")
-    
-    result = get_entity_expenditures(entity_code)
-    
-    if "error" in result:
-        return {
-            "status": "error",
-            "error_message": result["error"]
-        }
+    logger.debug("--- Tool: get_expenditure_data called for: %s ---", entity_code)
     
-    # Enhance with category names
-    enhanced_categories = []
-    for cat in result.get("by_category", []):
-        cat_code = cat.get("Category", "")
-        cat["CategoryName"] = EXPENDITURE_CATEGORIES.get(cat_code, cat_code)
-        enhanced_categories.append(cat)
+    error = _entity_code_error(entity_code)
+    if error:
+        return error
     
-    result["by_category"] = enhanced_categories
-    result["status"] = "success"
-    result["fund_type_legend"] = FUND_TYPES
-    
-    return result
+    return _expenditure_response(_coalesced(get_entity_expenditures, entity_code))
 
 
 def get_fund_balance_data(
@@ -249,34 +451,13 @@ def get_fund_balance_data(
     Returns:
         dict: Fund balance amounts by classification and fund type
     """
-    print(f"--- Tool: get_fund_balance_data called for: {entity_code} ---")
-    
-    result = get_entity_fund_balances(entity_code)
-    
-    if "error" in result:
-        return {
-            "status": "error",
-            "error_message": result["error"]
-        }
-    
-    # Add category descriptions
-    balance_categories = {
-        "302t": "Nonspendable",
-        "303t": "Restricted",
-        "304t": "Committed",
-        "305t": "Assigned",
-        "307t": "Unassigned",
-        "308t": "Total Fund Balance"
-    }
-    
-    for fb in result.get("fund_balances", []):
-        cat_code = fb.get("Category", "")
-        fb["CategoryName"] = balance_categories.get(cat_code, cat_code)
+    logger.debug("--- Tool: get_fund_balance_data called for: %s ---", entity_code)
     
-    result["status"] = "success"
-    result["category_descriptions"] = balance_categories
+    error = _entity_code_error(entity_code)
+    if error:
+        return error
     
-    return result
+    return _fund_balance_response(_coalesced(get_entity_fund_balances, entity_code))
 
 
 def get_debt_data(
@@ -301,26 +482,13 @@ def get_debt_data(
         dict: Total debt and breakdown by debt type with beginning balances,
               additions, and retirements
     """
-    print(f"--- Tool: get_debt_data called for: {entity_code} ---")
-    
-    result = get_entity_debt(entity_code)
-    
-    if "error" in result:
-        return {
-            "status": "error",
-            "error_message": result["error"]
-        }
+    logger.debug("--- Tool: get_debt_data called for: %s ---", entity_code)
     
-    result["status"] = "success"
-    result["debt_type_descriptions"] = {
-        "GOBonds": "General Obligation Bonds - backed by full faith and credit",
-        "RevenueBonds": "Revenue Bonds - backed by specific revenue streams",
-        "AltRevenueBonds": "Alternate Revenue Bonds - hybrid backing",
-        "Contractual": "Contractual Commitments - leases, installment purchases",
-        "OtherDebt": "Other Long-term Debt - notes, compensated absences"
-    }
+    error = _entity_code_error(entity_code)
+    if error:
+        return error
     
-    return result
+    return _debt_response(_coalesced(get_entity_debt, entity_code))
 
 
 def get_pension_data(
@@ -349,27 +517,87 @@ def get_pension_data(
     Returns:
         dict: Pension data by system including liability, assets, and funded ratio
     """
-    print(f"--- Tool: get_pension_data called for: {entity_code} ---")
+    logger.debug("--- Tool: get_pension_data called for: %s ---", entity_code)
     
-    result = get_entity_pensions(entity_code)
+    error = _entity_code_error(entity_code)
+    if error:
+        return error
     
-    if "error" in result:
+    return _pension_response(_coalesced(get_entity_pensions, entity_code))
+
+
+# Bundle key -> (get_entity_bundle section, response builder)
+_FINANCIAL_BUNDLE_SECTIONS = {
+    "revenue": ("revenues", _revenue_response),
+    "expenditure": ("expenditures", _expenditure_response),
+    "fund_balances": ("fund_balances", _fund_balance_response),
+    "debt": ("debt", _debt_response),
+    "pensions": ("pensions", _pension_response),
+}
+
+
+async def get_entity_financial_bundle(
+    entity_code: str,
+    tool_context: ToolContext
+) -> Dict[str, Any]:
+    """
+    Get revenue, expenditure, fund balance, debt and pension data for an
+    entity in one call.
+    
+    Use this instead of calling the five tools separately when a question
+    needs the overall financial picture, e.g. "Give me a financial overview
+    of Naperville".
+    
+    Args:
+        entity_code: The unique entity code (e.g., "016/020/32")
+        tool_context: ADK tool context for state access
+        
+    Returns:
+        dict: The get_revenue_data, get_expenditure_data,
+              get_fund_balance_data, get_debt_data and get_pension_data
+              results under 'revenue', 'expenditure', 'fund_balances',
+              'debt' and 'pensions', with their legends collected once
+              under 'legends'. A section that failed carries its own
+              error status, and the bundle's status is then 'partial'
+    """
+    logger.debug("--- Tool: get_entity_financial_bundle called for: %s ---", entity_code)
+    
+    error = _entity_code_error(entity_code)
+    if error:
+        return error
+    
+    # One job fetches every section; each is then shaped like its own tool's
+    sections = tuple(section for section, _ in _FINANCIAL_BUNDLE_SECTIONS.values())
+    data = (await asyncio.to_thread(
+        _coalesced, get_entity_bundle, (entity_code,), sections
+    ))[entity_code]
+    results = [respond(data[section]) for section, respond in _FINANCIAL_BUNDLE_SECTIONS.values()]
+    
+    if all(section["status"] == "error" for section in results):
         return {
             "status": "error",
-            "error_message": result["error"]
+            "error_message": results[0]["error_message"]
         }
     
-    result["status"] = "success"
-    result["funded_ratio_thresholds"] = FISCAL_HEALTH_THRESHOLDS["pension_funded_ratio"]
-    
-    return result
+    # Each section would repeat its legend; send each one once
+    legends = {}
+    failed = any(section["status"] == "error" for section in results)
+    bundle = {"status": "partial" if failed else "success", "entity_code": entity_code}
+    for name, section in zip(_FINANCIAL_BUNDLE_SECTIONS, results):
+        legend_keys = _SECTION_LEGEND_KEYS & section.keys()
+        for key in legend_keys:
+            legends[key] = section[key]
+        bundle[name] = {k: v for k, v in section.items() if k not in legend_keys}
+    bundle["legends"] = legends
+    
+    return bundle
 
 
 # =============================================================================
 # FISCAL HEALTH ANALYSIS TOOLS
 # =============================================================================
 
-def calculate_fiscal_health_score(
+async def calculate_fiscal_health_score(
     entity_code: str,
     tool_context: ToolContext
 ) -> Dict[str, Any]:
@@ -391,34 +619,109 @@ def calculate_fiscal_health_score(
     Returns:
         dict: Calculated metrics with values and ratings
     """
-    print(f"--- Tool: calculate_fiscal_health_score called for: {entity_code} ---")
+    logger.debug("--- Tool: calculate_fiscal_health_score called for: %s ---", entity_code)
     
-    # Get all necessary data
-    entity = get_entity_by_code(entity_code)
-    revenues = get_entity_revenues(entity_code)
-    expenditures = get_entity_expenditures(entity_code)
-    fund_balances = get_entity_fund_balances(entity_code)
-    debt = get_entity_debt(entity_code)
-    pensions = get_entity_pensions(entity_code)
+    error = _entity_code_error(entity_code)
+    if error:
+        return error
+    
+    result = await asyncio.to_thread(_fetch_and_score, entity_code)
+    
+    # Store in state
+    if result["status"] == "success":
+        tool_context.state["last_fiscal_health"] = result["metrics"]
     
+    return result
+
+
+def _fetch_and_score(entity_code: str) -> Dict[str, Any]:
+    """
+    Fetch what the score needs and compute it, in two stages.
+    
+    The entity comes first: it is usually cached from get_entity_details
+    or answered by the local snapshot, and an unknown code then costs no
+    financial queries. The financial tables follow in one concurrent
+    bundle, without debt when there is no population to compute debt per
+    capita from (raw total_debt is then None). For every section at once,
+    use get_entity_financial_bundle.
+    """
+    entity = _coalesced(get_entity_by_code, entity_code)
     if entity is None:
+        return _entity_not_found(entity_code)
+    if "error" in entity:
         return {
             "status": "error",
-            "error_message": f"Entity with code '{entity_code}' not found."
+            "error_message": entity["error"]
         }
     
+    sections = ("revenues", "expenditures", "fund_balances", "pensions")
+    if entity["Population"]:
+        sections += ("debt",)
+    data = dict(_coalesced(get_entity_bundle, (entity_code,), sections)[entity_code])
+    data["entity"] = entity
+    return _score_entity(entity_code, data)
+
+
+def calculate_fiscal_health_scores(entity_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fiscal health scores for many entities, e.g. for batch runs or
+    benchmarking a peer group (see batch.py --health-scores).
+    
+    Codes are validated like the tools do, then all the valid ones are
+    fetched in one bundle instead of one bundle per entity.
+    
+    Args:
+        entity_codes: Entity codes to score
+        
+    Returns:
+        dict: Entity code -> the calculate_fiscal_health_score result
+    """
+    codes = tuple(dict.fromkeys(entity_codes))
+    scores = {}
+    for code in codes:
+        error = _entity_code_error(code)
+        if error:
+            scores[code] = error
+    
+    valid = tuple(code for code in codes if code not in scores)
+    if valid:
+        bundle = _coalesced(get_entity_bundle, valid)
+        for code in valid:
+            scores[code] = _score_entity(code, bundle[code])
+    return {code: scores[code] for code in codes}
+
+
+def _score_entity(entity_code: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute and rate the fiscal health metrics from an entity bundle."""
+    entity = data["entity"]
+    revenues = data["revenues"]
+    expenditures = data["expenditures"]
+    fund_balances = data["fund_balances"]
+    pensions = data["pensions"]
+    
+    if entity is None:
+        return _entity_not_found(entity_code)
+    
+    # Sections that loaded have every amount filled in (NULLs are 0)
+    for section in data.values():
+        if "error" in section:
+            return {
+                "status": "error",
+                "error_message": section["error"]
+            }
+    
     # Calculate metrics
-    total_revenue = revenues.get("total_revenue", 0) or 0
-    total_expenditure = expenditures.get("total_expenditure", 0) or 0
-    total_debt = debt.get("total_debt", 0) or 0
-    population = entity.get("Population", 0) or 0
+    total_revenue = revenues["total_revenue"]
+    total_expenditure = expenditures["total_expenditure"]
+    # Entities without UnitStats have no population
+    population = entity["Population"] or 0
+    # Debt only feeds debt per capita, so without a population it isn't
+    # fetched and is reported as None
+    total_debt = data["debt"]["total_debt"] if population else None
     
     # Get unassigned fund balance (307t category, GN column)
-    unassigned_balance = 0
-    for fb in fund_balances.get("fund_balances", []):
-        if fb.get("Category") == "307t":
-            unassigned_balance = fb.get("GeneralFund", 0) or 0
-            break
+    unassigned = fund_balances["fund_balances_by_category"].get("307t")
+    unassigned_balance = unassigned["GeneralFund"] if unassigned else 0
     
     # Calculate ratios
     metrics = {}
@@ -429,7 +732,7 @@ def calculate_fiscal_health_score(
         metrics["operating_margin"] = {
             "value": round(operating_margin * 100, 2),
             "unit": "percent",
-            "rating": _rate_metric(operating_margin, FISCAL_HEALTH_THRESHOLDS["operating_margin"])
+            "rating": _rate_operating_margin(operating_margin)
         }
     
     # Fund Balance Ratio
@@ -438,7 +741,7 @@ def calculate_fiscal_health_score(
         metrics["fund_balance_ratio"] = {
             "value": round(fund_balance_ratio * 100, 2),
             "unit": "percent",
-            "rating": _rate_metric(fund_balance_ratio, FISCAL_HEALTH_THRESHOLDS["fund_balance_ratio"])
+            "rating": _rate_fund_balance_ratio(fund_balance_ratio)
         }
     
     # Debt Per Capita
@@ -451,24 +754,20 @@ def calculate_fiscal_health_score(
         }
     
     # Pension Funded Ratio (use lowest if multiple systems)
-    pension_systems = pensions.get("pension_systems", {})
+    pension_systems = pensions["pension_systems"]
     if pension_systems:
-        lowest_funded = 100
-        for system, data in pension_systems.items():
-            funded_ratio = data.get("funded_ratio", 0) or 0
-            if funded_ratio > 0 and funded_ratio < lowest_funded:
-                lowest_funded = funded_ratio
+        lowest_funded = min(
+            (system["funded_ratio"] for system in pension_systems.values() if system["funded_ratio"] > 0),
+            default=100
+        )
         
         if lowest_funded < 100:
             metrics["pension_funded_ratio"] = {
                 "value": round(lowest_funded, 2),
                 "unit": "percent",
-                "rating": _rate_metric(lowest_funded / 100, FISCAL_HEALTH_THRESHOLDS["pension_funded_ratio"])
+                "rating": _rate_pension_funded_ratio(lowest_funded / 100)
             }
     
-    # Store in state
-    tool_context.state["last_fiscal_health"] = metrics
-    
     return {
         "status": "success",
         "entity_code": entity_code,
@@ -484,36 +783,41 @@ def calculate_fiscal_health_score(
     }
 
 
-def _rate_metric(value: float, thresholds: Dict[str, float]) -> str:
-    """Helper to rate a metric based on thresholds."""
-    if value >= thresholds.get("excellent", float('inf')):
-        return "Excellent"
-    elif value >= thresholds.get("good", float('inf')):
-        return "Good"
-    elif value >= thresholds.get("fair", float('inf')):
-        return "Fair"
-    else:
-        return "Poor"
-
-
-def _rate_debt_per_capita(value: float) -> str:
-    """Helper to rate debt per capita."""
-    thresholds = FISCAL_HEALTH_THRESHOLDS["debt_per_capita"]
-    if value <= thresholds["low"]:
-        return "Low"
-    elif value <= thresholds["moderate"]:
-        return "Moderate"
-    elif value <= thresholds["high"]:
-        return "High"
-    else:
-        return "Very High"
+def _make_rater(bounds: tuple, labels: tuple, bisect_fn: Callable) -> Callable[[float], str]:
+    """Build a rating function with its ascending bounds and labels bound in."""
+    def rate(value: float) -> str:
+        return labels[bisect_fn(bounds, value)]
+    return rate
+
+
+def _higher_is_better_rater(metric: str) -> Callable[[float], str]:
+    """Rater for a FISCAL_HEALTH_THRESHOLDS metric where higher is better."""
+    thresholds = FISCAL_HEALTH_THRESHOLDS[metric]
+    # bisect_right: a value equal to a bound earns that bound's rating
+    return _make_rater(
+        (thresholds["fair"], thresholds["good"], thresholds["excellent"]),
+        ("Poor", "Fair", "Good", "Excellent"),
+        bisect_right
+    )
+
+
+# One rater per metric, built once at import
+_rate_operating_margin = _higher_is_better_rater("operating_margin")
+_rate_fund_balance_ratio = _higher_is_better_rater("fund_balance_ratio")
+_rate_pension_funded_ratio = _higher_is_better_rater("pension_funded_ratio")
+# bisect_left: a value equal to a bound stays in the lower-debt rating
+_rate_debt_per_capita = _make_rater(
+    tuple(FISCAL_HEALTH_THRESHOLDS["debt_per_capita"][level] for level in ("low", "moderate", "high")),
+    ("Low", "Moderate", "High", "Very High"),
+    bisect_left
+)
 
 
 # =============================================================================
 # COMPARISON AND BENCHMARKING TOOLS
 # =============================================================================
 
-def compare_entities(
+async def compare_entities(
     entity_codes: str,
     tool_context: ToolContext
 ) -> Dict[str, Any]:
@@ -531,7 +835,7 @@ def compare_entities(
     Returns:
         dict: Comparison table with metrics for each entity
     """
-    print(f"--- Tool: compare_entities called for: {entity_codes} ---")
+    logger.debug("--- Tool: compare_entities called for: %s ---", entity_codes)
     
     codes = [code.strip() for code in entity_codes.split(",")]
     
@@ -547,16 +851,29 @@ def compare_entities(
             "error_message": "Maximum 10 entities can be compared at once."
         }
     
+    for code in codes:
+        error = _entity_code_error(code)
+        if error:
+            return error
+    
+    # One joined query returns every entity's details and totals
+    rows = await asyncio.to_thread(_coalesced, get_comparison_data, tuple(codes))
+    
+    if rows and "error" in rows[0]:
+        return {
+            "status": "error",
+            "error_message": rows[0]["error"]
+        }
+    
+    rows_by_code = {row["Code"]: row for row in rows}
     comparisons = []
     for code in codes:
-        entity = get_entity_by_code(code)
-        revenues = get_entity_revenues(code)
-        expenditures = get_entity_expenditures(code)
+        entity = rows_by_code.get(code)
         
         if entity:
-            population = entity.get("Population", 0) or 0
-            total_rev = revenues.get("total_revenue", 0) or 0
-            total_exp = expenditures.get("total_expenditure", 0) or 0
+            population = entity["Population"]
+            total_rev = entity["TotalRevenue"]
+            total_exp = entity["TotalExpenditure"]
             
             comparisons.append({
                 "code": code,
@@ -564,7 +881,7 @@ def compare_entities(
                 "type": entity.get("EntityType"),
                 "county": entity.get("County"),
                 "population": population,
-                "eav": entity.get("EquitalizedAssessedValue", 0) or 0,
+                "eav": entity["EquitalizedAssessedValue"],
                 "total_revenue": total_rev,
                 "total_expenditure": total_exp,
                 "revenue_per_capita": round(total_rev / population, 2) if population > 0 else 0,
@@ -598,9 +915,22 @@ def find_peer_entities(
     Returns:
         dict: List of peer entities with basic statistics
     """
-    print(f"--- Tool: find_peer_entities called for: {entity_code} ---")
-    
-    peers = get_peer_entities(entity_code, population_range_pct=0.25, same_type=True, limit=10)
+    logger.debug("--- Tool: find_peer_entities called for: %s ---", entity_code)
+    
+    error = _entity_code_error(entity_code)
+    if error:
+        return error
+    
+    # Details already fetched by get_entity_details let BigQuery skip
+    # looking up the entity's population and type
+    entity = _cached_result(get_entity_by_code, entity_code)
+    if entity is not None and "error" not in entity and entity["Population"] is not None:
+        peers = _coalesced(
+            get_peer_entities, entity_code, 0.25, True, 10,
+            entity["Population"], entity["EntityType"]
+        )
+    else:
+        peers = _coalesced(get_peer_entities, entity_code, 0.25, True, 10)
     
     if peers and "error" in peers[0]:
         return {
@@ -646,18 +976,18 @@ def rank_entities(
     Returns:
         dict: Ranked list of entities with their metric values
     """
-    print(f"--- Tool: rank_entities called - metric: {metric}, type: {entity_type}, county: {county} ---")
+    logger.debug("--- Tool: rank_entities called - metric: %s, type: %s, county: %s ---", metric, entity_type, county)
+    
+    if county:
+        canonical = normalize_county(county)
+        if canonical is None:
+            return _unknown_county(county)
+        county = canonical
     
     order = "DESC" if top_or_bottom.lower() == "top" else "ASC"
     limit = min(limit, 50)  # Cap at 50
     
-    results = rank_entities_by_metric(
-        metric=metric,
-        entity_type=entity_type,
-        county=county,
-        order=order,
-        limit=limit
-    )
+    results = _coalesced(rank_entities_by_metric, metric, entity_type, county, order, limit)
     
     if results and "error" in results[0]:
         return {
@@ -682,6 +1012,14 @@ def rank_entities(
 # GEOGRAPHIC ANALYSIS TOOLS
 # =============================================================================
 
+def _unknown_county(county: str) -> Dict[str, Any]:
+    """Error result for a county name that isn't in Illinois."""
+    return {
+        "status": "not_found",
+        "message": f"'{county}' is not an Illinois county. Check the spelling of the county name."
+    }
+
+
 def get_county_entities(
     county: str,
     tool_context: ToolContext,
@@ -704,9 +1042,14 @@ def get_county_entities(
     Returns:
         dict: List of entities in the county with basic info
     """
-    print(f"--- Tool: get_county_entities called for: {county}, type: {entity_type} ---")
+    logger.debug("--- Tool: get_county_entities called for: %s, type: %s ---", county, entity_type)
     
-    entities = get_entities_by_county(county, entity_type)
+    canonical = normalize_county(county)
+    if canonical is None:
+        return _unknown_county(county)
+    county = canonical
+    
+    entities = _coalesced(get_entities_by_county, county, entity_type)
     
     if entities and "error" in entities[0]:
         return {
@@ -745,9 +1088,13 @@ def get_county_financial_summary(
     Returns:
         dict: Aggregated statistics for the county
     """
-    print(f"--- Tool: get_county_financial_summary called for: {county} ---")
+    logger.debug("--- Tool: get_county_financial_summary called for: %s ---", county)
+    
+    canonical = normalize_county(county)
+    if canonical is None:
+        return _unknown_county(county)
     
-    summary = get_county_summary(county)
+    summary = _coalesced(get_county_summary, canonical)
     
     if "error" in summary:
         return {
@@ -761,6 +1108,62 @@ def get_county_financial_summary(
     }
 
 
+async def get_county_overview(
+    county: str,
+    tool_context: ToolContext,
+    entity_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get the entity list and the aggregated summary for a county in one call.
+    
+    Use this instead of calling get_county_entities and
+    get_county_financial_summary separately when a question needs both,
+    e.g. "Give me an overview of Kane County".
+    
+    Args:
+        county: Illinois county name (e.g., "Cook", "DuPage", "Lake")
+        tool_context: ADK tool context for state access
+        entity_type: Optional filter for the entity list - 'City', 'Village',
+                    'Township', 'Fire Protection District', etc.
+        
+    Returns:
+        dict: Aggregated statistics and the list of entities in the county
+    """
+    logger.debug("--- Tool: get_county_overview called for: %s, type: %s ---", county, entity_type)
+    
+    canonical = normalize_county(county)
+    if canonical is None:
+        return _unknown_county(county)
+    county = canonical
+    
+    # The two queries are independent, so run them concurrently
+    entities, summary = await asyncio.gather(
+        asyncio.to_thread(_coalesced, get_entities_by_county, county, entity_type),
+        asyncio.to_thread(_coalesced, get_county_summary, county),
+    )
+    
+    if "error" in summary:
+        return {
+            "status": "error",
+            "error_message": summary["error"]
+        }
+    
+    if entities and "error" in entities[0]:
+        return {
+            "status": "error",
+            "error_message": entities[0]["error"]
+        }
+    
+    return {
+        "status": "success",
+        "county": county,
+        "summary": summary,
+        "entity_type_filter": entity_type,
+        "count": len(entities),
+        "entities": entities
+    }
+
+
 # =============================================================================
 # EXPORT ALL TOOLS
 # =============================================================================
@@ -777,6 +1180,7 @@ ALL_TOOLS = [
     get_fund_balance_data,
     get_debt_data,
     get_pension_data,
+    get_entity_financial_bundle,
     
     # Analysis
     calculate_fiscal_health_score,
@@ -789,4 +1193,5 @@ ALL_TOOLS = [
     # Geographic
     get_county_entities,
     get_county_financial_summary,
+    get_county_overview,
 ]
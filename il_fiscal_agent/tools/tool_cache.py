@@ -0,0 +1,107 @@
+"""
+Result cache for read-only fiscal data tools
+
+Users usually ask several questions about the same entity in a row
+("revenue for Naperville", "debt for Naperville", ...), and each question
+re-runs the same BigQuery lookups. These callbacks serve repeated calls
+from a small in-process cache instead.
+
+Usage:
+    agent = Agent(
+        ...,
+        before_tool_callback=cached_tool_result,
+        after_tool_callback=store_tool_result,
+    )
+"""
+from typing import Optional, Dict, Any
+import logging
+import threading
+
+from cachetools import TTLCache
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
+
+from tools.fiscal_tools import ENTITY_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+# Tools whose result depends only on their arguments and that write nothing
+# to session state, so skipping the call changes nothing but the latency.
+# search_government_entity and get_entity_details record the current
+# entity in state and always run.
+CACHEABLE_TOOLS = frozenset({
+    "get_revenue_data",
+    "get_expenditure_data",
+    "get_fund_balance_data",
+    "get_debt_data",
+    "get_pension_data",
+    "get_entity_financial_bundle",
+    "get_county_entities",
+    "get_county_financial_summary",
+    "get_county_overview",
+})
+
+TOOL_CACHE_SIZE = 128
+
+# AFR data only changes when a fiscal year is loaded, so results are
+# shared across sessions and expire with the other entity caches. The cache
+# lives in the process rather than in session state, which ADK would
+# serialize on every turn. TTLCache is not thread-safe on its own.
+_tool_cache = TTLCache(maxsize=TOOL_CACHE_SIZE, ttl=ENTITY_CACHE_TTL)
+_tool_cache_lock = threading.Lock()
+
+
+def _cache_key(tool: BaseTool, args: Dict[str, Any]) -> Optional[tuple]:
+    """Build the cache key for a call, or None if it isn't cacheable."""
+    if tool.name not in CACHEABLE_TOOLS:
+        return None
+    try:
+        key = (tool.name, tuple(sorted(args.items())))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def cached_tool_result(
+    tool: BaseTool,
+    args: Dict[str, Any],
+    tool_context: ToolContext
+) -> Optional[Dict]:
+    """
+    Before-tool callback returning a cached result for a repeated call.
+
+    Returns the cached dict to skip the tool, or None to run it.
+    """
+    key = _cache_key(tool, args)
+    if key is None:
+        return None
+
+    with _tool_cache_lock:
+        result = _tool_cache.get(key)
+
+    if result is not None:
+        logger.debug("--- Callback: serving %s from tool cache ---", tool.name)
+    return result
+
+
+def store_tool_result(
+    tool: BaseTool,
+    args: Dict[str, Any],
+    tool_context: ToolContext,
+    tool_response: Dict
+) -> Optional[Dict]:
+    """
+    After-tool callback caching successful results of cacheable tools.
+
+    Returns None so the tool response is passed on unchanged.
+    """
+    key = _cache_key(tool, args)
+    if key is None or not isinstance(tool_response, dict):
+        return None
+    if tool_response.get("status") != "success":
+        return None
+
+    with _tool_cache_lock:
+        _tool_cache[key] = tool_response
+    return None
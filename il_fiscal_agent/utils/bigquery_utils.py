@@ -2,22 +2,105 @@
 BigQuery utility functions for data access
 """
 from google.cloud import bigquery
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, FrozenSet, Optional, Sequence, Tuple
 import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
 
-from config.settings import GCP_PROJECT_ID, TABLES
+from config.settings import GCP_PROJECT_ID, TABLES, ENTITY_SNAPSHOT_PATH, BQ_HTTP_POOL_SIZE
+
+logger = logging.getLogger(__name__)
 
 # Initialize BigQuery client (singleton pattern)
 _bq_client = None
+_bq_client_lock = threading.Lock()
+
+
+def _bigquery_session():
+    """
+    Build one authorized HTTP session for the BigQuery client to share.
+    
+    The default adapter keeps only 10 connections per host, so parallel
+    tool calls would queue or reconnect. Returns None (client default) if
+    google-auth cannot be set up.
+    """
+    try:
+        import google.auth
+        import requests
+        from google.auth.transport.requests import AuthorizedSession
+        
+        credentials, _ = google.auth.default(
+            scopes=["https://www.googleapis.com/auth/cloud-platform"]
+        )
+        session = AuthorizedSession(credentials)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=BQ_HTTP_POOL_SIZE)
+        session.mount("https://", adapter)
+        return session
+    except Exception as e:
+        logger.warning("[BigQuery] Using default HTTP session: %s", e)
+        return None
+
 
 def get_bq_client() -> bigquery.Client:
     """Get or create BigQuery client singleton."""
     global _bq_client
     if _bq_client is None:
-        _bq_client = bigquery.Client(project=GCP_PROJECT_ID)
+        # Tools run on several threads; make sure only one builds the client
+        with _bq_client_lock:
+            if _bq_client is None:
+                _bq_client = bigquery.Client(project=GCP_PROJECT_ID, _http=_bigquery_session())
     return _bq_client
 
 
+def _prewarm():
+    """Fetch the auth token, open a connection and load the entity index."""
+    try:
+        get_bq_client().query_and_wait("SELECT 1", job_config=_job_config())
+        _get_entity_index()
+    except Exception as e:
+        logger.warning("[BigQuery] Prewarm failed, first tool call will connect: %s", e)
+
+
+def prewarm_bq_client() -> None:
+    """
+    Start connecting to BigQuery in the background.
+    
+    The first query otherwise pays for the OAuth token fetch and TLS
+    handshake, and the first entity search for loading the name index.
+    Call once at startup; tool calls made meanwhile just wait on the
+    client and index locks.
+    """
+    threading.Thread(target=_prewarm, name="bq-prewarm", daemon=True).start()
+
+
+def _job_config(query_parameters: Optional[List] = None) -> bigquery.QueryJobConfig:
+    """
+    Build the job config for a standard SQL query.
+    
+    BigQuery serves a repeated query from its 24-hour result cache only when
+    the query text and parameter values are identical, so queries keep
+    their values in parameters and bind case-insensitive ones lowercased.
+    """
+    return bigquery.QueryJobConfig(
+        query_parameters=query_parameters or [],
+        use_query_cache=True,
+        use_legacy_sql=False,
+    )
+
+
+def _row_dicts(results: bigquery.table.RowIterator) -> List[Dict[str, Any]]:
+    """
+    Convert result rows to dicts. Field names are read once from the
+    schema and values taken by position; Row.items() deep-copies each value.
+    """
+    fields = list(enumerate(field.name for field in results.schema))
+    return [{name: row[i] for i, name in fields} for row in results]
+
+
 def execute_query(query: str, params: Optional[Dict] = None) -> List[Dict[str, Any]]:
     """
     Execute a BigQuery SQL query and return results as list of dictionaries.
@@ -31,87 +114,25 @@ def execute_query(query: str, params: Optional[Dict] = None) -> List[Dict[str, A
     """
     client = get_bq_client()
     
-    job_config = bigquery.QueryJobConfig()
-    if params:
-        job_config.query_parameters = [
-            bigquery.ScalarQueryParameter(name, "STRING", value)
-            for name, value in params.items()
-        ]
+    job_config = _job_config([
+        bigquery.ScalarQueryParameter(name, "STRING", value)
+        for name, value in (params or {}).items()
+    ])
     
     try:
-        query_job = client.query(query, job_config=job_config)
-        results = query_job.result()
-        
-        # Convert to list of dicts
-        rows = []
-        for row in results:
-            rows.append(dict(row.items()))
-        
-        return rows
+        results = client.query_and_wait(query, job_config=job_config)
+        return _row_dicts(results)
     except Exception as e:
         return [{"error": str(e)}]
 
 
-def search_entities(search_term: str, limit: int = 10) -> List[Dict[str, Any]]:
-    """
-    Search for government entities by name using fuzzy matching.
-    
-    Args:
-        search_term: Name or partial name to search for
-        limit: Maximum number of results to return
-        
-    Returns:
-        List of matching entities with their codes and details
-    """
-    query = f"""
-    SELECT 
-        Code,
-        UnitName,
-        Description as EntityType,
-        County,
-        CONCAT(UnitName, ', ', County, ' County (', Description, ')') as FullDescription
-    FROM `{TABLES['unit_data']}`
-    WHERE 
-        LOWER(UnitName) LIKE LOWER(@search_pattern)
-        OR LOWER(County) LIKE LOWER(@search_pattern)
-    ORDER BY 
-        CASE 
-            WHEN LOWER(UnitName) = LOWER(@exact_term) THEN 0
-            WHEN LOWER(UnitName) LIKE LOWER(@starts_with) THEN 1
-            ELSE 2
-        END,
-        UnitName
-    LIMIT {limit}
-    """
-    
-    client = get_bq_client()
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter("search_pattern", "STRING", f"%{search_term}%"),
-            bigquery.ScalarQueryParameter("exact_term", "STRING", search_term),
-            bigquery.ScalarQueryParameter("starts_with", "STRING", f"{search_term}%"),
-        ]
-    )
-    
-    try:
-        results = client.query(query, job_config=job_config).result()
-        return [dict(row.items()) for row in results]
-    except Exception as e:
-        return [{"error": str(e)}]
-
+# =============================================================================
+# LOCAL ENTITY SNAPSHOT
+# =============================================================================
 
-def get_entity_by_code(code: str) -> Optional[Dict[str, Any]]:
-    """
-    Get entity details by its unique code.
-    
-    Args:
-        code: Entity code (format: XXX/YYY/ZZ)
-        
-    Returns:
-        Entity details dictionary or None if not found
-    """
-    query = f"""
-    SELECT 
+# Entity detail columns, shared by get_entity_by_code and the snapshot
+# built by scripts/build_local_snapshot.py
+ENTITY_DETAIL_COLUMNS = """
         ud.Code,
         ud.UnitName,
         ud.Description as EntityType,
@@ -132,92 +153,217 @@ def get_entity_by_code(code: str) -> Optional[Dict[str, Any]]:
         us.AccountingMethod,
         us.Debt as HasDebt,
         us.BondedDebt as HasBondedDebt
-    FROM `{TABLES['unit_data']}` ud
-    LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
-    WHERE ud.Code = @code
-    LIMIT 1
+"""
+
+# UnitData and UnitStats only change when a fiscal year is loaded, so a
+# SQLite snapshot of their join can answer entity lookups locally. It is
+# copied into memory on first use; codes it doesn't have fall back to
+# BigQuery. False once a load has found no snapshot.
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def _get_snapshot() -> Optional[sqlite3.Connection]:
+    """Load the entity snapshot into memory on first use, if one was built."""
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None:
+            _snapshot = False
+            if os.path.exists(ENTITY_SNAPSHOT_PATH):
+                try:
+                    source = sqlite3.connect(f"file:{ENTITY_SNAPSHOT_PATH}?mode=ro", uri=True)
+                    snapshot = sqlite3.connect(":memory:", check_same_thread=False)
+                    source.backup(snapshot)
+                    source.close()
+                    snapshot.row_factory = sqlite3.Row
+                    _snapshot = snapshot
+                except sqlite3.Error as e:
+                    logger.warning("Could not load entity snapshot %s: %s", ENTITY_SNAPSHOT_PATH, e)
+        return _snapshot or None
+
+
+def _snapshot_query(query: str, params: tuple = ()) -> Optional[List[Dict[str, Any]]]:
+    """Run a query on the entity snapshot, or return None without one."""
+    snapshot = _get_snapshot()
+    if snapshot is None:
+        return None
+    # One connection is shared across tool threads
+    with _snapshot_lock:
+        return [dict(row) for row in snapshot.execute(query, params)]
+
+
+def _snapshot_entity(code: str) -> Optional[Dict[str, Any]]:
+    """Entity details from the snapshot, or None to ask BigQuery."""
+    rows = _snapshot_query("SELECT * FROM entities WHERE Code = ?", (code,))
+    return rows[0] if rows else None
+
+
+# =============================================================================
+# ENTITY NAME INDEX
+# =============================================================================
+
+# UnitData has ~4,000 rows, so entity search matches names in memory after
+# one load instead of a LIKE scan of the table per search. Each entry is
+# (lowercased name, lowercased county, row).
+_entity_index: Optional[List[Tuple[str, str, Dict[str, Any]]]] = None
+_entity_codes: FrozenSet[str] = frozenset()
+# Whether _entity_codes came from BigQuery. A snapshot can be older than
+# the tables, so a code it lacks may still exist.
+_entity_codes_complete = False
+_entity_index_lock = threading.Lock()
+
+
+def _load_entity_index_rows() -> Tuple[List[Dict[str, Any]], bool]:
     """
-    
-    client = get_bq_client()
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter("code", "STRING", code),
-        ]
+    Entity search rows in UnitName order, from the snapshot or BigQuery,
+    and whether they came from BigQuery.
+    """
+    rows = _snapshot_query(
+        "SELECT Code, UnitName, EntityType, County FROM entities ORDER BY UnitName"
     )
+    if rows is not None:
+        for row in rows:
+            # Match the BigQuery CONCAT, which is NULL if any part is
+            parts = (row["UnitName"], row["County"], row["EntityType"])
+            row["FullDescription"] = (
+                f"{parts[0]}, {parts[1]} County ({parts[2]})" if None not in parts else None
+            )
+        return rows, False
     
+    query = f"""
+    SELECT 
+        Code,
+        UnitName,
+        Description as EntityType,
+        County,
+        CONCAT(UnitName, ', ', County, ' County (', Description, ')') as FullDescription
+    FROM `{TABLES['unit_data']}`
+    ORDER BY UnitName
+    """
+    results = get_bq_client().query_and_wait(query, job_config=_job_config())
+    return _row_dicts(results), True
+
+
+def _get_entity_index() -> List[Tuple[str, str, Dict[str, Any]]]:
+    """Load the entity name index on first use. Raises if the query fails."""
+    global _entity_index, _entity_codes, _entity_codes_complete
+    if _entity_index is None:
+        with _entity_index_lock:
+            if _entity_index is None:
+                rows, _entity_codes_complete = _load_entity_index_rows()
+                # ~4,000 rows share ~100 county and ~40 type names; intern
+                # them so the index holds one copy of each
+                for row in rows:
+                    for field in ("County", "EntityType"):
+                        if row[field] is not None:
+                            row[field] = sys.intern(row[field])
+                _entity_codes = frozenset(row["Code"] for row in rows)
+                _entity_index = [
+                    ((row["UnitName"] or "").lower(), (row["County"] or "").lower(), row)
+                    for row in rows
+                ]
+    return _entity_index
+
+
+def is_known_entity_code(code: str) -> Optional[bool]:
+    """
+    Check a code against the entity index, without a query once it's loaded.
+    
+    Returns:
+        Whether the code is a known entity, or None if that can't be told
+        from the index (let the query decide): it couldn't be loaded, or
+        it came from the snapshot and lacks the code
+    """
     try:
-        results = list(client.query(query, job_config=job_config).result())
-        if results:
-            return dict(results[0].items())
+        _get_entity_index()
+    except Exception:
         return None
-    except Exception as e:
-        return {"error": str(e)}
+    if code in _entity_codes:
+        return True
+    return False if _entity_codes_complete else None
 
 
-def get_entity_revenues(code: str) -> Dict[str, Any]:
+def search_entities(search_term: str, limit: int = 10) -> List[Dict[str, Any]]:
     """
-    Get revenue breakdown for an entity.
+    Search for government entities by name using fuzzy matching.
+    
+    Matches the name or county as a case-insensitive substring, ranking an
+    exact name match first, then names starting with the term.
     
     Args:
-        code: Entity code
+        search_term: Name or partial name to search for
+        limit: Maximum number of results to return
         
     Returns:
-        Dictionary with revenue details by category and fund
-    """
-    query = f"""
-    SELECT 
-        Category,
-        COALESCE(GN, 0) as GeneralFund,
-        COALESCE(SR, 0) as SpecialRevenue,
-        COALESCE(CP, 0) as CapitalProjects,
-        COALESCE(DS, 0) as DebtService,
-        COALESCE(EP, 0) as Enterprise,
-        COALESCE(TS, 0) as Trust,
-        COALESCE(FD, 0) as Fiduciary,
-        COALESCE(DP, 0) as DebtPrincipal,
-        (COALESCE(GN, 0) + COALESCE(SR, 0) + COALESCE(CP, 0) + 
-         COALESCE(DS, 0) + COALESCE(EP, 0) + COALESCE(TS, 0) + 
-         COALESCE(FD, 0) + COALESCE(DP, 0)) as Total
-    FROM `{TABLES['revenues']}`
-    WHERE Code = @code
-    ORDER BY Category
+        List of matching entities with their codes and details
     """
-    
-    client = get_bq_client()
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter("code", "STRING", code),
-        ]
-    )
-    
     try:
-        results = list(client.query(query, job_config=job_config).result())
-        revenues = [dict(row.items()) for row in results]
-        
-        # Calculate totals
-        total_revenue = sum(r.get('Total', 0) or 0 for r in revenues)
-        
-        return {
-            "code": code,
-            "total_revenue": total_revenue,
-            "by_category": revenues
-        }
+        index = _get_entity_index()
     except Exception as e:
-        return {"error": str(e)}
+        return [{"error": str(e)}]
+    
+    term = search_term.lower()
+    matches = [
+        (0 if name == term else 1 if name.startswith(term) else 2, row)
+        for name, county, row in index
+        if term in name or term in county
+    ]
+    # The index is in UnitName order and the sort is stable, so ties stay
+    # alphabetical like the ORDER BY they replace
+    matches.sort(key=lambda match: match[0])
+    return [dict(row) for _, row in matches[:limit]]
 
 
-def get_entity_expenditures(code: str) -> Dict[str, Any]:
+# Only the @code value varies, so the SQL is built once at import
+_ENTITY_BY_CODE_QUERY = f"""
+    SELECT {ENTITY_DETAIL_COLUMNS}
+    FROM `{TABLES['unit_data']}` ud
+    LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
+    WHERE ud.Code = @code
+    LIMIT 1
     """
-    Get expenditure breakdown for an entity.
+
+
+def get_entity_by_code(code: str) -> Optional[Dict[str, Any]]:
+    """
+    Get entity details by its unique code.
     
     Args:
-        code: Entity code
+        code: Entity code (format: XXX/YYY/ZZ)
         
     Returns:
-        Dictionary with expenditure details by category and fund
+        Entity details dictionary or None if not found
     """
-    query = f"""
-    SELECT 
+    entity = _snapshot_entity(code)
+    if entity is not None:
+        return entity
+    
+    client = get_bq_client()
+    job_config = _job_config([
+        bigquery.ScalarQueryParameter("code", "STRING", code),
+    ])
+    
+    try:
+        rows = _row_dicts(client.query_and_wait(_ENTITY_BY_CODE_QUERY, job_config=job_config, max_results=1))
+        if rows:
+            return rows[0]
+        return None
+    except Exception as e:
+        return {"error": str(e)}
+
+
+# =============================================================================
+# ENTITY FINANCIAL DATA
+# =============================================================================
+
+# Column lists and result shaping for each financial table, shared by the
+# single-entity functions below and by get_entity_bundle
+# Sum of a row's fund columns, i.e. the category total
+_FUND_TOTAL = """(COALESCE(GN, 0) + COALESCE(SR, 0) + COALESCE(CP, 0) + 
+         COALESCE(DS, 0) + COALESCE(EP, 0) + COALESCE(TS, 0) + 
+         COALESCE(FD, 0) + COALESCE(DP, 0))"""
+
+_CATEGORY_FUND_COLUMNS = f"""
         Category,
         COALESCE(GN, 0) as GeneralFund,
         COALESCE(SR, 0) as SpecialRevenue,
@@ -227,49 +373,10 @@ def get_entity_expenditures(code: str) -> Dict[str, Any]:
         COALESCE(TS, 0) as Trust,
         COALESCE(FD, 0) as Fiduciary,
         COALESCE(DP, 0) as DebtPrincipal,
-        (COALESCE(GN, 0) + COALESCE(SR, 0) + COALESCE(CP, 0) + 
-         COALESCE(DS, 0) + COALESCE(EP, 0) + COALESCE(TS, 0) + 
-         COALESCE(FD, 0) + COALESCE(DP, 0)) as Total
-    FROM `{TABLES['expenditures']}`
-    WHERE Code = @code
-    ORDER BY Category
-    """
-    
-    client = get_bq_client()
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter("code", "STRING", code),
-        ]
-    )
-    
-    try:
-        results = list(client.query(query, job_config=job_config).result())
-        expenditures = [dict(row.items()) for row in results]
-        
-        # Calculate totals
-        total_expenditure = sum(e.get('Total', 0) or 0 for e in expenditures)
-        
-        return {
-            "code": code,
-            "total_expenditure": total_expenditure,
-            "by_category": expenditures
-        }
-    except Exception as e:
-        return {"error": str(e)}
-
+        {_FUND_TOTAL} as Total
+"""
 
-def get_entity_fund_balances(code: str) -> Dict[str, Any]:
-    """
-    Get fund balance breakdown for an entity.
-    
-    Args:
-        code: Entity code
-        
-    Returns:
-        Dictionary with fund balance details
-    """
-    query = f"""
-    SELECT 
+_FUND_BALANCE_COLUMNS = """
         Category,
         COALESCE(GN, 0) as GeneralFund,
         COALESCE(SR, 0) as SpecialRevenue,
@@ -279,40 +386,9 @@ def get_entity_fund_balances(code: str) -> Dict[str, Any]:
         COALESCE(TS, 0) as Trust,
         COALESCE(FD, 0) as Fiduciary,
         COALESCE(DP, 0) as DebtPrincipal
-    FROM `{TABLES['fund_balances']}`
-    WHERE Code = @code
-    ORDER BY Category
-    """
-    
-    client = get_bq_client()
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter("code", "STRING", code),
-        ]
-    )
-    
-    try:
-        results = list(client.query(query, job_config=job_config).result())
-        return {
-            "code": code,
-            "fund_balances": [dict(row.items()) for row in results]
-        }
-    except Exception as e:
-        return {"error": str(e)}
-
+"""
 
-def get_entity_debt(code: str) -> Dict[str, Any]:
-    """
-    Get debt information for an entity.
-    
-    Args:
-        code: Entity code
-        
-    Returns:
-        Dictionary with debt details by type
-    """
-    query = f"""
-    SELECT 
+_DEBT_COLUMNS = """
         -- GO Bonds
         COALESCE(a401, 0) + COALESCE(a400, 0) as GOBonds_Beginning,
         COALESCE(a407, 0) + COALESCE(a406, 0) as GOBonds_Additions,
@@ -341,48 +417,9 @@ def get_entity_debt(code: str) -> Dict[str, Any]:
         -- Totals
         COALESCE(t404, 0) as TotalDebt_Ending_LongTerm,
         COALESCE(t410, 0) as TotalDebt_Ending_ShortTerm
-        
-    FROM `{TABLES['indebtedness']}`
-    WHERE Code = @code
-    """
-    
-    client = get_bq_client()
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter("code", "STRING", code),
-        ]
-    )
-    
-    try:
-        results = list(client.query(query, job_config=job_config).result())
-        if results:
-            row = dict(results[0].items())
-            
-            total_debt = (row.get('TotalDebt_Ending_LongTerm', 0) or 0) + \
-                        (row.get('TotalDebt_Ending_ShortTerm', 0) or 0)
-            
-            return {
-                "code": code,
-                "total_debt": total_debt,
-                "details": row
-            }
-        return {"code": code, "total_debt": 0, "details": {}}
-    except Exception as e:
-        return {"error": str(e)}
-
+"""
 
-def get_entity_pensions(code: str) -> Dict[str, Any]:
-    """
-    Get pension information for an entity.
-    
-    Args:
-        code: Entity code
-        
-    Returns:
-        Dictionary with pension details by system
-    """
-    query = f"""
-    SELECT 
+_PENSION_COLUMNS = """
         -- IMRF (most recent year - _3 suffix)
         IMRF_t500_3 as IMRF_MeasurementDate,
         IMRF_t501_3 as IMRF_TotalLiability,
@@ -410,51 +447,342 @@ def get_entity_pensions(code: str) -> Dict[str, Any]:
         OPEB_t502_3 as OPEB_PlanAssets,
         OPEB_t503_3 as OPEB_NetPosition,
         OPEB_t504_3 as OPEB_FundedRatio
-        
-    FROM `{TABLES['pensions']}`
-    WHERE Code = @code
+"""
+
+
+def _revenue_result(code: str, revenues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Shape an entity's revenue rows, in Category order."""
+    return {
+        "code": code,
+        "total_revenue": sum(r['Total'] for r in revenues),
+        "by_category": revenues
+    }
+
+
+def _expenditure_result(code: str, expenditures: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Shape an entity's expenditure rows, in Category order."""
+    return {
+        "code": code,
+        "total_expenditure": sum(e['Total'] for e in expenditures),
+        "by_category": expenditures
+    }
+
+
+def _fund_balance_result(code: str, fund_balances: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Shape an entity's fund balance rows, in Category order.
+
+    The same row dicts are also keyed by category code (e.g. "307t") in
+    fund_balances_by_category for direct lookup.
     """
+    return {
+        "code": code,
+        "fund_balances": fund_balances,
+        "fund_balances_by_category": {fb["Category"]: fb for fb in fund_balances}
+    }
+
+
+def _debt_result(code: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Shape an entity's indebtedness row."""
+    if not rows:
+        return {"code": code, "total_debt": 0, "details": {}}
+    row = rows[0]
     
-    client = get_bq_client()
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter("code", "STRING", code),
-        ]
+    total_debt = row['TotalDebt_Ending_LongTerm'] + row['TotalDebt_Ending_ShortTerm']
+    
+    return {
+        "code": code,
+        "total_debt": total_debt,
+        "details": row
+    }
+
+
+def _pension_result(code: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Structure an entity's pension row by system."""
+    if not rows:
+        return {"code": code, "pension_systems": {}}
+    row = rows[0]
+    
+    pensions = {}
+    for system in ['IMRF', 'Police', 'Fire', 'OPEB']:
+        liability = row.get(f'{system}_TotalLiability') or 0
+        if liability > 0:
+            pensions[system] = {
+                "measurement_date": row.get(f'{system}_MeasurementDate'),
+                "total_liability": liability,
+                "plan_assets": row.get(f'{system}_PlanAssets') or 0,
+                "net_position": row.get(f'{system}_NetPosition') or 0,
+                "funded_ratio": row.get(f'{system}_FundedRatio') or 0
+            }
+    
+    return {
+        "code": code,
+        "pension_systems": pensions
+    }
+
+
+# Bundle section -> (table, columns, ORDER BY, result shaper)
+_BUNDLE_SECTIONS = {
+    "revenues": ('revenues', _CATEGORY_FUND_COLUMNS, "Category", _revenue_result),
+    "expenditures": ('expenditures', _CATEGORY_FUND_COLUMNS, "Category", _expenditure_result),
+    "fund_balances": ('fund_balances', _FUND_BALANCE_COLUMNS, "Category", _fund_balance_result),
+    "debt": ('indebtedness', _DEBT_COLUMNS, None, _debt_result),
+    "pensions": ('pensions', _PENSION_COLUMNS, None, _pension_result),
+}
+
+
+# Single-entity query per section. TABLES is fixed at import, so the SQL
+# is built once here rather than on every call.
+_SECTION_QUERIES = {
+    section: f"""
+    SELECT {columns}
+    FROM `{TABLES[table]}`
+    WHERE Code = @code
+    {f"ORDER BY {order_by}" if order_by else ""}
+    """
+    for section, (table, columns, order_by, _) in _BUNDLE_SECTIONS.items()
+}
+
+
+# Sections with one row per entity; their shapers only read rows[0]
+_SINGLE_ROW_SECTIONS = frozenset({"debt", "pensions"})
+
+
+def _query_entity_rows(section: str, code: str) -> List[Dict[str, Any]]:
+    """Run one section's query for a single entity. Raises on failure."""
+    job_config = _job_config([
+        bigquery.ScalarQueryParameter("code", "STRING", code),
+    ])
+    results = get_bq_client().query_and_wait(
+        _SECTION_QUERIES[section],
+        job_config=job_config,
+        max_results=1 if section in _SINGLE_ROW_SECTIONS else None,
     )
+    return _row_dicts(results)
+
+
+def get_entity_revenues(code: str) -> Dict[str, Any]:
+    """
+    Get revenue breakdown for an entity.
     
+    Args:
+        code: Entity code
+        
+    Returns:
+        Dictionary with revenue details by category and fund
+    """
     try:
-        results = list(client.query(query, job_config=job_config).result())
-        if results:
-            row = dict(results[0].items())
-            
-            # Structure the pension data
-            pensions = {}
-            for system in ['IMRF', 'Police', 'Fire', 'OPEB']:
-                liability = row.get(f'{system}_TotalLiability') or 0
-                if liability > 0:
-                    pensions[system] = {
-                        "measurement_date": row.get(f'{system}_MeasurementDate'),
-                        "total_liability": liability,
-                        "plan_assets": row.get(f'{system}_PlanAssets') or 0,
-                        "net_position": row.get(f'{system}_NetPosition') or 0,
-                        "funded_ratio": row.get(f'{system}_FundedRatio') or 0
-                    }
-            
-            return {
-                "code": code,
-                "pension_systems": pensions
-            }
-        return {"code": code, "pension_systems": {}}
+        return _revenue_result(code, _query_entity_rows("revenues", code))
     except Exception as e:
         return {"error": str(e)}
 
 
+def get_entity_expenditures(code: str) -> Dict[str, Any]:
+    """
+    Get expenditure breakdown for an entity.
+    
+    Args:
+        code: Entity code
+        
+    Returns:
+        Dictionary with expenditure details by category and fund
+    """
+    try:
+        return _expenditure_result(code, _query_entity_rows("expenditures", code))
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def get_entity_fund_balances(code: str) -> Dict[str, Any]:
+    """
+    Get fund balance breakdown for an entity.
+    
+    Args:
+        code: Entity code
+        
+    Returns:
+        Dictionary with fund balance details
+    """
+    try:
+        return _fund_balance_result(code, _query_entity_rows("fund_balances", code))
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def get_entity_debt(code: str) -> Dict[str, Any]:
+    """
+    Get debt information for an entity.
+    
+    Args:
+        code: Entity code
+        
+    Returns:
+        Dictionary with debt details by type
+    """
+    try:
+        return _debt_result(code, _query_entity_rows("debt", code))
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def get_entity_pensions(code: str) -> Dict[str, Any]:
+    """
+    Get pension information for an entity.
+    
+    Args:
+        code: Entity code
+        
+    Returns:
+        Dictionary with pension details by system
+    """
+    try:
+        return _pension_result(code, _query_entity_rows("pensions", code))
+    except Exception as e:
+        return {"error": str(e)}
+
+
+BUNDLE_SECTIONS = ("entity",) + tuple(_BUNDLE_SECTIONS)
+
+
+def get_entity_bundle(
+    codes: Sequence[str],
+    sections: Sequence[str] = BUNDLE_SECTIONS
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get several entities' details and financial data in one query.
+    
+    Each section's rows are selected as JSON tagged with the section name
+    and combined with UNION ALL, so the whole bundle is a single job:
+    one submission round-trip instead of one per table, and the number of
+    jobs doesn't grow with the number of codes or sections.
+    
+    Args:
+        codes: Entity codes
+        sections: Which of 'entity', 'revenues', 'expenditures',
+                  'fund_balances', 'debt' and 'pensions' to fetch
+        
+    Returns:
+        Dictionary keyed by code. Each value maps a section to the same
+        result get_entity_by_code / get_entity_revenues / ... would return
+        for that code; if the query fails, every section is {"error": ...}
+    """
+    codes = list(dict.fromkeys(codes))
+    bundle = {code: {} for code in codes}
+    
+    selects = []
+    params = {}
+    for section in sections:
+        if section == "entity":
+            missing = []
+            for code in codes:
+                entity = _snapshot_entity(code)
+                if entity is None:
+                    missing.append(code)
+                else:
+                    bundle[code]["entity"] = entity
+            if not missing:
+                continue
+            params["entity_codes"] = missing
+            rows_query = f"""
+                SELECT {ENTITY_DETAIL_COLUMNS}
+                FROM `{TABLES['unit_data']}` ud
+                LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
+                WHERE ud.Code IN UNNEST(@entity_codes)
+            """
+        else:
+            table, columns, _, _ = _BUNDLE_SECTIONS[section]
+            params["codes"] = codes
+            rows_query = f"""
+                SELECT Code, {columns}
+                FROM `{TABLES[table]}`
+                WHERE Code IN UNNEST(@codes)
+            """
+        selects.append(f"""
+        SELECT '{section}' as Section, t.Code, TO_JSON_STRING(t) as Payload
+        FROM ({rows_query}) t""")
+    
+    rows_by_section = {section: {code: [] for code in codes} for section in sections}
+    if selects:
+        query = "\n        UNION ALL".join(selects)
+        job_config = _job_config([
+            bigquery.ArrayQueryParameter(name, "STRING", values)
+            for name, values in params.items()
+        ])
+        try:
+            for row in get_bq_client().query_and_wait(query, job_config=job_config):
+                rows_by_section[row["Section"]][row["Code"]].append(json.loads(row["Payload"]))
+        except Exception as e:
+            for code in codes:
+                for section in sections:
+                    bundle[code].setdefault(section, {"error": str(e)})
+            return bundle
+    
+    for section, rows_by_code in rows_by_section.items():
+        for code, rows in rows_by_code.items():
+            if section == "entity":
+                # Codes served from the snapshot are already filled in
+                bundle[code].setdefault("entity", rows[0] if rows else None)
+                continue
+            _, _, order_by, shape = _BUNDLE_SECTIONS[section]
+            for row in rows:
+                del row["Code"]
+            if order_by:
+                rows.sort(key=lambda row: row[order_by])
+            bundle[code][section] = shape(code, rows)
+    
+    return bundle
+
+
+def get_comparison_data(codes: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    Get the comparison metrics for several entities in one query.
+    
+    Joins each entity's details with its revenue and expenditure totals,
+    which vw_EntityTotals keeps precomputed, so a comparison is one
+    round-trip reading one totals row per entity.
+    
+    Args:
+        codes: Entity codes
+        
+    Returns:
+        One row per entity found (Code, UnitName, EntityType, County,
+        Population, EquitalizedAssessedValue, TotalRevenue, TotalExpenditure),
+        with missing numbers as 0
+    """
+    query = f"""
+    SELECT 
+        ud.Code,
+        ud.UnitName,
+        ud.Description as EntityType,
+        ud.County,
+        COALESCE(us.Pop, 0) as Population,
+        COALESCE(us.EAV, 0) as EquitalizedAssessedValue,
+        COALESCE(t.TotalRevenue, 0) as TotalRevenue,
+        COALESCE(t.TotalExpenditure, 0) as TotalExpenditure
+    FROM `{TABLES['unit_data']}` ud
+    LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
+    LEFT JOIN `{TABLES['entity_totals']}` t ON ud.Code = t.Code
+    WHERE ud.Code IN UNNEST(@codes)
+    """
+    
+    client = get_bq_client()
+    job_config = _job_config([
+        bigquery.ArrayQueryParameter("codes", "STRING", list(codes)),
+    ])
+    
+    try:
+        results = client.query_and_wait(query, job_config=job_config)
+        return _row_dicts(results)
+    except Exception as e:
+        return [{"error": str(e)}]
+
+
 def get_entities_by_county(county: str, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Get all entities in a specific county.
     
     Args:
-        county: County name
+        county: County name as in the data (see normalize_county)
         entity_type: Optional filter by entity type (e.g., 'City', 'Village')
         
     Returns:
@@ -462,32 +790,33 @@ def get_entities_by_county(county: str, entity_type: Optional[str] = None) -> Li
     """
     type_filter = ""
     if entity_type:
-        type_filter = "AND LOWER(ud.Description) = LOWER(@entity_type)"
+        type_filter = "AND LOWER(EntityType) = LOWER(@entity_type)"
     
+    # Read the materialized entity summary rather than joining per call
     query = f"""
     SELECT 
-        ud.Code,
-        ud.UnitName,
-        ud.Description as EntityType,
-        us.Pop as Population,
-        us.EAV as EquitalizedAssessedValue
-    FROM `{TABLES['unit_data']}` ud
-    LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
-    WHERE LOWER(ud.County) = LOWER(@county)
+        Code,
+        UnitName,
+        EntityType,
+        Population,
+        EquitalizedAssessedValue
+    FROM `{TABLES['entity_summary']}`
+    WHERE CountyKey = @county
     {type_filter}
-    ORDER BY us.Pop DESC NULLS LAST
+    ORDER BY Population DESC NULLS LAST
     """
     
     client = get_bq_client()
-    params = [bigquery.ScalarQueryParameter("county", "STRING", county)]
+    # Match the lowercased cluster key so BigQuery prunes blocks
+    params = [bigquery.ScalarQueryParameter("county", "STRING", county.lower())]
     if entity_type:
-        params.append(bigquery.ScalarQueryParameter("entity_type", "STRING", entity_type))
+        params.append(bigquery.ScalarQueryParameter("entity_type", "STRING", entity_type.lower()))
     
-    job_config = bigquery.QueryJobConfig(query_parameters=params)
+    job_config = _job_config(params)
     
     try:
-        results = client.query(query, job_config=job_config).result()
-        return [dict(row.items()) for row in results]
+        results = client.query_and_wait(query, job_config=job_config)
+        return _row_dicts(results)
     except Exception as e:
         return [{"error": str(e)}]
 
@@ -496,7 +825,9 @@ def get_peer_entities(
     code: str, 
     population_range_pct: float = 0.25,
     same_type: bool = True,
-    limit: int = 10
+    limit: int = 10,
+    target_population: Optional[float] = None,
+    target_type: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """
     Get peer entities for comparison (similar size, same type).
@@ -506,57 +837,160 @@ def get_peer_entities(
         population_range_pct: Population range as percentage (0.25 = ±25%)
         same_type: Whether to filter to same entity type
         limit: Maximum number of peers to return
+        target_population: The entity's population, if the caller already
+                           has its details; saves looking it up in the query
+        target_type: The entity's type, alongside target_population
         
     Returns:
         List of peer entities
     """
-    type_filter = ""
-    if same_type:
-        type_filter = "AND ud.Description = target.Description"
+    peers = _snapshot_peers(code, population_range_pct, same_type, limit)
+    if peers is not None:
+        return peers
     
-    query = f"""
-    WITH target AS (
+    params = [
+        bigquery.ScalarQueryParameter("code", "STRING", code),
+        bigquery.ScalarQueryParameter("limit_rows", "INT64", int(limit)),
+    ]
+    
+    if target_population is not None:
+        # Bound the scan with the known population instead of joining a
+        # lookup of the target
+        type_filter = "AND ud.Description = @target_type" if same_type else ""
+        query = f"""
         SELECT 
             ud.Code,
-            ud.Description,
-            us.Pop as Population
+            ud.UnitName,
+            ud.Description as EntityType,
+            ud.County,
+            us.Pop as Population,
+            us.EAV as EquitalizedAssessedValue,
+            ABS(us.Pop - @target_pop) as PopulationDifference
+        FROM `{TABLES['unit_data']}` ud
+        JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
+        WHERE 
+            ud.Code != @code
+            AND us.Pop BETWEEN @pop_lo AND @pop_hi
+            {type_filter}
+        ORDER BY PopulationDifference
+        LIMIT @limit_rows
+        """
+        params += [
+            bigquery.ScalarQueryParameter("target_pop", "FLOAT64", target_population),
+            bigquery.ScalarQueryParameter("pop_lo", "FLOAT64", target_population * (1 - population_range_pct)),
+            bigquery.ScalarQueryParameter("pop_hi", "FLOAT64", target_population * (1 + population_range_pct)),
+        ]
+        if same_type:
+            params.append(bigquery.ScalarQueryParameter("target_type", "STRING", target_type))
+    else:
+        type_filter = "AND ud.Description = target.Description" if same_type else ""
+        query = f"""
+        WITH target AS (
+            SELECT 
+                ud.Code,
+                ud.Description,
+                us.Pop as Population
+            FROM `{TABLES['unit_data']}` ud
+            LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
+            WHERE ud.Code = @code
+        )
+        SELECT 
+            ud.Code,
+            ud.UnitName,
+            ud.Description as EntityType,
+            ud.County,
+            us.Pop as Population,
+            us.EAV as EquitalizedAssessedValue,
+            ABS(us.Pop - target.Population) as PopulationDifference
         FROM `{TABLES['unit_data']}` ud
         LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
-        WHERE ud.Code = @code
+        CROSS JOIN target
+        WHERE 
+            ud.Code != @code
+            AND us.Pop IS NOT NULL
+            AND us.Pop BETWEEN target.Population * (1 - @range_pct) AND target.Population * (1 + @range_pct)
+            {type_filter}
+        ORDER BY PopulationDifference
+        LIMIT @limit_rows
+        """
+        params.append(bigquery.ScalarQueryParameter("range_pct", "FLOAT64", population_range_pct))
+    
+    client = get_bq_client()
+    job_config = _job_config(params)
+    
+    try:
+        results = client.query_and_wait(query, job_config=job_config)
+        return _row_dicts(results)
+    except Exception as e:
+        return [{"error": str(e)}]
+
+
+def _snapshot_peers(
+    code: str,
+    population_range_pct: float,
+    same_type: bool,
+    limit: int
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    get_peer_entities from the entity snapshot, or None to ask BigQuery
+    (no snapshot, or the entity isn't in it).
+    """
+    if _snapshot_entity(code) is None:
+        return None
+    
+    type_filter = "AND e.EntityType = target.EntityType" if same_type else ""
+    query = f"""
+    WITH target AS (
+        SELECT EntityType, Population FROM entities WHERE Code = ?
     )
     SELECT 
-        ud.Code,
-        ud.UnitName,
-        ud.Description as EntityType,
-        ud.County,
-        us.Pop as Population,
-        us.EAV as EquitalizedAssessedValue,
-        ABS(us.Pop - target.Population) as PopulationDifference
-    FROM `{TABLES['unit_data']}` ud
-    LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
-    CROSS JOIN target
+        e.Code,
+        e.UnitName,
+        e.EntityType,
+        e.County,
+        e.Population,
+        e.EquitalizedAssessedValue,
+        ABS(e.Population - target.Population) as PopulationDifference
+    FROM entities e, target
     WHERE 
-        ud.Code != @code
-        AND us.Pop IS NOT NULL
-        AND us.Pop BETWEEN target.Population * (1 - @range_pct) AND target.Population * (1 + @range_pct)
+        e.Code != ?
+        AND e.Population IS NOT NULL
+        AND e.Population BETWEEN target.Population * (1 - ?) AND target.Population * (1 + ?)
         {type_filter}
     ORDER BY PopulationDifference
-    LIMIT {limit}
+    LIMIT ?
     """
+    params = (code, code, population_range_pct, population_range_pct, int(limit))
+    return _snapshot_query(query, params)
+
+
+@lru_cache(maxsize=None)
+def _rank_query(has_type: bool, has_county: bool, order_dir: str) -> str:
+    """
+    SQL for a vw_UnitMetrics ranking. Only the filters present and the
+    sort direction change the text, so each of the 8 shapes is built once.
+    """
+    # Filter on the lowercased cluster keys so BigQuery prunes blocks
+    filters = ["Metric = @metric"]
+    if has_type:
+        filters.append("EntityTypeKey = @entity_type")
+    if has_county:
+        filters.append("CountyKey = @county")
     
-    client = get_bq_client()
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter("code", "STRING", code),
-            bigquery.ScalarQueryParameter("range_pct", "FLOAT64", population_range_pct),
-        ]
-    )
-    
-    try:
-        results = client.query(query, job_config=job_config).result()
-        return [dict(row.items()) for row in results]
-    except Exception as e:
-        return [{"error": str(e)}]
+    # No RANK() window here: it would sort every matching row, while
+    # ORDER BY + LIMIT only keeps the top rows. _with_ranks numbers those.
+    return f"""
+    SELECT 
+        Code,
+        UnitName,
+        EntityType,
+        County,
+        Value as MetricValue
+    FROM `{TABLES['unit_metrics']}`
+    WHERE {" AND ".join(filters)}
+    ORDER BY Value {order_dir}
+    LIMIT @limit_rows
+    """
 
 
 def rank_entities_by_metric(
@@ -579,97 +1013,124 @@ def rank_entities_by_metric(
     Returns:
         Ranked list of entities
     """
-    # Build metric expression based on requested metric
+    # Metric expressions in the entity snapshot; vw_UnitMetrics holds the
+    # same values with one row per (entity, metric)
     metric_expressions = {
-        "population": "us.Pop",
-        "eav": "us.EAV",
-        "employees": "COALESCE(us.FULL_EMP, 0) + COALESCE(us.PART_EMP, 0)",
+        "population": "Population",
+        "eav": "EquitalizedAssessedValue",
+        "employees": "COALESCE(FullTimeEmployees, 0) + COALESCE(PartTimeEmployees, 0)",
     }
     
     if metric.lower() not in metric_expressions:
         return [{"error": f"Unknown metric: {metric}. Available: {list(metric_expressions.keys())}"}]
     
-    metric_expr = metric_expressions[metric.lower()]
+    order_dir = "DESC" if order.upper() == "DESC" else "ASC"
     
-    # Build filters
-    filters = ["1=1"]
-    params = []
+    ranked = _snapshot_rank(metric_expressions[metric.lower()], entity_type, county, order_dir, limit)
+    if ranked is not None:
+        return ranked
     
+    query = _rank_query(bool(entity_type), bool(county), order_dir)
+    params = [
+        bigquery.ScalarQueryParameter("metric", "STRING", metric.lower()),
+        bigquery.ScalarQueryParameter("limit_rows", "INT64", int(limit)),
+    ]
     if entity_type:
-        filters.append("LOWER(ud.Description) = LOWER(@entity_type)")
-        params.append(bigquery.ScalarQueryParameter("entity_type", "STRING", entity_type))
-    
+        params.append(bigquery.ScalarQueryParameter("entity_type", "STRING", entity_type.lower()))
     if county:
-        filters.append("LOWER(ud.County) = LOWER(@county)")
-        params.append(bigquery.ScalarQueryParameter("county", "STRING", county))
-    
-    where_clause = " AND ".join(filters)
-    order_dir = "DESC" if order.upper() == "DESC" else "ASC"
-    
-    query = f"""
-    SELECT 
-        ud.Code,
-        ud.UnitName,
-        ud.Description as EntityType,
-        ud.County,
-        {metric_expr} as MetricValue,
-        RANK() OVER (ORDER BY {metric_expr} {order_dir}) as Rank
-    FROM `{TABLES['unit_data']}` ud
-    LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
-    WHERE {where_clause}
-        AND {metric_expr} IS NOT NULL
-    ORDER BY {metric_expr} {order_dir}
-    LIMIT {limit}
-    """
+        params.append(bigquery.ScalarQueryParameter("county", "STRING", county.lower()))
     
     client = get_bq_client()
-    job_config = bigquery.QueryJobConfig(query_parameters=params)
+    job_config = _job_config(params)
     
     try:
-        results = client.query(query, job_config=job_config).result()
-        return [dict(row.items()) for row in results]
+        results = client.query_and_wait(query, job_config=job_config)
+        return _with_ranks(_row_dicts(results))
     except Exception as e:
         return [{"error": str(e)}]
 
 
+def _snapshot_rank(
+    metric_expr: str,
+    entity_type: Optional[str],
+    county: Optional[str],
+    order_dir: str,
+    limit: int
+) -> Optional[List[Dict[str, Any]]]:
+    """rank_entities_by_metric from the entity snapshot, or None without one."""
+    filters = [f"{metric_expr} IS NOT NULL"]
+    params = []
+    
+    if entity_type:
+        filters.append("EntityType = ? COLLATE NOCASE")
+        params.append(entity_type)
+    
+    if county:
+        filters.append("County = ? COLLATE NOCASE")
+        params.append(county)
+    
+    query = f"""
+    SELECT Code, UnitName, EntityType, County, {metric_expr} as MetricValue
+    FROM entities
+    WHERE {" AND ".join(filters)}
+    ORDER BY {metric_expr} {order_dir}
+    LIMIT ?
+    """
+    rows = _snapshot_query(query, (*params, int(limit)))
+    return _with_ranks(rows) if rows is not None else None
+
+
+def _with_ranks(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Number rows already sorted by MetricValue like SQL RANK(): ties share a
+    rank and the next rank skips past them. Every row ahead of a top-N row
+    is itself in the top N, so these match the ranks over all entities.
+    """
+    rank = 0
+    previous = object()
+    for position, row in enumerate(rows, start=1):
+        if row["MetricValue"] != previous:
+            rank = position
+            previous = row["MetricValue"]
+        row["Rank"] = rank
+    return rows
+
+
 def get_county_summary(county: str) -> Dict[str, Any]:
     """
     Get aggregated summary statistics for a county.
     
     Args:
-        county: County name
+        county: County name as in the data (see normalize_county)
         
     Returns:
         Dictionary with county-level aggregated statistics
     """
+    # One precomputed row per county in the materialized county summary
     query = f"""
     SELECT 
-        ud.County,
-        COUNT(DISTINCT ud.Code) as EntityCount,
-        COUNT(DISTINCT ud.Description) as EntityTypeCount,
-        SUM(us.Pop) as TotalPopulation,
-        SUM(us.EAV) as TotalEAV,
-        SUM(us.FULL_EMP) as TotalFullTimeEmployees,
-        SUM(us.PART_EMP) as TotalPartTimeEmployees,
-        COUNTIF(us.HomeRule = 'Y') as HomeRuleCount,
-        COUNTIF(us.Debt = 'Y') as EntitiesWithDebt
-    FROM `{TABLES['unit_data']}` ud
-    LEFT JOIN `{TABLES['unit_stats']}` us ON ud.Code = us.Code
-    WHERE LOWER(ud.County) = LOWER(@county)
-    GROUP BY ud.County
+        County,
+        EntityCount,
+        EntityTypeCount,
+        TotalPopulation,
+        TotalEAV,
+        TotalFullTimeEmployees,
+        TotalPartTimeEmployees,
+        HomeRuleCount,
+        EntitiesWithDebt
+    FROM `{TABLES['county_summary']}`
+    WHERE CountyKey = @county
     """
     
     client = get_bq_client()
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter("county", "STRING", county),
-        ]
-    )
+    job_config = _job_config([
+        bigquery.ScalarQueryParameter("county", "STRING", county.lower()),
+    ])
     
     try:
-        results = list(client.query(query, job_config=job_config).result())
-        if results:
-            return dict(results[0].items())
+        rows = _row_dicts(client.query_and_wait(query, job_config=job_config, max_results=1))
+        if rows:
+            return rows[0]
         return {"error": f"County '{county}' not found"}
     except Exception as e:
         return {"error": str(e)}
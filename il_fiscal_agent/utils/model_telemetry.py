@@ -0,0 +1,95 @@
+"""
+Per-call model telemetry for the agents
+
+Logs the size of each model request and the token usage and latency of
+its response, per agent, so instruction prompts can be trimmed on
+evidence. Values are also set as attributes on the current OpenTelemetry
+span, which ADK opens around every model call.
+
+Usage:
+    agent = Agent(
+        ...,
+        before_model_callback=record_model_request,
+        after_model_callback=log_model_response,
+    )
+"""
+from typing import Optional
+import logging
+import time
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from opentelemetry import trace
+
+logger = logging.getLogger(__name__)
+
+# Request start time, kept in invocation-scoped state per agent
+_STARTED_KEY = "temp:model_call_started:{}"
+
+
+def record_model_request(
+    callback_context: CallbackContext,
+    llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """
+    Before-model callback logging the request size.
+
+    Returns None so the request proceeds.
+    """
+    agent_name = callback_context.agent_name
+    config = llm_request.config
+    instruction = config.system_instruction if config else None
+    instruction_chars = len(instruction) if isinstance(instruction, str) else 0
+    tool_count = len(llm_request.tools_dict)
+    content_count = len(llm_request.contents)
+
+    callback_context.state[_STARTED_KEY.format(agent_name)] = time.perf_counter()
+
+    trace.get_current_span().set_attributes({
+        "fiscal_agent.agent": agent_name,
+        "fiscal_agent.instruction_chars": instruction_chars,
+        "fiscal_agent.tool_count": tool_count,
+        "fiscal_agent.content_count": content_count,
+    })
+    logger.debug(
+        "[model request] agent=%s instruction_chars=%d tools=%d contents=%d",
+        agent_name, instruction_chars, tool_count, content_count
+    )
+    return None
+
+
+def log_model_response(
+    callback_context: CallbackContext,
+    llm_response: LlmResponse
+) -> Optional[LlmResponse]:
+    """
+    After-model callback logging token usage, latency and tool calls.
+
+    Returns None so the response is passed on unchanged.
+    """
+    agent_name = callback_context.agent_name
+    started = callback_context.state.get(_STARTED_KEY.format(agent_name))
+    latency_ms = round((time.perf_counter() - started) * 1000, 1) if started else -1.0
+
+    usage = llm_response.usage_metadata
+    prompt_tokens = (usage.prompt_token_count or 0) if usage else 0
+    cached_tokens = (usage.cached_content_token_count or 0) if usage else 0
+    completion_tokens = (usage.candidates_token_count or 0) if usage else 0
+
+    parts = llm_response.content.parts if llm_response.content and llm_response.content.parts else []
+    tool_calls = [p.function_call.name for p in parts if p.function_call]
+
+    trace.get_current_span().set_attributes({
+        "fiscal_agent.latency_ms": latency_ms,
+        "fiscal_agent.prompt_tokens": prompt_tokens,
+        "fiscal_agent.cached_tokens": cached_tokens,
+        "fiscal_agent.completion_tokens": completion_tokens,
+        "fiscal_agent.tool_calls": tool_calls,
+    })
+    logger.info(
+        "[model response] agent=%s latency_ms=%.1f prompt_tokens=%d cached_tokens=%d "
+        "completion_tokens=%d tool_calls=%s",
+        agent_name, latency_ms, prompt_tokens, cached_tokens, completion_tokens, tool_calls
+    )
+    return None